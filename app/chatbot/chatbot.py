@@ -1,38 +1,146 @@
+from collections.abc import AsyncGenerator, Callable
+from dataclasses import dataclass
+from enum import Enum
+
+from semantic_kernel import Kernel
 from semantic_kernel.contents import (
     ChatHistory,
     ChatMessageContent,
+    FunctionCallContent,
+    FunctionResultContent,
 )
+from semantic_kernel.contents.utils.author_role import AuthorRole
 from semantic_kernel.agents import (
     ChatCompletionAgent,
-    ChatHistoryAgentThread,
     AgentResponseItem,
 )
 
-from app.chatbot.factory import create_support_ticket_agent
+from app.chatbot.factory import create_support_ticket_agent, create_support_ticket_kernel
+from app.chatbot.session_manager import DEFAULT_SESSION_ID, ChatSession, ChatSessionManager
+from app.chatbot.storage.backends import Storage, create_session_storage
+
+
+class ChatStreamEventType(str, Enum):
+    """Types of events emitted while streaming a chatbot response"""
+
+    TEXT = "text"
+    FUNCTION_CALL = "function_call"
+    FUNCTION_RESULT = "function_result"
+
+
+@dataclass
+class ChatStreamEvent:
+    """
+    A partial chatbot response.
+
+    For TEXT events `content` holds the newly generated text, for function events it holds the
+    fully qualified function name (e.g. TicketManagementPlugin-search_tickets).
+    `call_id` pairs the result of a function call with the call, as a function can be called
+    several times in a turn.
+    """
+
+    type: ChatStreamEventType
+    content: str
+    call_id: str | None = None
 
 
 class Chatbot:
-    """Chatbot is a wrapper around the ChatCompletionAgent to manage the conversation history."""
+    """Chatbot is a wrapper around the ChatCompletionAgent to manage the conversation history of each session."""
 
     # The agent that will be used to generate responses
     agent: ChatCompletionAgent
 
-    def __init__(self, agent: ChatCompletionAgent):
-        # Create a thread of the conversation
-        self.chat_thread = ChatHistoryAgentThread()
+    def __init__(
+        self,
+        agent: ChatCompletionAgent,
+        session_manager: ChatSessionManager | None = None,
+        session_storage_factory: Callable[[], Storage] | None = None,
+    ):
+        """
+        Args:
+            agent (ChatCompletionAgent): The agent generating the responses.
+            session_manager (ChatSessionManager|None): Keeps the conversation of each session.
+            session_storage_factory (Callable[[], Storage]|None): Creates the ticket and action item repositories
+                of a session, e.g. create_session_storage to keep the changes of each session private.
+                If None, all sessions share the plugins of the agent.
+        """
+        # Keep a separate conversation thread per user session
+        self.sessions = session_manager or ChatSessionManager()
+        self.session_storage_factory = session_storage_factory
 
         # Create the agent
         self.agent = agent
 
     @staticmethod
-    def create_support_ticket_chatbot() -> "Chatbot":
-        return Chatbot(create_support_ticket_agent(name="SupportTicketAgent"))
-
-    async def chat(self, message: str, history: ChatHistory | None = None):
-        # Get the response from the AI
-        response: AgentResponseItem[ChatMessageContent] = await self.agent.get_response(
-            messages=message, thread=self.chat_thread
+    def create_support_ticket_chatbot(
+        session_manager: ChatSessionManager | None = None,
+        isolate_sessions: bool = False,
+    ) -> "Chatbot":
+        return Chatbot(
+            create_support_ticket_agent(name="SupportTicketAgent"),
+            session_manager=session_manager,
+            session_storage_factory=create_session_storage if isolate_sessions else None,
         )
 
+    def _session_kernel(self, session: ChatSession) -> Kernel | None:
+        """Return the kernel with the plugins of a session, created on its first turn"""
+        if self.session_storage_factory is None:
+            return None
+        if session.kernel is None:
+            session.kernel = create_support_ticket_kernel(self.agent.kernel, self.session_storage_factory())
+        return session.kernel
+
+    async def chat(
+        self,
+        message: str,
+        history: ChatHistory | None = None,
+        session_id: str = DEFAULT_SESSION_ID,
+    ):
+        session = self.sessions.get_session(session_id)
+
+        # Only turns of the same session are serialized, other sessions are served in parallel
+        async with session.lock:
+            # Get the response from the AI
+            response: AgentResponseItem[ChatMessageContent] = await self.agent.get_response(
+                messages=message, thread=session.thread, kernel=self._session_kernel(session)
+            )
+
+            # Keep the history within its token budget before the next turn
+            await session.thread.reduce()
+
         return str(response)
 
+    async def chat_stream(
+        self,
+        message: str,
+        session_id: str = DEFAULT_SESSION_ID,
+    ) -> AsyncGenerator[ChatStreamEvent, None]:
+        """
+        Stream the response to a message as it is generated.
+        Args:
+            message (str): The user message.
+            session_id (str): The session the message belongs to.
+        Yields:
+            ChatStreamEvent: Text deltas and function call progress, in the order they happen.
+        """
+        session = self.sessions.get_session(session_id)
+
+        async with session.lock:
+            async for response in self.agent.invoke_stream(
+                messages=message, thread=session.thread, kernel=self._session_kernel(session)
+            ):
+                # Function calls and their results are streamed alongside the text of the response
+                for item in response.content.items:
+                    # Only the first chunk of a streamed function call carries its name
+                    if isinstance(item, FunctionCallContent) and item.name:
+                        yield ChatStreamEvent(ChatStreamEventType.FUNCTION_CALL, item.name, item.id)
+                    elif isinstance(item, FunctionResultContent):
+                        yield ChatStreamEvent(
+                            ChatStreamEventType.FUNCTION_RESULT, item.name or item.function_name, item.id
+                        )
+
+                if response.content.role != AuthorRole.TOOL and response.content.content:
+                    yield ChatStreamEvent(ChatStreamEventType.TEXT, response.content.content)
+
+            # Keep the history within its token budget before the next turn
+            await session.thread.reduce()
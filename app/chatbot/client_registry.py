@@ -0,0 +1,142 @@
+import hashlib
+import logging
+import os
+from dataclasses import dataclass
+
+import httpx
+from openai import AsyncAzureOpenAI
+from semantic_kernel.connectors.ai.open_ai.const import DEFAULT_AZURE_API_VERSION
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ConnectionPoolSettings:
+    """Limits of the HTTP connection pool shared by all Azure OpenAI clients"""
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry_seconds: float = 60.0
+    timeout_seconds: float = 120.0
+
+    @staticmethod
+    def from_env() -> "ConnectionPoolSettings":
+        """Read the pool settings from AZURE_OPENAI_* environment variables, falling back to the defaults"""
+        defaults = ConnectionPoolSettings()
+        return ConnectionPoolSettings(
+            max_connections=int(
+                os.getenv("AZURE_OPENAI_MAX_CONNECTIONS", defaults.max_connections)
+            ),
+            max_keepalive_connections=int(
+                os.getenv("AZURE_OPENAI_MAX_KEEPALIVE_CONNECTIONS", defaults.max_keepalive_connections)
+            ),
+            keepalive_expiry_seconds=float(
+                os.getenv("AZURE_OPENAI_KEEPALIVE_EXPIRY", defaults.keepalive_expiry_seconds)
+            ),
+            timeout_seconds=float(
+                os.getenv("AZURE_OPENAI_TIMEOUT", defaults.timeout_seconds)
+            ),
+        )
+
+
+class AzureOpenAIClientRegistry:
+    """
+    Process-wide registry of Azure OpenAI clients.
+
+    Clients are keyed by endpoint, deployment, API version and API key and all of them share a single
+    HTTP connection pool, so agents and simulator runs reuse open connections instead of paying
+    a new TLS handshake for every kernel.
+
+    The pooled connections belong to the event loop they were opened on; call `aclose` before
+    switching to a new event loop and at shutdown. Closing only drops the connections, the clients
+    stay usable, so kernels and agents holding them do not need to be rebuilt.
+    """
+
+    def __init__(self, pool_settings: ConnectionPoolSettings | None = None):
+        self.pool_settings = pool_settings or ConnectionPoolSettings.from_env()
+        self._transport: httpx.AsyncHTTPTransport | None = None
+        self._http_client: httpx.AsyncClient | None = None
+        self._clients: dict[tuple[str | None, str | None, str, str | None], AsyncAzureOpenAI] = {}
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """The shared HTTP client, created on first use"""
+        if self._http_client is None:
+            # The registry keeps the transport to close the pooled connections without closing the client
+            self._transport = httpx.AsyncHTTPTransport(
+                limits=httpx.Limits(
+                    max_connections=self.pool_settings.max_connections,
+                    max_keepalive_connections=self.pool_settings.max_keepalive_connections,
+                    keepalive_expiry=self.pool_settings.keepalive_expiry_seconds,
+                ),
+            )
+            self._http_client = httpx.AsyncClient(
+                transport=self._transport,
+                timeout=httpx.Timeout(self.pool_settings.timeout_seconds),
+            )
+        return self._http_client
+
+    def get_client(
+        self,
+        deployment_name: str | None,
+        endpoint: str | None,
+        api_key: str | None,
+        api_version: str | None = None,
+    ) -> AsyncAzureOpenAI:
+        """
+        Return the shared client for a deployment, creating it if needed.
+        Args:
+            deployment_name (str|None): The Azure OpenAI deployment name.
+            endpoint (str|None): The Azure OpenAI endpoint.
+            api_key (str|None): The Azure OpenAI API key.
+            api_version (str|None): The Azure OpenAI API version. If None, the Semantic Kernel default is used.
+        Returns:
+            AsyncAzureOpenAI: The shared client.
+        """
+        api_version = api_version or DEFAULT_AZURE_API_VERSION
+        # A hash of the API key, so that the key itself is not kept in the registry keys
+        api_key_hash = hashlib.sha256(api_key.encode()).hexdigest() if api_key else None
+        key = (endpoint, deployment_name, api_version, api_key_hash)
+
+        client = self._clients.get(key)
+        if client is None:
+            logger.info(f"Creating Azure OpenAI client for deployment: {deployment_name}")
+            client = AsyncAzureOpenAI(
+                azure_endpoint=endpoint,
+                azure_deployment=deployment_name,
+                api_key=api_key,
+                api_version=api_version,
+                http_client=self.http_client,
+            )
+            self._clients[key] = client
+
+        return client
+
+    async def aclose(self) -> None:
+        """Close the pooled connections, the clients open new connections on their next request"""
+        if self._transport is not None:
+            await self._transport.aclose()
+
+
+_client_registry: AzureOpenAIClientRegistry | None = None
+
+
+def get_client_registry() -> AzureOpenAIClientRegistry:
+    """
+    Return the registry shared by every kernel created in this process.
+    It is created on first use so that the pool settings can come from a .env file loaded at startup.
+    """
+    global _client_registry
+    if _client_registry is None:
+        _client_registry = AzureOpenAIClientRegistry()
+    return _client_registry
+
+
+async def close_client_registry() -> None:
+    """
+    Close the pooled connections of the shared registry, if it was used, e.g. at shutdown.
+    Call it on the event loop that made the requests. Clients already handed out, and the kernels
+    holding them, stay usable and open new connections on their next request.
+    """
+    if _client_registry is not None:
+        await _client_registry.aclose()
@@ -13,6 +13,7 @@ from app.chatbot.data_models.ticket_models import (
     TicketWorkflowType,
     ActionItemStatus,
 )
+from app.chatbot.data_models.ticket_store import TicketStore
 
 # Sample departments
 DEPARTMENTS = [
@@ -129,8 +130,8 @@ SAMPLE_TICKETS = [
     ),
 ]
 
-# Create a dictionary for easy lookup by ID
-TICKETS_BY_ID = {ticket.ticket_id: ticket for ticket in SAMPLE_TICKETS}
+# Create an indexed store for easy lookup by ID and full-text search
+TICKETS_BY_ID = TicketStore({ticket.ticket_id: ticket for ticket in SAMPLE_TICKETS})
 
 # Sample action items
 SAMPLE_ACTION_ITEMS = [
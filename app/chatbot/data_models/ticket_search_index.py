@@ -0,0 +1,127 @@
+import math
+import re
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Collection
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Split a text into lowercase alphanumeric tokens"""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+class TicketSearchIndex:
+    """
+    Token-level inverted index over the searchable text of support tickets, ranked with BM25.
+
+    Documents are added, replaced and removed incrementally, so the cost of keeping the index up
+    to date is proportional to the size of the changed ticket, not to the size of the store.
+    Query terms without an exact match are expanded to all indexed terms they are a prefix of
+    (e.g. "print" matches "printer").
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        # term -> {ticket_id: term frequency}
+        self._postings: dict[str, dict[str, int]] = {}
+        # ticket_id -> term frequencies of the indexed document, used to remove it again
+        self._documents: dict[str, Counter[str]] = {}
+        self._document_lengths: dict[str, int] = {}
+        self._total_length = 0
+        # Sorted vocabulary for prefix expansion, rebuilt lazily after the vocabulary changes
+        self._sorted_terms: list[str] | None = None
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def __contains__(self, ticket_id: object) -> bool:
+        return ticket_id in self._documents
+
+    def add(self, ticket_id: str, text: str) -> None:
+        """Index a document, replacing any previous version with the same id"""
+        if ticket_id in self._documents:
+            self.remove(ticket_id)
+
+        terms = Counter(tokenize(text))
+        for term, frequency in terms.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                self._sorted_terms = None
+            postings[ticket_id] = frequency
+
+        length = sum(terms.values())
+        self._documents[ticket_id] = terms
+        self._document_lengths[ticket_id] = length
+        self._total_length += length
+
+    def remove(self, ticket_id: str) -> None:
+        """Remove a document from the index, if present"""
+        terms = self._documents.pop(ticket_id, None)
+        if terms is None:
+            return
+
+        for term in terms:
+            postings = self._postings[term]
+            del postings[ticket_id]
+            if not postings:
+                del self._postings[term]
+                self._sorted_terms = None
+
+        self._total_length -= self._document_lengths.pop(ticket_id)
+
+    def search(
+        self,
+        query: str,
+        ticket_ids: Collection[str] | None = None,
+        limit: int | None = None,
+    ) -> list[tuple[str, float]]:
+        """
+        Find the documents matching any term of the query, best matches first.
+        Args:
+            query (str): The search query.
+            ticket_ids (Collection[str]|None): Restrict the results to these documents (a set or mapping keys
+                for constant time lookups). If None, all documents are searched.
+            limit (int|None): Maximum number of results. If None, all matches are returned.
+        Returns:
+            list[tuple[str, float]]: The matching ticket ids with their BM25 score.
+        """
+        document_count = len(self._documents)
+        if document_count == 0:
+            return []
+
+        average_length = self._total_length / document_count or 1.0
+        scores: dict[str, float] = {}
+
+        for term in self._expand(tokenize(query)):
+            postings = self._postings[term]
+            idf = math.log(1 + (document_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for ticket_id, frequency in postings.items():
+                if ticket_ids is not None and ticket_id not in ticket_ids:
+                    continue
+                length_norm = 1 - self.b + self.b * self._document_lengths[ticket_id] / average_length
+                score = idf * frequency * (self.k1 + 1) / (frequency + self.k1 * length_norm)
+                scores[ticket_id] = scores.get(ticket_id, 0.0) + score
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        return ranked if limit is None else ranked[:limit]
+
+    def _expand(self, query_terms: list[str]) -> set[str]:
+        """Map the query terms to indexed terms, using prefix matches for unknown terms"""
+        expanded: set[str] = set()
+        for term in query_terms:
+            if term in self._postings:
+                expanded.add(term)
+                continue
+
+            if self._sorted_terms is None:
+                self._sorted_terms = sorted(self._postings)
+            index = bisect_left(self._sorted_terms, term)
+            while index < len(self._sorted_terms) and self._sorted_terms[index].startswith(term):
+                expanded.add(self._sorted_terms[index])
+                index += 1
+
+        return expanded
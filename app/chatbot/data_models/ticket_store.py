@@ -0,0 +1,139 @@
+from collections.abc import Collection, Iterator, Mapping, MutableMapping
+from typing import TypeVar
+
+from app.chatbot.data_models.ticket_models import SupportTicket, TicketPriority
+from app.chatbot.data_models.ticket_search_index import TicketSearchIndex
+
+K = TypeVar("K")
+
+
+def searchable_text(ticket: SupportTicket) -> str:
+    """The ticket text covered by the full-text search"""
+    return f"{ticket.title} {ticket.description} {ticket.expected_outcome}"
+
+
+class TicketStore(MutableMapping[str, SupportTicket]):
+    """
+    Support tickets by ID, with a full-text search index and secondary indexes on department and
+    priority that are kept up to date on every write.
+
+    Tickets are mutable, so code that changes a stored ticket in place must call `reindex`.
+    """
+
+    def __init__(self, tickets: Mapping[str, SupportTicket] | None = None):
+        self._tickets: dict[str, SupportTicket] = {}
+        self._search_index = TicketSearchIndex()
+        # Secondary indexes from filter values to ticket ids. Dictionaries are used as ordered
+        # sets so that filtered results keep a stable order.
+        self._by_department: dict[str, dict[str, None]] = {}
+        self._by_priority: dict[TicketPriority, dict[str, None]] = {}
+        self._by_department_and_priority: dict[tuple[str, TicketPriority], dict[str, None]] = {}
+        # The filter values each ticket is indexed under, needed to unindex tickets changed in place
+        self._indexed_keys: dict[str, tuple[str, TicketPriority]] = {}
+        for ticket_id, ticket in (tickets or {}).items():
+            self[ticket_id] = ticket
+
+    def __getitem__(self, ticket_id: str) -> SupportTicket:
+        return self._tickets[ticket_id]
+
+    def __setitem__(self, ticket_id: str, ticket: SupportTicket) -> None:
+        self._tickets[ticket_id] = ticket
+        self._search_index.add(ticket_id, searchable_text(ticket))
+
+        keys = (ticket.department_code, ticket.priority)
+        previous_keys = self._indexed_keys.get(ticket_id)
+        if previous_keys != keys:
+            if previous_keys is not None:
+                self._unindex_keys(ticket_id, previous_keys)
+            department_code, priority = keys
+            self._by_department.setdefault(department_code, {})[ticket_id] = None
+            self._by_priority.setdefault(priority, {})[ticket_id] = None
+            self._by_department_and_priority.setdefault(keys, {})[ticket_id] = None
+            self._indexed_keys[ticket_id] = keys
+
+    def __delitem__(self, ticket_id: str) -> None:
+        del self._tickets[ticket_id]
+        self._search_index.remove(ticket_id)
+        self._unindex_keys(ticket_id, self._indexed_keys.pop(ticket_id))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._tickets)
+
+    def __len__(self) -> int:
+        return len(self._tickets)
+
+    def __contains__(self, ticket_id: object) -> bool:
+        return ticket_id in self._tickets
+
+    def reindex(self, ticket_id: str) -> None:
+        """Refresh the indexes of a ticket that was modified in place"""
+        self[ticket_id] = self._tickets[ticket_id]
+
+    def filter_ids(
+        self,
+        department_code: str | None = None,
+        priority: TicketPriority | None = None,
+    ) -> Collection[str] | None:
+        """
+        Look up the ids of the tickets matching all of the given filters in the secondary indexes.
+        Args:
+            department_code (str|None): Only include tickets of this department.
+            priority (TicketPriority|None): Only include tickets with this priority.
+        Returns:
+            Collection[str]|None: A read-only view of the matching ticket ids, or None if no filter was given.
+        """
+        if department_code and priority:
+            ids = self._by_department_and_priority.get((department_code, priority))
+        elif department_code:
+            ids = self._by_department.get(department_code)
+        elif priority:
+            ids = self._by_priority.get(priority)
+        else:
+            return None
+
+        return ids.keys() if ids is not None else ()
+
+    def search(
+        self,
+        query: str,
+        ticket_ids: Collection[str] | None = None,
+        limit: int | None = None,
+    ) -> list[SupportTicket]:
+        """
+        Full-text search over title, description and expected outcome, ranked by relevance (BM25).
+        Args:
+            query (str): The search query, tickets matching any of its terms are returned.
+            ticket_ids (Collection[str]|None): Restrict the search to these tickets, e.g. the result of
+                `filter_ids`. If None, all tickets are searched.
+            limit (int|None): Maximum number of tickets to return. If None, all matches are returned.
+        Returns:
+            list[SupportTicket]: The matching tickets, best match first.
+        """
+        return [self._tickets[ticket_id] for ticket_id in self.search_ids(query, ticket_ids, limit)]
+
+    def search_ids(
+        self,
+        query: str,
+        ticket_ids: Collection[str] | None = None,
+        limit: int | None = None,
+    ) -> list[str]:
+        """Same as `search`, but only returns the ids of the matching tickets"""
+        return [
+            ticket_id
+            for ticket_id, _ in self._search_index.search(query, ticket_ids=ticket_ids, limit=limit)
+        ]
+
+    def _unindex_keys(self, ticket_id: str, keys: tuple[str, TicketPriority]) -> None:
+        """Remove a ticket from the secondary indexes"""
+        department_code, priority = keys
+        _discard(self._by_department, department_code, ticket_id)
+        _discard(self._by_priority, priority, ticket_id)
+        _discard(self._by_department_and_priority, keys, ticket_id)
+
+
+def _discard(index: dict[K, dict[str, None]], key: K, ticket_id: str) -> None:
+    """Remove a ticket id from a secondary index bucket, dropping the bucket once it is empty"""
+    bucket = index[key]
+    del bucket[ticket_id]
+    if not bucket:
+        del index[key]
@@ -1,5 +1,7 @@
 import os
 from semantic_kernel import Kernel
+from semantic_kernel.functions import KernelFunctionFromMethod, KernelPlugin
+from semantic_kernel.connectors.ai.chat_completion_client_base import ChatCompletionClientBase
 from semantic_kernel.connectors.ai.open_ai import AzureChatCompletion
 from semantic_kernel.connectors.ai.function_choice_behavior import (
     FunctionChoiceBehavior,
@@ -10,16 +12,21 @@ from semantic_kernel.connectors.ai.open_ai.prompt_execution_settings.azure_chat_
 )
 from semantic_kernel.functions.kernel_arguments import KernelArguments
 from app.chatbot.root_path import chatbot_root_path
+from app.chatbot.client_registry import get_client_registry
+from app.chatbot.mock_chat_completion import create_mock_chat_completion
+from app.chatbot.response_cache import with_response_cache
+from app.chatbot.storage.backends import Storage
 
 
 def create_support_ticket_agent(
-    name: str, kernel: Kernel | None = None
+    name: str, kernel: Kernel | None = None, storage: Storage | None = None
 ) -> ChatCompletionAgent:
     """
     Create a support ticket management agent with the specified name and instructions.
     Args:
         name (str): The name of the agent.
         kernel (Kernel|None): The kernel instance to use. If None, a new kernel will be created.
+        storage (Storage|None): The repositories of the plugins. If None, the storage backend configured in the environment is used.
     Returns:
         ChatCompletionAgent: The created support ticket management agent.
     """
@@ -27,7 +34,7 @@ def create_support_ticket_agent(
     if kernel is None:
         kernel = create_kernel_with_chat_completion(service_id=name)
 
-    _load_support_ticket_plugins(kernel)
+    _load_support_ticket_plugins(kernel, storage)
 
     # Enable planning
     execution_settings = AzureChatPromptExecutionSettings()
@@ -47,9 +54,29 @@ def create_support_ticket_agent(
     return agent
 
 
+def create_support_ticket_kernel(kernel: Kernel, storage: Storage | None = None) -> Kernel:
+    """
+    Create a kernel sharing the chat completion services of another kernel, with its own plugin instances.
+    This is cheaper than creating a new kernel and lets agents reuse their services with per-conversation plugin state.
+    Args:
+        kernel (Kernel): The kernel whose services are shared.
+        storage (Storage|None): The repositories of the plugins. If None, the storage backend configured in the environment is used.
+    Returns:
+        Kernel: The created kernel instance.
+    """
+    support_ticket_kernel = Kernel(services=kernel.services)
+    _load_support_ticket_plugins(support_ticket_kernel, storage)
+    return support_ticket_kernel
+
+
 def create_kernel_with_chat_completion(service_id: str | None = None) -> Kernel:
     """
     Create a kernel with Azure OpenAI chat completion service.
+    The underlying Azure OpenAI client and its HTTP connection pool are shared by all kernels.
+
+    Setting CHAT_COMPLETION_SERVICE to "mock" replaces Azure OpenAI with a local service replaying
+    scripted responses (see create_mock_chat_completion), e.g. for offline simulations and load tests.
+    Setting CHAT_COMPLETION_CACHE_MODE records or replays responses (see with_response_cache).
     Args:
         service_id (str|None): The service ID for the Azure OpenAI service. If None, a default ID will be used.
     Returns:
@@ -57,27 +84,51 @@ def create_kernel_with_chat_completion(service_id: str | None = None) -> Kernel:
     """
     kernel = Kernel()
 
-    # Add Azure OpenAI chat completion
-    kernel.add_service(
-        AzureChatCompletion(
+    if os.getenv("CHAT_COMPLETION_SERVICE", "azure").lower() == "mock":
+        service: ChatCompletionClientBase = create_mock_chat_completion(service_id=service_id)
+    else:
+        deployment_name = os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME")
+        endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")
+
+        # Add Azure OpenAI chat completion
+        service = AzureChatCompletion(
             service_id=service_id,
-            deployment_name=os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME"),
-            api_key=os.getenv("AZURE_OPENAI_API_KEY"),
-            endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
+            deployment_name=deployment_name,
+            endpoint=endpoint,
+            async_client=get_client_registry().get_client(
+                deployment_name=deployment_name,
+                endpoint=endpoint,
+                api_key=os.getenv("AZURE_OPENAI_API_KEY"),
+                api_version=os.getenv("AZURE_OPENAI_API_VERSION"),
+            ),
         )
-    )
+
+    # Record or replay responses when a response cache is configured
+    kernel.add_service(with_response_cache(service))
     return kernel
 
+# Rendered instructions keyed by workflow definition path, along with the file modification time they were rendered from
+_instructions_cache: dict[str, tuple[int, str]] = {}
+
+# Plugins built from the first instance of each plugin class, reused as templates for the function metadata
+_plugin_templates: dict[tuple[type, str], KernelPlugin] = {}
+
+
 def _load_support_ticket_instructions() -> str:
     """
     Load the support ticket management instructions from a file.
+    The rendered instructions are cached until the workflow definition file changes.
     Returns:
         str: The loaded instructions.
     """
-    with open(
-        f"{chatbot_root_path()}/workflow-definitions/support-ticket-workflow.txt",
-        "r",
-    ) as file:
+    path = f"{chatbot_root_path()}/workflow-definitions/support-ticket-workflow.txt"
+    modified_at = os.stat(path).st_mtime_ns
+
+    cached = _instructions_cache.get(path)
+    if cached is not None and cached[0] == modified_at:
+        return cached[1]
+
+    with open(path, "r") as file:
         support_ticket_process_definition = file.read()
         instructions = f"""
             You are a Support Ticket Management assistant. You must only answer requests related to Support Tickets.
@@ -87,14 +138,54 @@ def _load_support_ticket_instructions() -> str:
             POLICY:
             {support_ticket_process_definition}
             """
-        return instructions
 
+    _instructions_cache[path] = (modified_at, instructions)
+    return instructions
+
+
+def _create_plugin(plugin_name: str, plugin_instance: object) -> KernelPlugin:
+    """
+    Create a kernel plugin for the given plugin instance.
+
+    Introspecting the @kernel_function signatures happens once per plugin class, subsequent plugins
+    reuse the cached function metadata and only bind the functions to the new instance.
+    Args:
+        plugin_name (str): The name of the plugin.
+        plugin_instance (object): The plugin instance holding the kernel functions.
+    Returns:
+        KernelPlugin: The plugin bound to the given instance.
+    """
+    key = (type(plugin_instance), plugin_name)
+    template = _plugin_templates.get(key)
+    if template is None:
+        template = KernelPlugin.from_object(plugin_name=plugin_name, plugin_instance=plugin_instance)
+        _plugin_templates[key] = template
+        return template
+
+    functions: dict[str, KernelFunctionFromMethod] = {}
+    for name, function in template.functions.items():
+        assert isinstance(function, KernelFunctionFromMethod)
+        functions[name] = function.model_copy(
+            update={
+                "method": getattr(plugin_instance, function.method.__name__),
+                "stream_method": getattr(plugin_instance, function.stream_method.__name__)
+                if function.stream_method is not None
+                else None,
+            }
+        )
+
+    # The template functions are already validated, skip the copy made by the KernelPlugin constructor
+    return KernelPlugin.model_construct(
+        name=template.name, description=template.description, functions=functions
+    )
 
-def _load_support_ticket_plugins(kernel: Kernel):
+
+def _load_support_ticket_plugins(kernel: Kernel, storage: Storage | None = None):
     """
     Load the support ticket management plugins based on the specified plugin type.
     Args:
         kernel (Kernel): The kernel instance to load the plugins into.
+        storage (Storage|None): The repositories of the plugins. If None, the storage backend configured in the environment is used.
     """
     from app.chatbot.plugins.common_plugin import CommonPlugin
     from app.chatbot.plugins.support_ticket_system.ticket_management_plugin import (
@@ -107,7 +198,11 @@ def _load_support_ticket_plugins(kernel: Kernel):
         ReferenceDataPlugin,
     )
 
-    kernel.add_plugin(CommonPlugin(), plugin_name="CommonPlugin")
-    kernel.add_plugin(TicketManagementPlugin(), plugin_name="TicketManagementPlugin")
-    kernel.add_plugin(ActionItemPlugin(), plugin_name="ActionItemPlugin")
-    kernel.add_plugin(ReferenceDataPlugin(), plugin_name="ReferenceDataPlugin")
+    kernel.add_plugin(_create_plugin("CommonPlugin", CommonPlugin()))
+    kernel.add_plugin(
+        _create_plugin("TicketManagementPlugin", TicketManagementPlugin(storage.tickets if storage else None))
+    )
+    kernel.add_plugin(
+        _create_plugin("ActionItemPlugin", ActionItemPlugin(storage.action_items if storage else None))
+    )
+    kernel.add_plugin(_create_plugin("ReferenceDataPlugin", ReferenceDataPlugin()))
@@ -0,0 +1,227 @@
+import logging
+import math
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Self
+
+from pydantic import Field, PrivateAttr
+from semantic_kernel.agents import ChatHistoryAgentThread
+from semantic_kernel.contents import (
+    ChatMessageContent,
+    FunctionCallContent,
+    FunctionResultContent,
+)
+from semantic_kernel.contents.history_reducer.chat_history_reducer import ChatHistoryReducer
+from semantic_kernel.contents.utils.author_role import AuthorRole
+
+logger = logging.getLogger(__name__)
+
+# Default prompt token budget for the conversation history (instructions are not part of the history)
+DEFAULT_HISTORY_TOKEN_BUDGET = 6000
+
+# Function results longer than this are collapsed into a summary once they are no longer recent
+DEFAULT_FUNCTION_RESULT_MAX_CHARS = 600
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate the number of tokens of a text (roughly 4 characters per token for English)"""
+    return math.ceil(len(text) / 4)
+
+
+@dataclass
+class TokenReduction:
+    """Outcome of a history reduction"""
+
+    tokens_before: int
+    tokens_after: int
+
+    @property
+    def saved_tokens(self) -> int:
+        return self.tokens_before - self.tokens_after
+
+
+class TokenBudgetHistoryReducer(ChatHistoryReducer):
+    """
+    A ChatHistory that keeps the conversation within a token budget.
+
+    The reduction happens in two steps:
+    1. Large function results from previous turns are collapsed into short summaries.
+    2. If the history is still over budget, the oldest turns are dropped.
+
+    System messages and the most recent turn (last user message onwards, including its tool calls
+    and results) are always kept intact.
+    """
+
+    target_count: int = Field(default=1, gt=0)
+    max_tokens: int = Field(default=DEFAULT_HISTORY_TOKEN_BUDGET, gt=0)
+    function_result_max_chars: int = Field(default=DEFAULT_FUNCTION_RESULT_MAX_CHARS, gt=0)
+    token_counter: Callable[[str], int] = Field(default=estimate_tokens, exclude=True)
+
+    _last_reduction: TokenReduction | None = PrivateAttr(default=None)
+
+    def __bool__(self) -> bool:
+        # ChatHistoryAgentThread replaces falsy (i.e. empty) histories with a plain ChatHistory
+        return True
+
+    @property
+    def last_reduction(self) -> TokenReduction | None:
+        """The outcome of the last call to reduce, None if the history was within budget"""
+        return self._last_reduction
+
+    def count_tokens(self, messages: list[ChatMessageContent] | None = None) -> int:
+        """Estimate the number of tokens sent to the model for the given (or all) messages"""
+        messages = self.messages if messages is None else messages
+        return sum(self._message_tokens(message) for message in messages)
+
+    async def reduce(self) -> Self | None:
+        tokens_before = self.count_tokens()
+        if tokens_before <= self.max_tokens:
+            self._last_reduction = None
+            return None
+
+        recent_start = self._last_user_message_index()
+
+        # Step 1: collapse bulky function results of previous turns
+        messages = [
+            self._collapse_function_results(message) if index < recent_start else message
+            for index, message in enumerate(self.messages)
+        ]
+
+        # Step 2: drop the oldest turns until the history fits the budget
+        if self.count_tokens(messages) > self.max_tokens:
+            messages = self._truncate(messages, recent_start)
+
+        self.messages = messages
+        self._last_reduction = TokenReduction(
+            tokens_before=tokens_before, tokens_after=self.count_tokens()
+        )
+        logger.info(
+            f"Reduced chat history from {tokens_before} to {self._last_reduction.tokens_after} tokens, "
+            f"saved {self._last_reduction.saved_tokens} tokens"
+        )
+        return self
+
+    def _truncate(self, messages: list[ChatMessageContent], recent_start: int) -> list[ChatMessageContent]:
+        """Drop the oldest turns without cutting into the most recent turn or removing system messages"""
+        # Tokens that are always kept: system messages and the most recent turn
+        kept_tokens = sum(
+            self._message_tokens(message)
+            for index, message in enumerate(messages)
+            if index >= recent_start or _is_system_message(message)
+        )
+
+        # Walk backwards and keep whole turns (user message plus its replies) while they fit the budget,
+        # so function calls are never separated from their results
+        cut_index = recent_start
+        turn_tokens = 0
+        for index in range(recent_start - 1, -1, -1):
+            message = messages[index]
+            if _is_system_message(message):
+                continue
+            turn_tokens += self._message_tokens(message)
+            if message.role == AuthorRole.USER:
+                if kept_tokens + turn_tokens > self.max_tokens:
+                    break
+                kept_tokens += turn_tokens
+                turn_tokens = 0
+                cut_index = index
+
+        return [
+            message
+            for index, message in enumerate(messages)
+            if index >= cut_index or _is_system_message(message)
+        ]
+
+    def _last_user_message_index(self) -> int:
+        for index in range(len(self.messages) - 1, -1, -1):
+            if self.messages[index].role == AuthorRole.USER:
+                return index
+        return len(self.messages)
+
+    def _collapse_function_results(self, message: ChatMessageContent) -> ChatMessageContent:
+        """Return a copy of the message with large function results replaced by summaries"""
+        if not any(
+            isinstance(item, FunctionResultContent)
+            and len(str(item.result)) > self.function_result_max_chars
+            for item in message.items
+        ):
+            return message
+
+        items = [
+            item.model_copy(
+                update={"result": summarize_function_result(item.result), "inner_content": None}
+            )
+            if isinstance(item, FunctionResultContent)
+            and len(str(item.result)) > self.function_result_max_chars
+            else item
+            for item in message.items
+        ]
+        return message.model_copy(update={"items": items})
+
+    def _message_tokens(self, message: ChatMessageContent) -> int:
+        tokens = 0
+        for item in message.items:
+            if isinstance(item, FunctionCallContent):
+                tokens += self.token_counter(f"{item.name} {item.arguments}")
+            elif isinstance(item, FunctionResultContent):
+                tokens += self.token_counter(str(item.result))
+            else:
+                tokens += self.token_counter(str(item))
+        return tokens
+
+
+def _is_system_message(message: ChatMessageContent) -> bool:
+    return message.role in (AuthorRole.SYSTEM, AuthorRole.DEVELOPER)
+
+
+def summarize_function_result(result: Any) -> Any:
+    """
+    Build a compact summary of a function result.
+
+    Plugin results are dictionaries, scalar fields are kept and lists of records are reduced to
+    their identifiers, e.g. {"count": 3, "tickets": ["TKT-1", "TKT-2", "TKT-3"]}.
+    """
+    if not isinstance(result, dict):
+        text = str(result)
+        return f"{text[:DEFAULT_FUNCTION_RESULT_MAX_CHARS // 2]}... [truncated {len(text)} characters]"
+
+    summary: dict[str, Any] = {}
+    for key, value in result.items():  # pyright: ignore[reportUnknownVariableType]
+        if isinstance(value, list):
+            summary[str(key)] = [_record_id(record) for record in value]  # pyright: ignore[reportUnknownVariableType]
+        elif isinstance(value, str) and len(value) > 80:
+            summary[str(key)] = f"{value[:80]}..."
+        else:
+            summary[str(key)] = value
+    summary["summarized"] = True
+    return summary
+
+
+def _record_id(record: object) -> object:
+    """Return the identifier of a record (e.g. ticket_id or action_id), or the record itself"""
+    if isinstance(record, dict):
+        for key, value in record.items():  # pyright: ignore[reportUnknownVariableType]
+            if str(key).endswith("_id") or key == "code":
+                return value  # pyright: ignore[reportUnknownVariableType]
+    return record
+
+
+def create_history_reducing_thread(
+    max_tokens: int = DEFAULT_HISTORY_TOKEN_BUDGET,
+    thread_id: str | None = None,
+    messages: list[ChatMessageContent] | None = None,
+) -> ChatHistoryAgentThread:
+    """
+    Create an agent thread whose history is kept within the given token budget.
+    Args:
+        max_tokens (int): The token budget of the conversation history.
+        thread_id (str|None): The ID of the thread. If None, a new ID will be generated.
+        messages (list[ChatMessageContent]|None): Messages the conversation starts with, e.g. a welcome message.
+    Returns:
+        ChatHistoryAgentThread: The created agent thread.
+    """
+    return ChatHistoryAgentThread(
+        # Copy the messages so that threads created from the same list do not share their history
+        chat_history=TokenBudgetHistoryReducer(max_tokens=max_tokens, messages=list(messages or [])),
+        thread_id=thread_id,
+    )
@@ -0,0 +1,331 @@
+import asyncio
+import json
+import logging
+import os
+from collections.abc import AsyncGenerator, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+
+from pydantic import PrivateAttr
+from semantic_kernel.connectors.ai.chat_completion_client_base import ChatCompletionClientBase
+from semantic_kernel.connectors.ai.completion_usage import CompletionUsage
+from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
+from semantic_kernel.contents import (
+    ChatHistory,
+    ChatMessageContent,
+    FunctionCallContent,
+    StreamingChatMessageContent,
+    StreamingTextContent,
+    TextContent,
+)
+from semantic_kernel.contents.utils.author_role import AuthorRole
+from semantic_kernel.contents.utils.finish_reason import FinishReason
+
+from app.chatbot.history_reducer import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+# Script key of the responses used by services without their own script
+DEFAULT_SCRIPT_KEY = "default"
+
+# Script positions of the services in the current conversation, by service instance
+_conversation_positions: ContextVar[dict[int, int] | None] = ContextVar("mock_conversation_positions", default=None)
+
+
+@contextmanager
+def mock_conversation() -> Iterator[None]:
+    """
+    Replay the scripts of the mock services from the start for the conversation run in this context.
+
+    The script position is kept per conversation instead of per service, so that concurrent
+    conversations sharing a service each get the whole script, whatever the order of their requests.
+    Conversations run in concurrent asyncio tasks are isolated, as each task has its own context.
+    """
+    token = _conversation_positions.set({})
+    try:
+        yield
+    finally:
+        _conversation_positions.reset(token)
+
+
+@dataclass(frozen=True)
+class MockFunctionCall:
+    """A scripted tool call, e.g. TicketManagementPlugin-search_tickets with its arguments"""
+
+    name: str
+    arguments: Mapping[str, Any] = field(default_factory=lambda: {})
+
+
+@dataclass(frozen=True)
+class MockResponse:
+    """
+    A scripted assistant response.
+
+    Token counts that are not scripted are estimated from the prompt and the response text.
+    """
+
+    content: str = ""
+    function_calls: tuple[MockFunctionCall, ...] = ()
+    prompt_tokens: int | None = None
+    completion_tokens: int | None = None
+
+    @staticmethod
+    def from_dict(data: Mapping[str, Any]) -> "MockResponse":
+        """
+        Read a response from a script entry.
+
+        Besides the script format ({"content", "function_calls": [{"name", "arguments"}], ...}) the
+        recorded message format of ChatMessageContent.to_dict is accepted (e.g. the chat_history of
+        a simulated conversation), so recorded conversations can be replayed as is.
+        Args:
+            data (Mapping[str, Any]): The script entry.
+        Returns:
+            MockResponse: The response.
+        """
+        function_calls = [
+            MockFunctionCall(name=call["name"], arguments=call.get("arguments") or {})
+            for call in data.get("function_calls", [])
+        ]
+        for tool_call in data.get("tool_calls", []):
+            arguments = tool_call["function"].get("arguments") or {}
+            function_calls.append(
+                MockFunctionCall(
+                    name=tool_call["function"]["name"],
+                    arguments=json.loads(arguments) if isinstance(arguments, str) else arguments,
+                )
+            )
+
+        return MockResponse(
+            content=data.get("content") or "",
+            function_calls=tuple(function_calls),
+            prompt_tokens=data.get("prompt_tokens"),
+            completion_tokens=data.get("completion_tokens"),
+        )
+
+    @staticmethod
+    def from_message(message: ChatMessageContent) -> "MockResponse":
+        """Record an assistant message, including its tool calls, as a response"""
+        return MockResponse(
+            content=message.content,
+            function_calls=tuple(
+                MockFunctionCall(name=item.name or "", arguments=item.to_kernel_arguments())
+                for item in message.items
+                if isinstance(item, FunctionCallContent)
+            ),
+        )
+
+
+def mock_responses_from_history(history: ChatHistory | Sequence[ChatMessageContent]) -> list[MockResponse]:
+    """
+    Record the assistant responses of a conversation, in order, to replay it later.
+    Args:
+        history (ChatHistory|Sequence[ChatMessageContent]): The recorded conversation.
+    Returns:
+        list[MockResponse]: The assistant responses.
+    """
+    messages = history.messages if isinstance(history, ChatHistory) else history
+    return [MockResponse.from_message(m) for m in messages if m.role == AuthorRole.ASSISTANT]
+
+
+# The script used when none is configured: every agent confirms and the termination judge ends the conversation
+DEFAULT_SCRIPT: dict[str, tuple[MockResponse, ...]] = {
+    "termination_service": (MockResponse(content="yes"),),
+    DEFAULT_SCRIPT_KEY: (MockResponse(content="Understood. The session is finished."),),
+}
+
+
+@lru_cache
+def load_mock_script(path: str) -> dict[str, tuple[MockResponse, ...]]:
+    """
+    Load the scripted responses of each service from a JSON file.
+
+    The file maps service ids (e.g. SupportTicketAgent, UserAgent, termination_service) or "default"
+    to the list of responses replayed, in order, by that service. Non-assistant entries of
+    recorded conversations are skipped. The script is loaded once per process.
+    Args:
+        path (str): The path to the script file.
+    Returns:
+        dict[str, tuple[MockResponse, ...]]: The responses by service id.
+    """
+    with open(path, encoding="utf-8") as f:
+        script: dict[str, list[dict[str, Any]]] = json.load(f)
+
+    return {
+        service_id: tuple(
+            MockResponse.from_dict(entry)
+            for entry in entries
+            if entry.get("role", AuthorRole.ASSISTANT.value) == AuthorRole.ASSISTANT.value
+        )
+        for service_id, entries in script.items()
+    }
+
+
+class MockChatCompletion(ChatCompletionClientBase):
+    """
+    A local chat completion service replaying scripted responses, including tool calls.
+
+    Responses are returned in order and replayed from the start once exhausted, so a service
+    behaves deterministically for a given script. Within mock_conversation, each conversation
+    replays the script from the start. Artificial latency (a fixed delay per request
+    plus a delay per completion token) stands in for the model, which makes the service usable
+    to benchmark and load test the chatbot and the simulator without a live endpoint.
+    """
+
+    SUPPORTS_FUNCTION_CALLING = True
+
+    responses: tuple[MockResponse, ...]
+    latency_seconds: float = 0.0
+    token_latency_seconds: float = 0.0
+
+    _next_response: int = PrivateAttr(default=0)
+
+    def __init__(
+        self,
+        responses: Sequence[MockResponse],
+        service_id: str | None = None,
+        latency_seconds: float = 0.0,
+        token_latency_seconds: float = 0.0,
+    ):
+        """
+        Args:
+            responses (Sequence[MockResponse]): The responses replayed by the service.
+            service_id (str|None): The service ID. If None, a default ID will be used.
+            latency_seconds (float): Delay of every request.
+            token_latency_seconds (float): Additional delay per completion token.
+        """
+        if not responses:
+            raise ValueError("A mock chat completion service needs at least one response")
+
+        super().__init__(
+            ai_model_id="mock",
+            service_id=service_id or "mock",
+            responses=tuple(responses),
+            latency_seconds=latency_seconds,
+            token_latency_seconds=token_latency_seconds,
+        )
+
+    def _next(self, chat_history: ChatHistory) -> tuple[MockResponse, CompletionUsage, int]:
+        """Return the next scripted response, its token usage and its position in the script"""
+        positions = _conversation_positions.get()
+        if positions is None:
+            position = self._next_response
+            self._next_response += 1
+        else:
+            position = positions.get(id(self), 0)
+            positions[id(self)] = position + 1
+        response = self.responses[position % len(self.responses)]
+
+        prompt_tokens = response.prompt_tokens
+        if prompt_tokens is None:
+            prompt_tokens = sum(estimate_tokens(str(message)) for message in chat_history.messages)
+        completion_tokens = response.completion_tokens
+        if completion_tokens is None:
+            completion_tokens = estimate_tokens(response.content) + sum(
+                estimate_tokens(json.dumps(call.arguments)) for call in response.function_calls
+            )
+
+        usage = CompletionUsage(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens)
+        return response, usage, position
+
+    def _function_call_items(self, response: MockResponse, position: int) -> list[FunctionCallContent]:
+        return [
+            FunctionCallContent(
+                id=f"call_{position + 1}_{index}",
+                index=index,
+                name=call.name,
+                arguments=json.dumps(call.arguments),
+                ai_model_id=self.ai_model_id,
+            )
+            for index, call in enumerate(response.function_calls)
+        ]
+
+    async def _inner_get_chat_message_contents(
+        self,
+        chat_history: ChatHistory,
+        settings: PromptExecutionSettings,
+    ) -> list[ChatMessageContent]:
+        response, usage, position = self._next(chat_history)
+        await asyncio.sleep(self.latency_seconds + usage.completion_tokens * self.token_latency_seconds)
+
+        items: list[Any] = self._function_call_items(response, position)
+        if response.content:
+            items.insert(0, TextContent(text=response.content, ai_model_id=self.ai_model_id))
+
+        return [
+            ChatMessageContent(
+                role=AuthorRole.ASSISTANT,
+                items=items,
+                ai_model_id=self.ai_model_id,
+                finish_reason=FinishReason.TOOL_CALLS if response.function_calls else FinishReason.STOP,
+                metadata={"usage": usage},
+            )
+        ]
+
+    async def _inner_get_streaming_chat_message_contents(
+        self,
+        chat_history: ChatHistory,
+        settings: PromptExecutionSettings,
+        function_invoke_attempt: int = 0,
+    ) -> AsyncGenerator[list[StreamingChatMessageContent], Any]:
+        response, usage, position = self._next(chat_history)
+        await asyncio.sleep(self.latency_seconds)
+
+        # Stream the text word by word, spreading the token latency over the chunks
+        words = response.content.split(" ") if response.content else []
+        for index, word in enumerate(words):
+            await asyncio.sleep(usage.completion_tokens * self.token_latency_seconds / len(words))
+            yield [
+                StreamingChatMessageContent(
+                    role=AuthorRole.ASSISTANT,
+                    choice_index=0,
+                    items=[
+                        StreamingTextContent(
+                            choice_index=0, text=word if index == 0 else f" {word}", ai_model_id=self.ai_model_id
+                        )
+                    ],
+                    ai_model_id=self.ai_model_id,
+                    function_invoke_attempt=function_invoke_attempt,
+                )
+            ]
+
+        yield [
+            StreamingChatMessageContent(
+                role=AuthorRole.ASSISTANT,
+                choice_index=0,
+                items=list(self._function_call_items(response, position)),
+                ai_model_id=self.ai_model_id,
+                finish_reason=FinishReason.TOOL_CALLS if response.function_calls else FinishReason.STOP,
+                metadata={"usage": usage},
+                function_invoke_attempt=function_invoke_attempt,
+            )
+        ]
+
+
+def create_mock_chat_completion(service_id: str | None = None) -> MockChatCompletion:
+    """
+    Create a mock chat completion service configured from the environment:
+    - MOCK_CHAT_COMPLETION_SCRIPT: the JSON script of responses by service id (default: DEFAULT_SCRIPT)
+    - MOCK_CHAT_COMPLETION_LATENCY: the delay of every request in seconds (default: 0)
+    - MOCK_CHAT_COMPLETION_TOKEN_LATENCY: the additional delay per completion token in seconds (default: 0)
+    Args:
+        service_id (str|None): The service ID, used to pick the scripted responses of the service.
+    Returns:
+        MockChatCompletion: The mock service.
+    """
+    script_path = os.getenv("MOCK_CHAT_COMPLETION_SCRIPT")
+    script = load_mock_script(script_path) if script_path else DEFAULT_SCRIPT
+
+    responses = script.get(service_id or DEFAULT_SCRIPT_KEY) or script.get(DEFAULT_SCRIPT_KEY)
+    if not responses:
+        raise ValueError(f"The mock chat completion script has no responses for service: {service_id}")
+
+    logger.info(f"Creating mock chat completion service: {service_id}")
+    return MockChatCompletion(
+        responses=responses,
+        service_id=service_id,
+        latency_seconds=float(os.getenv("MOCK_CHAT_COMPLETION_LATENCY", 0)),
+        token_latency_seconds=float(os.getenv("MOCK_CHAT_COMPLETION_TOKEN_LATENCY", 0)),
+    )
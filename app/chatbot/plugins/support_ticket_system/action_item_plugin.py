@@ -6,26 +6,49 @@ from typing import Annotated, Any
 from semantic_kernel.functions import kernel_function
 
 from app.chatbot.data_models.ticket_models import ActionItem, ActionItemStatus
-from app.chatbot.data_models.sample_data.sample_tickets import (
-    ACTION_ITEMS_BY_ID,
-    TICKET_TO_ACTIONS,
+from app.chatbot.plugins.support_ticket_system.pagination import (
+    DEFAULT_PAGE_SIZE,
+    next_page_cursor,
+    page_bounds,
+    project,
+    validate_fields,
+)
+from app.chatbot.storage.backends import get_storage
+from app.chatbot.storage.repository import ActionItemRepository
+
+# Fields of the action item dictionaries returned to the model, available for projection
+ACTION_ITEM_FIELDS = (
+    "action_id",
+    "parent_ticket_id",
+    "title",
+    "assignee",
+    "status",
+    "created_at",
+    "updated_at",
+    "due_date",
 )
 
 
 class ActionItemPlugin:
     """Action item management functions for the support ticket system"""
 
-    def __init__(self):
-        """Initialize with mock storage for action items"""
-        self._action_items: dict[str, ActionItem] = ACTION_ITEMS_BY_ID
-        self._ticket_to_actions: dict[str, list[str]] = TICKET_TO_ACTIONS
+    def __init__(self, repository: ActionItemRepository | None = None):
+        """
+        Initialize with an action item repository.
+        Args:
+            repository (ActionItemRepository|None): Where action items are stored. If None, the storage
+                backend configured in the environment is used.
+        """
+        self._action_items: ActionItemRepository = (
+            repository if repository is not None else get_storage().action_items
+        )
         logging.info("Action Item Plugin initialized")
 
     @kernel_function(
         name="create_action_item",
         description="Creates a new action item associated with a support ticket.",
     )
-    def create_action_item(
+    async def create_action_item(
         self,
         parent_ticket_id: Annotated[
             str, "The ID of the support ticket this action item belongs to."
@@ -62,14 +85,8 @@ class ActionItemPlugin:
                 status=ActionItemStatus.OPEN,
             )
 
-            # Store the action item
-            self._action_items[action_id] = action_item
-
-            # Update the ticket-to-actions mapping
-            if parent_ticket_id not in self._ticket_to_actions:
-                self._ticket_to_actions[parent_ticket_id] = []
-
-            self._ticket_to_actions[parent_ticket_id].append(action_id)
+            # Store the action item, the repository indexes it by its parent ticket
+            await self._action_items.aset(action_id, action_item)
 
             return {
                 "action_id": action_id,
@@ -84,7 +101,7 @@ class ActionItemPlugin:
         name="get_action_item",
         description="Retrieves an action item by its ID.",
     )
-    def get_action_item(
+    async def get_action_item(
         self,
         action_id: Annotated[
             str, "The unique identifier of the action item to retrieve."
@@ -92,8 +109,8 @@ class ActionItemPlugin:
     ) -> dict[str, Any]:
         logging.info(f"Retrieving action item: {action_id}")
 
-        if action_id in self._action_items:
-            action_item = self._action_items[action_id]
+        action_item = await self._action_items.aget(action_id)
+        if action_item is not None:
             return self._action_item_to_dict(action_item)
         else:
             return {"error": f"No action item found with ID: {action_id}"}
@@ -102,7 +119,7 @@ class ActionItemPlugin:
         name="update_action_item_status",
         description="Updates the status of an existing action item.",
     )
-    def update_action_item_status(
+    async def update_action_item_status(
         self,
         action_id: Annotated[
             str, "The unique identifier of the action item to update."
@@ -114,11 +131,10 @@ class ActionItemPlugin:
     ) -> dict[str, Any]:
         logging.info(f"Updating status for action item: {action_id}")
 
-        if action_id not in self._action_items:
+        action_item = await self._action_items.aget(action_id)
+        if action_item is None:
             return {"error": f"No action item found with ID: {action_id}"}
 
-        action_item = self._action_items[action_id]
-
         try:
             # Update the status
             action_item.status = ActionItemStatus(status)
@@ -126,6 +142,9 @@ class ActionItemPlugin:
             # Update the timestamp
             action_item.updated_at = datetime.now()
 
+            # Write the action item back so that it is persisted
+            await self._action_items.aset(action_id, action_item)
+
             return {
                 "action_id": action_id,
                 "status": "updated",
@@ -139,7 +158,7 @@ class ActionItemPlugin:
         name="update_action_item",
         description="Updates an existing action item.",
     )
-    def update_action_item(
+    async def update_action_item(
         self,
         action_id: Annotated[
             str, "The unique identifier of the action item to update."
@@ -156,57 +175,82 @@ class ActionItemPlugin:
     ) -> dict[str, Any]:
         logging.info(f"Updating action item: {action_id}")
 
-        if action_id not in self._action_items:
+        action_item = await self._action_items.aget(action_id)
+        if action_item is None:
             return {"error": f"No action item found with ID: {action_id}"}
 
-        action_item = self._action_items[action_id]
-
+        # Validate before changing any field, the in-memory backend returns the stored action item
         try:
-            # Update fields if provided
-            if title is not None:
-                action_item.title = title
+            due_date_value = datetime.fromisoformat(due_date) if due_date is not None else None
+            status_enum = ActionItemStatus(status) if status is not None else None
+        except ValueError as e:
+            return {"error": f"Failed to update action item: {str(e)}"}
 
-            if assignee is not None:
-                action_item.assignee = assignee
+        # Update fields if provided
+        if title is not None:
+            action_item.title = title
 
-            if due_date is not None:
-                action_item.due_date = datetime.fromisoformat(due_date)
+        if assignee is not None:
+            action_item.assignee = assignee
 
-            if status is not None:
-                action_item.status = ActionItemStatus(status)
+        if due_date_value is not None:
+            action_item.due_date = due_date_value
 
-            # Update the timestamp
-            action_item.updated_at = datetime.now()
+        if status_enum is not None:
+            action_item.status = status_enum
 
-            return {
-                "action_id": action_id,
-                "status": "updated",
-                "updated_at": action_item.updated_at.isoformat(),
-            }
-        except ValueError as e:
-            return {"error": f"Failed to update action item: {str(e)}"}
+        # Update the timestamp
+        action_item.updated_at = datetime.now()
+
+        # Write the action item back so that it is persisted
+        await self._action_items.aset(action_id, action_item)
+
+        return {
+            "action_id": action_id,
+            "status": "updated",
+            "updated_at": action_item.updated_at.isoformat(),
+        }
 
     @kernel_function(
         name="get_ticket_action_items",
-        description="Retrieves all action items for a specific ticket.",
+        description="Retrieves the action items for a specific ticket. Results are paginated, "
+        "request the next page with the returned next_cursor only if more action items are needed.",
     )
-    def get_ticket_action_items(
+    async def get_ticket_action_items(
         self,
         ticket_id: Annotated[str, "The ID of the ticket to get action items for."],
+        page_size: Annotated[
+            int | None, f"Number of action items per page. Defaults to {DEFAULT_PAGE_SIZE}."
+        ] = None,
+        cursor: Annotated[
+            str | None, "The next_cursor of the previous page, to continue listing action items."
+        ] = None,
+        fields: Annotated[
+            list[str] | None,
+            f"Action item fields to return, e.g. ['title', 'status']. Must be from {list(ACTION_ITEM_FIELDS)}. "
+            "The action_id is always returned. Defaults to all fields.",
+        ] = None,
     ) -> dict[str, Any]:
         logging.info(f"Retrieving action items for ticket: {ticket_id}")
 
-        if ticket_id not in self._ticket_to_actions:
-            return {"count": 0, "action_items": []}
+        try:
+            validate_fields(fields, ACTION_ITEM_FIELDS)
+            offset, limit = page_bounds(cursor, page_size)
+        except ValueError as e:
+            return {"error": str(e)}
 
-        action_ids = self._ticket_to_actions[ticket_id]
-        action_items = [
-            self._action_items[aid] for aid in action_ids if aid in self._action_items
-        ]
+        action_items, total_count = await self._action_items.alist_for_ticket(
+            ticket_id, offset=offset, limit=limit
+        )
 
         return {
             "count": len(action_items),
-            "action_items": [self._action_item_to_dict(item) for item in action_items],
+            "total_count": total_count,
+            "next_cursor": next_page_cursor(offset, len(action_items), total_count),
+            "action_items": [
+                project(self._action_item_to_dict(item), fields, key_field="action_id")
+                for item in action_items
+            ],
         }
 
     def _action_item_to_dict(self, action_item: ActionItem) -> dict[str, Any]:
@@ -0,0 +1,97 @@
+import base64
+import binascii
+from collections.abc import Collection, Iterable
+from typing import Any
+
+# Results returned per page when the model does not ask for a page size
+DEFAULT_PAGE_SIZE = 20
+# Upper bound for the page size, keeps a single function result small in the model context
+MAX_PAGE_SIZE = 100
+
+_CURSOR_PREFIX = "offset:"
+
+
+def encode_cursor(offset: int) -> str:
+    """Encode a result offset as an opaque cursor"""
+    return base64.urlsafe_b64encode(f"{_CURSOR_PREFIX}{offset}".encode()).decode()
+
+
+def decode_cursor(cursor: str | None) -> int:
+    """
+    Decode a cursor created by `encode_cursor`.
+    Args:
+        cursor (str|None): The cursor, None for the first page.
+    Returns:
+        int: The offset of the first result of the page.
+    Raises:
+        ValueError: If the cursor is not valid.
+    """
+    if not cursor:
+        return 0
+
+    try:
+        decoded = base64.urlsafe_b64decode(cursor.encode()).decode()
+    except (binascii.Error, UnicodeDecodeError):
+        raise ValueError(f"Invalid cursor: {cursor}")
+
+    offset = decoded.removeprefix(_CURSOR_PREFIX)
+    if offset == decoded or not offset.isdigit():
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return int(offset)
+
+
+def page_bounds(cursor: str | None = None, page_size: int | None = None) -> tuple[int, int]:
+    """
+    Resolve a page request to an offset and a limit.
+    Args:
+        cursor (str|None): The cursor returned with the previous page, None for the first page.
+        page_size (int|None): Number of results per page, capped at MAX_PAGE_SIZE. If None, DEFAULT_PAGE_SIZE is used.
+    Returns:
+        tuple[int, int]: The offset of the first result and the maximum number of results of the page.
+    Raises:
+        ValueError: If the cursor or the page size is not valid.
+    """
+    offset = decode_cursor(cursor)
+    page_size = DEFAULT_PAGE_SIZE if page_size is None else page_size
+    if page_size <= 0:
+        raise ValueError(f"Invalid page size: {page_size}")
+    return offset, min(page_size, MAX_PAGE_SIZE)
+
+
+def next_page_cursor(offset: int, page_count: int, total_count: int) -> str | None:
+    """The cursor of the page following a page of `page_count` results at `offset`, None on the last page"""
+    end = offset + page_count
+    return encode_cursor(end) if page_count and end < total_count else None
+
+
+def validate_fields(fields: Iterable[str] | None, available_fields: Collection[str]) -> None:
+    """
+    Check that a field projection only names available fields.
+    Raises:
+        ValueError: If a field is not available.
+    """
+    unknown = [field for field in fields or [] if field not in available_fields]
+    if unknown:
+        raise ValueError(
+            f"Unknown fields: {', '.join(unknown)}. Available fields: {', '.join(available_fields)}"
+        )
+
+
+def project(record: dict[str, Any], fields: Iterable[str] | None, key_field: str) -> dict[str, Any]:
+    """
+    Keep only the requested fields of a record.
+    Args:
+        record (dict[str, Any]): The full record.
+        fields (Iterable[str]|None): The fields to keep. If None or empty, the full record is returned.
+        key_field (str): The identifier field, always kept so the record can be looked up later.
+    Returns:
+        dict[str, Any]: The projected record.
+    """
+    if not fields:
+        return record
+
+    projected = {key_field: record[key_field]}
+    for field in fields:
+        if field in record:
+            projected[field] = record[field]
+    return projected
@@ -54,7 +54,7 @@ class ReferenceDataPlugin:
         name="get_departments",
         description="Get a list of available departments that can handle support tickets",
     )
-    def get_departments(self) -> dict[str, Any]:
+    async def get_departments(self) -> dict[str, Any]:
         """Returns all available departments in the system"""
         logging.info("Retrieving department list")
 
@@ -70,7 +70,7 @@ class ReferenceDataPlugin:
         name="get_department_by_code",
         description="Get detailed information about a specific department",
     )
-    def get_department_by_code(
+    async def get_department_by_code(
         self,
         department_code: Annotated[str, "Department code to look up"],
     ) -> dict[str, Any]:
@@ -91,7 +91,7 @@ class ReferenceDataPlugin:
         name="get_priority_levels",
         description="Get a list of all available priority levels for tickets",
     )
-    def get_priority_levels(self) -> dict[str, Any]:
+    async def get_priority_levels(self) -> dict[str, Any]:
         """Returns all available priority levels for tickets"""
         logging.info("Retrieving priority levels")
 
@@ -120,7 +120,7 @@ class ReferenceDataPlugin:
         name="get_workflow_types",
         description="Get a list of all available workflow types for tickets",
     )
-    def get_workflow_types(self) -> dict[str, Any]:
+    async def get_workflow_types(self) -> dict[str, Any]:
         """Returns all available workflow types for tickets"""
         logging.info("Retrieving workflow types")
 
@@ -141,7 +141,7 @@ class ReferenceDataPlugin:
         name="get_action_item_statuses",
         description="Get a list of all possible action item statuses",
     )
-    def get_action_item_statuses(self) -> dict[str, Any]:
+    async def get_action_item_statuses(self) -> dict[str, Any]:
         """Returns all possible statuses for action items"""
         logging.info("Retrieving action item statuses")
 
@@ -10,22 +10,50 @@ from app.chatbot.data_models.ticket_models import (
     TicketPriority,
     TicketWorkflowType,
 )
-from app.chatbot.data_models.sample_data.sample_tickets import TICKETS_BY_ID
+from app.chatbot.plugins.support_ticket_system.pagination import (
+    DEFAULT_PAGE_SIZE,
+    next_page_cursor,
+    page_bounds,
+    project,
+    validate_fields,
+)
+from app.chatbot.storage.backends import get_storage
+from app.chatbot.storage.repository import TicketRepository
+
+# Fields of the ticket dictionaries returned to the model, available for projection
+TICKET_FIELDS = (
+    "ticket_id",
+    "title",
+    "department",
+    "priority",
+    "workflow_type",
+    "description",
+    "expected_outcome",
+    "resolution",
+    "customer_visible",
+    "created_at",
+    "updated_at",
+)
 
 
 class TicketManagementPlugin:
     """Support ticket management functions"""
 
-    def __init__(self):
-        """Initialize with mock storage for tickets"""
-        self._tickets: dict[str, SupportTicket] = TICKETS_BY_ID
+    def __init__(self, repository: TicketRepository | None = None):
+        """
+        Initialize with a ticket repository.
+        Args:
+            repository (TicketRepository|None): Where tickets are stored. If None, the storage backend
+                configured in the environment is used.
+        """
+        self._tickets: TicketRepository = repository if repository is not None else get_storage().tickets
         logging.info("Ticket Management Plugin initialized")
 
     @kernel_function(
         name="create_support_ticket",
         description="Creates a new support ticket in the system.",
     )
-    def create_support_ticket(
+    async def create_support_ticket(
         self,
         title: Annotated[
             str, "Title of the support ticket. Should be concise and descriptive."
@@ -69,7 +97,7 @@ class TicketManagementPlugin:
             )
 
             # Store the ticket
-            self._tickets[ticket_id] = ticket
+            await self._tickets.aset(ticket_id, ticket)
 
             return {
                 "ticket_id": ticket_id,
@@ -84,14 +112,14 @@ class TicketManagementPlugin:
         name="get_support_ticket",
         description="Retrieves a support ticket by its ID.",
     )
-    def get_support_ticket(
+    async def get_support_ticket(
         self,
         ticket_id: Annotated[str, "The unique identifier of the ticket to retrieve."],
     ) -> dict[str, Any]:
         logging.info(f"Retrieving ticket: {ticket_id}")
 
-        if ticket_id in self._tickets:
-            ticket = self._tickets[ticket_id]
+        ticket = await self._tickets.aget(ticket_id)
+        if ticket is not None:
             return self._ticket_to_dict(ticket)
         else:
             return {"error": f"No ticket found with ID: {ticket_id}"}
@@ -100,7 +128,7 @@ class TicketManagementPlugin:
         name="update_support_ticket",
         description="Updates an existing support ticket in the system.",
     )
-    def update_support_ticket(
+    async def update_support_ticket(
         self,
         ticket_id: Annotated[str, "The unique identifier of the ticket to update."],
         title: Annotated[str | None, "Updated title for the support ticket."] = None,
@@ -121,20 +149,24 @@ class TicketManagementPlugin:
     ) -> dict[str, Any]:
         logging.info(f"Updating ticket: {ticket_id}")
 
-        if ticket_id not in self._tickets:
+        ticket = await self._tickets.aget(ticket_id)
+        if ticket is None:
             return {"error": f"No ticket found with ID: {ticket_id}"}
 
-        ticket = self._tickets[ticket_id]
+        # Validate before changing any field, the in-memory backend returns the stored ticket
+        priority_enum = None
+        if priority is not None:
+            try:
+                priority_enum = TicketPriority(priority)
+            except ValueError:
+                return {"error": f"Invalid priority value: {priority}"}
 
         # Update fields if provided
         if title is not None:
             ticket.title = title
 
-        if priority is not None:
-            try:
-                ticket.priority = TicketPriority(priority)
-            except ValueError:
-                return {"error": f"Invalid priority value: {priority}"}
+        if priority_enum is not None:
+            ticket.priority = priority_enum
 
         if description is not None:
             ticket.description = description
@@ -151,6 +183,9 @@ class TicketManagementPlugin:
         # Update the timestamp
         ticket.updated_at = datetime.now()
 
+        # Write the ticket back so that it is persisted and its indexes are updated
+        await self._tickets.aset(ticket_id, ticket)
+
         return {
             "ticket_id": ticket_id,
             "status": "updated",
@@ -159,52 +194,60 @@ class TicketManagementPlugin:
 
     @kernel_function(
         name="search_tickets",
-        description="Search for support tickets based on criteria.",
+        description="Search for support tickets based on criteria. Results are paginated, "
+        "request the next page with the returned next_cursor only if more tickets are needed.",
     )
-    def search_tickets(
+    async def search_tickets(
         self,
         search_query: Annotated[
             str | None, "Natural language search query to find relevant tickets."
         ] = None,
         department_code: Annotated[str | None, "Filter tickets by department code."] = None,
         priority: Annotated[str | None, "Filter tickets by priority level."] = None,
+        page_size: Annotated[
+            int | None, f"Number of tickets per page, most relevant first. Defaults to {DEFAULT_PAGE_SIZE}."
+        ] = None,
+        cursor: Annotated[
+            str | None, "The next_cursor of the previous page, to continue a search."
+        ] = None,
+        fields: Annotated[
+            list[str] | None,
+            f"Ticket fields to return, e.g. ['title', 'priority']. Must be from {list(TICKET_FIELDS)}. "
+            "The ticket_id is always returned. Defaults to all fields.",
+        ] = None,
     ) -> dict[str, Any]:
         logging.info(f"Searching tickets with query: {search_query}")
 
-        # Start with all tickets
-        results = list(self._tickets.values())
-
-        # Apply filters
-        if department_code:
-            results = [t for t in results if t.department_code == department_code]
-
+        priority_enum = None
         if priority:
             try:
                 priority_enum = TicketPriority(priority)
-                results = [t for t in results if t.priority == priority_enum]
             except ValueError:
                 return {"error": f"Invalid priority value: {priority}"}
 
-        # Simple search implementation
-        if search_query:
-            search_terms = search_query.lower().split()
-            filtered_results: list[SupportTicket] = []
-
-            for ticket in results:
-                ticket_text = (
-                    f"{ticket.title} {ticket.description} {ticket.expected_outcome}"
-                )
-                ticket_text = ticket_text.lower()
-
-                if any(term in ticket_text for term in search_terms):
-                    filtered_results.append(ticket)
+        try:
+            validate_fields(fields, TICKET_FIELDS)
+            offset, limit = page_bounds(cursor, page_size)
+        except ValueError as e:
+            return {"error": str(e)}
 
-            results = filtered_results
+        # Filtering, ranking and pagination are done by the storage backend
+        tickets, total_count = await self._tickets.asearch(
+            query=search_query,
+            department_code=department_code,
+            priority=priority_enum,
+            offset=offset,
+            limit=limit,
+        )
 
-        # Convert to dictionaries for return
         return {
-            "count": len(results),
-            "tickets": [self._ticket_to_dict(ticket) for ticket in results],
+            "count": len(tickets),
+            "total_count": total_count,
+            "next_cursor": next_page_cursor(offset, len(tickets), total_count),
+            "tickets": [
+                project(self._ticket_to_dict(ticket), fields, key_field="ticket_id")
+                for ticket in tickets
+            ],
         }
 
     def _ticket_to_dict(self, ticket: SupportTicket) -> dict[str, Any]:
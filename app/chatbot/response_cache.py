@@ -0,0 +1,218 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+from collections.abc import AsyncGenerator
+from enum import Enum
+from typing import Any
+
+from pydantic import ConfigDict
+from semantic_kernel.connectors.ai.chat_completion_client_base import ChatCompletionClientBase
+from semantic_kernel.connectors.ai.completion_usage import CompletionUsage
+from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
+from semantic_kernel.contents import AuthorRole, ChatHistory, ChatMessageContent, StreamingChatMessageContent
+
+logger = logging.getLogger(__name__)
+
+# Default location of the response cache, relative to the working directory
+DEFAULT_CACHE_PATH = "chat_completion_cache.db"
+
+# Function result values that change on every run: the ids generated for new tickets and action
+# items, and timestamps
+_GENERATED_ID_PATTERN = re.compile(r"\b(?:TKT|ACT)-[0-9A-F]{8}\b")
+_TIMESTAMP_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?")
+
+
+class CacheMode(str, Enum):
+    """How chat completions use the response cache"""
+
+    # Call the service and store every response, replacing cached ones
+    RECORD = "record"
+    # Serve cached responses and only call (and record) the service on a cache miss
+    REPLAY = "replay"
+    # Always call the service, the cache is not used
+    PASSTHROUGH = "passthrough"
+
+
+class ChatResponseCache:
+    """
+    Chat completion responses stored in SQLite, keyed by a hash of the request.
+
+    A single connection is shared by all kernels of the process and guarded by a lock,
+    requests are short and the cache is read far more often than it is written.
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH):
+        """
+        Args:
+            path (str): The SQLite database file, ":memory:" for a process-local cache.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, response TEXT NOT NULL)"
+        )
+
+    @staticmethod
+    def key(ai_model_id: str, settings: dict[str, Any], chat_history: ChatHistory) -> str:
+        """
+        Compute the cache key of a request.
+
+        Generated ids and timestamps in function results are left out of the key, so that a
+        conversation creating tickets or action items is replayed past its first create call.
+        Args:
+            ai_model_id (str): The model (deployment) the request is sent to.
+            settings (dict[str, Any]): The request settings, including the available tools.
+            chat_history (ChatHistory): The messages sent to the model.
+        Returns:
+            str: The SHA-256 hash of the request.
+        """
+        request = {
+            "model": ai_model_id,
+            "settings": settings,
+            "messages": [_message_key(message) for message in chat_history.messages],
+        }
+        return hashlib.sha256(json.dumps(request, sort_keys=True, default=str).encode()).hexdigest()
+
+    def get(self, key: str) -> list[ChatMessageContent] | None:
+        """Return the cached response of a request, None on a cache miss"""
+        with self._lock:
+            row = self._connection.execute("SELECT response FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+
+        messages = [ChatMessageContent.model_validate(message) for message in json.loads(row[0])]
+        for message in messages:
+            if isinstance(usage := message.metadata.get("usage"), dict):
+                message.metadata["usage"] = CompletionUsage.model_validate(usage)
+        return messages
+
+    def set(self, key: str, messages: list[ChatMessageContent]) -> None:
+        """Store the response of a request"""
+        # The raw SDK response is not serializable and not needed to replay the messages
+        response = json.dumps([message.model_dump(mode="json", exclude={"inner_content"}) for message in messages])
+        with self._lock:
+            self._connection.execute(
+                "INSERT INTO responses (key, response) VALUES (?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET response = excluded.response",
+                (key, response),
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+def _message_key(message: ChatMessageContent) -> str:
+    serialized = json.dumps(message.to_dict(), sort_keys=True, default=str)
+    if message.role != AuthorRole.TOOL:
+        return serialized
+    return _TIMESTAMP_PATTERN.sub("<timestamp>", _GENERATED_ID_PATTERN.sub("<id>", serialized))
+
+
+class CachingChatCompletion(ChatCompletionClientBase):
+    """
+    A chat completion service serving responses from a ChatResponseCache.
+
+    Requests are delegated to the wrapped service, which still configures the tools and
+    settings of each request, so that the cache key covers everything sent to the model.
+    Streaming requests are not cached.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    SUPPORTS_FUNCTION_CALLING = True
+
+    service: ChatCompletionClientBase
+    cache: ChatResponseCache
+    mode: CacheMode
+
+    def __init__(self, service: ChatCompletionClientBase, cache: ChatResponseCache, mode: CacheMode):
+        """
+        Args:
+            service (ChatCompletionClientBase): The service called on cache misses.
+            cache (ChatResponseCache): The response cache.
+            mode (CacheMode): How the cache is used.
+        """
+        super().__init__(
+            ai_model_id=service.ai_model_id,
+            service_id=service.service_id,
+            instruction_role=service.instruction_role,
+            service=service,
+            cache=cache,
+            mode=mode,
+        )
+
+    def get_prompt_execution_settings_class(self) -> type[PromptExecutionSettings]:
+        return self.service.get_prompt_execution_settings_class()
+
+    def _verify_function_choice_settings(self, settings: PromptExecutionSettings) -> None:
+        self.service._verify_function_choice_settings(settings)
+
+    def _update_function_choice_settings_callback(self):  # pyright: ignore[reportUnknownParameterType] Same callback type as the wrapped service
+        return self.service._update_function_choice_settings_callback()  # pyright: ignore[reportUnknownVariableType] Same callback type as the wrapped service
+
+    def _reset_function_choice_settings(self, settings: PromptExecutionSettings) -> None:
+        self.service._reset_function_choice_settings(settings)
+
+    async def _inner_get_chat_message_contents(
+        self,
+        chat_history: ChatHistory,
+        settings: PromptExecutionSettings,
+    ) -> list[ChatMessageContent]:
+        if self.mode == CacheMode.PASSTHROUGH:
+            return await self.service._inner_get_chat_message_contents(chat_history, settings)
+
+        key = ChatResponseCache.key(self.ai_model_id, settings.prepare_settings_dict(), chat_history)
+        if self.mode == CacheMode.REPLAY and (cached := self.cache.get(key)) is not None:
+            logger.debug(f"Replaying cached chat completion: {key}")
+            return cached
+
+        messages = await self.service._inner_get_chat_message_contents(chat_history, settings)
+        self.cache.set(key, messages)
+        return messages
+
+    async def _inner_get_streaming_chat_message_contents(
+        self,
+        chat_history: ChatHistory,
+        settings: PromptExecutionSettings,
+        function_invoke_attempt: int = 0,
+    ) -> AsyncGenerator[list[StreamingChatMessageContent], Any]:
+        async for messages in self.service._inner_get_streaming_chat_message_contents(
+            chat_history, settings, function_invoke_attempt
+        ):
+            yield messages
+
+
+_response_cache: ChatResponseCache | None = None
+
+
+def with_response_cache(service: ChatCompletionClientBase) -> ChatCompletionClientBase:
+    """
+    Wrap a chat completion service with the response cache configured from the environment:
+    - CHAT_COMPLETION_CACHE_MODE: record, replay or passthrough (default)
+    - CHAT_COMPLETION_CACHE_PATH: the SQLite cache file (default: chat_completion_cache.db)
+    Args:
+        service (ChatCompletionClientBase): The service to wrap.
+    Returns:
+        ChatCompletionClientBase: The service itself in passthrough mode, the caching service otherwise.
+    """
+    mode = CacheMode(os.getenv("CHAT_COMPLETION_CACHE_MODE", CacheMode.PASSTHROUGH).lower())
+    if mode == CacheMode.PASSTHROUGH:
+        return service
+
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = ChatResponseCache(os.getenv("CHAT_COMPLETION_CACHE_PATH", DEFAULT_CACHE_PATH))
+        logger.info(f"Using chat completion response cache in {mode.value} mode: {_response_cache.path}")
+
+    return CachingChatCompletion(service, _response_cache, mode)
@@ -0,0 +1,116 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from semantic_kernel import Kernel
+from semantic_kernel.agents import ChatHistoryAgentThread
+
+from app.chatbot.history_reducer import create_history_reducing_thread
+
+logger = logging.getLogger(__name__)
+
+# Session used when the caller does not provide a session identifier (e.g. CLI usage)
+DEFAULT_SESSION_ID = "default"
+
+
+@dataclass
+class ChatSession:
+    """A single user conversation with its own agent thread"""
+
+    session_id: str
+    thread: ChatHistoryAgentThread
+    last_active: float
+    # Serializes turns within a session while other sessions run in parallel
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    # Kernel with the session's own plugin state, None to use the kernel of the agent
+    kernel: Kernel | None = None
+
+
+class ChatSessionManager:
+    """
+    Keeps one ChatHistoryAgentThread per session.
+
+    Sessions are created lazily on first use, evicted once they have been idle for longer than
+    `idle_timeout_seconds` and capped at `max_sessions` live sessions (least recently used first).
+    By default the history of each thread is kept within a token budget.
+    """
+
+    def __init__(
+        self,
+        idle_timeout_seconds: float = 30 * 60,
+        max_sessions: int = 1000,
+        thread_factory: Callable[[], ChatHistoryAgentThread] = create_history_reducing_thread,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_sessions <= 0:
+            raise ValueError("max_sessions must be greater than 0")
+
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self.max_sessions = max_sessions
+        self._thread_factory = thread_factory
+        self._clock = clock
+        # Ordered from least to most recently used
+        self._sessions: OrderedDict[str, ChatSession] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, session_id: object) -> bool:
+        return session_id in self._sessions
+
+    def get_session(self, session_id: str) -> ChatSession:
+        """
+        Return the session for the given id, creating it if needed.
+        Args:
+            session_id (str): The identifier of the session (e.g. the Gradio session hash).
+        Returns:
+            ChatSession: The live session.
+        """
+        now = self._clock()
+        self.evict_idle(now)
+
+        session = self._sessions.get(session_id)
+        if session is None:
+            while len(self._sessions) >= self.max_sessions:
+                evicted_id, _ = self._sessions.popitem(last=False)
+                logger.info(f"Session limit reached, evicting session: {evicted_id}")
+
+            session = ChatSession(
+                session_id=session_id,
+                thread=self._thread_factory(),
+                last_active=now,
+            )
+            self._sessions[session_id] = session
+            logger.info(f"Created chat session: {session_id}")
+        else:
+            session.last_active = now
+            self._sessions.move_to_end(session_id)
+
+        return session
+
+    def evict_idle(self, now: float | None = None) -> int:
+        """
+        Remove all sessions that have been idle for longer than the idle timeout.
+        Returns:
+            int: The number of evicted sessions.
+        """
+        now = self._clock() if now is None else now
+        evicted = 0
+
+        # Sessions are ordered by last activity, so we can stop at the first active one
+        while self._sessions:
+            session_id, session = next(iter(self._sessions.items()))
+            if now - session.last_active <= self.idle_timeout_seconds:
+                break
+            del self._sessions[session_id]
+            evicted += 1
+            logger.info(f"Evicted idle chat session: {session_id}")
+
+        return evicted
+
+    def remove_session(self, session_id: str) -> None:
+        """Remove a session, e.g. when the user starts over"""
+        self._sessions.pop(session_id, None)
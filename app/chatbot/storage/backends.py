@@ -0,0 +1,145 @@
+import logging
+import os
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from enum import Enum
+
+from app.chatbot.data_models.sample_data.sample_tickets import (
+    ACTION_ITEMS_BY_ID,
+    TICKET_TO_ACTIONS,
+    TICKETS_BY_ID,
+)
+from app.chatbot.storage.memory import InMemoryActionItemRepository, InMemoryTicketRepository
+from app.chatbot.storage.overlay import OverlayActionItemRepository, OverlayTicketRepository
+from app.chatbot.storage.repository import ActionItemRepository, TicketRepository
+
+
+class StorageBackend(str, Enum):
+    """Storage backends for tickets and action items"""
+
+    MEMORY = "memory"
+    SQLITE = "sqlite"
+    POSTGRES = "postgres"
+
+
+async def _closed() -> None:
+    """Nothing to release"""
+
+
+@dataclass
+class Storage:
+    """The ticket and action item repositories of one backend"""
+
+    tickets: TicketRepository
+    action_items: ActionItemRepository
+    # Release the connections shared by the repositories
+    close: Callable[[], None] = field(default=lambda: None)
+    aclose: Callable[[], Awaitable[None]] = field(default=lambda: _closed())
+
+
+def create_storage(backend: StorageBackend | str | None = None) -> Storage:
+    """
+    Create the repositories of a storage backend.
+
+    The backend and its settings are read from the environment:
+    - TICKET_STORAGE_BACKEND: memory (default), sqlite or postgres
+    - TICKET_STORAGE_SQLITE_PATH: the SQLite database file (default: tickets.db)
+    - TICKET_STORAGE_POSTGRES_URL: the PostgreSQL connection string
+    - TICKET_STORAGE_POSTGRES_POOL_SIZE: the maximum number of PostgreSQL connections per driver (default: 10)
+
+    Database backends are filled with the sample data when they are empty.
+    Args:
+        backend (StorageBackend|str|None): The backend to use. If None, TICKET_STORAGE_BACKEND is used.
+    Returns:
+        Storage: The repositories.
+    """
+    backend = StorageBackend(backend or os.getenv("TICKET_STORAGE_BACKEND", StorageBackend.MEMORY))
+    logging.info(f"Using {backend.value} ticket storage")
+
+    if backend == StorageBackend.MEMORY:
+        # The sample data is shared by all plugin instances, as are the database backends
+        return Storage(
+            tickets=InMemoryTicketRepository(TICKETS_BY_ID),
+            action_items=InMemoryActionItemRepository(ACTION_ITEMS_BY_ID, TICKET_TO_ACTIONS),
+        )
+
+    if backend == StorageBackend.SQLITE:
+        from app.chatbot.storage.sqlite import (
+            SQLiteActionItemRepository,
+            SQLiteDatabase,
+            SQLiteTicketRepository,
+        )
+
+        database = SQLiteDatabase(os.getenv("TICKET_STORAGE_SQLITE_PATH", "tickets.db"))
+        storage = Storage(
+            tickets=SQLiteTicketRepository(database),
+            action_items=SQLiteActionItemRepository(database),
+            close=database.close,
+        )
+    else:
+        # Imported here so that psycopg and libpq are only needed when PostgreSQL is used
+        from app.chatbot.storage.postgres import (
+            AsyncPostgresConnectionPool,
+            PostgresActionItemRepository,
+            PostgresConnectionPool,
+            PostgresTicketRepository,
+            create_schema,
+        )
+
+        conninfo = os.getenv("TICKET_STORAGE_POSTGRES_URL")
+        if not conninfo:
+            raise ValueError("TICKET_STORAGE_POSTGRES_URL must be set to use the postgres storage backend")
+        pool_size = int(os.getenv("TICKET_STORAGE_POSTGRES_POOL_SIZE", 10))
+        pool = PostgresConnectionPool(conninfo, max_size=pool_size)
+        async_pool = AsyncPostgresConnectionPool(conninfo, max_size=pool_size)
+        create_schema(pool)
+        storage = Storage(
+            tickets=PostgresTicketRepository(pool, async_pool),
+            action_items=PostgresActionItemRepository(pool, async_pool),
+            close=pool.close,
+            aclose=async_pool.aclose,
+        )
+
+    seed_storage(storage)
+    return storage
+
+
+def create_session_storage(base: Storage | None = None) -> Storage:
+    """
+    Create private, copy-on-write repositories on top of shared ones, e.g. for one chat session or
+    simulated conversation. The session sees the shared data plus its own changes, which are never
+    written to the shared repositories.
+    Args:
+        base (Storage|None): The shared repositories. If None, the storage shared by the process is used.
+    Returns:
+        Storage: The session repositories.
+    """
+    base = base or get_storage()
+    return Storage(
+        tickets=OverlayTicketRepository(base.tickets),
+        action_items=OverlayActionItemRepository(base.action_items),
+    )
+
+
+def seed_storage(storage: Storage) -> None:
+    """Fill empty repositories with the sample tickets and action items"""
+    if len(storage.tickets) == 0:
+        logging.info("Seeding ticket storage with sample tickets")
+        storage.tickets.update(TICKETS_BY_ID)
+    if len(storage.action_items) == 0:
+        logging.info("Seeding ticket storage with sample action items")
+        storage.action_items.update(ACTION_ITEMS_BY_ID)
+
+
+_storage: Storage | None = None
+
+
+def get_storage() -> Storage:
+    """
+    Return the storage shared by every plugin instance of this process.
+    It is created on first use so that the backend settings can come from a .env file loaded at startup.
+    """
+    global _storage
+    if _storage is None:
+        _storage = create_storage()
+    return _storage
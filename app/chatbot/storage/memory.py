@@ -0,0 +1,158 @@
+from collections.abc import Iterator, Mapping
+from itertools import islice
+
+from app.chatbot.data_models.ticket_models import (
+    ActionItem,
+    SupportTicket,
+    TicketPriority,
+)
+from app.chatbot.data_models.ticket_store import TicketStore
+from app.chatbot.storage.repository import ActionItemRepository, TicketRepository
+
+
+class InMemoryTicketRepository(TicketRepository):
+    """
+    Tickets kept in a process-local TicketStore.
+
+    Unlike the database backends, stored tickets are returned by reference and
+    nothing survives a restart. Lookups are cheap, so the async methods run them inline.
+    """
+
+    def __init__(self, tickets: Mapping[str, SupportTicket] | None = None):
+        # A TicketStore is shared as is, e.g. the sample tickets
+        self._store = tickets if isinstance(tickets, TicketStore) else TicketStore(tickets)
+
+    def __getitem__(self, ticket_id: str) -> SupportTicket:
+        return self._store[ticket_id]
+
+    def __setitem__(self, ticket_id: str, ticket: SupportTicket) -> None:
+        self._store[ticket_id] = ticket
+
+    def __delitem__(self, ticket_id: str) -> None:
+        del self._store[ticket_id]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._store)
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def __contains__(self, ticket_id: object) -> bool:
+        return ticket_id in self._store
+
+    async def aget(self, ticket_id: str) -> SupportTicket | None:
+        return self._store.get(ticket_id)
+
+    async def aset(self, ticket_id: str, ticket: SupportTicket) -> None:
+        self._store[ticket_id] = ticket
+
+    async def asearch(
+        self,
+        query: str | None = None,
+        department_code: str | None = None,
+        priority: TicketPriority | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> tuple[list[SupportTicket], int]:
+        return self.search(query, department_code, priority, offset, limit)
+
+    def search(
+        self,
+        query: str | None = None,
+        department_code: str | None = None,
+        priority: TicketPriority | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> tuple[list[SupportTicket], int]:
+        # Look up the filtered ticket ids in the secondary indexes instead of scanning all tickets
+        ticket_ids = self._store.filter_ids(department_code=department_code, priority=priority)
+
+        # Ranked full-text search on the indexed ticket text
+        if query:
+            matching_ids = self._store.search_ids(query, ticket_ids=ticket_ids)
+        else:
+            matching_ids = self._store.keys() if ticket_ids is None else ticket_ids
+
+        end = None if limit is None else offset + limit
+        return (
+            [self._store[ticket_id] for ticket_id in islice(matching_ids, offset, end)],
+            len(matching_ids),
+        )
+
+
+class InMemoryActionItemRepository(ActionItemRepository):
+    """
+    Action items kept in process-local dictionaries.
+
+    Unlike the database backends, stored action items are returned by reference and
+    nothing survives a restart. Lookups are cheap, so the async methods run them inline.
+    """
+
+    def __init__(
+        self,
+        action_items: dict[str, ActionItem] | None = None,
+        ticket_to_actions: dict[str, list[str]] | None = None,
+    ):
+        # The dictionaries are shared as is, e.g. the sample action items
+        self._action_items = {} if action_items is None else action_items
+        if ticket_to_actions is None:
+            ticket_to_actions = {}
+            for action_item in self._action_items.values():
+                ticket_to_actions.setdefault(action_item.parent_ticket_id, []).append(action_item.action_id)
+        self._ticket_to_actions = ticket_to_actions
+
+    def __getitem__(self, action_id: str) -> ActionItem:
+        return self._action_items[action_id]
+
+    def __setitem__(self, action_id: str, action_item: ActionItem) -> None:
+        previous = self._action_items.get(action_id)
+        if previous is not None and previous.parent_ticket_id != action_item.parent_ticket_id:
+            self._unlink(action_id, previous.parent_ticket_id)
+
+        self._action_items[action_id] = action_item
+        action_ids = self._ticket_to_actions.setdefault(action_item.parent_ticket_id, [])
+        if action_id not in action_ids:
+            action_ids.append(action_id)
+
+    def __delitem__(self, action_id: str) -> None:
+        action_item = self._action_items.pop(action_id)
+        self._unlink(action_id, action_item.parent_ticket_id)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._action_items)
+
+    def __len__(self) -> int:
+        return len(self._action_items)
+
+    def __contains__(self, action_id: object) -> bool:
+        return action_id in self._action_items
+
+    async def aget(self, action_id: str) -> ActionItem | None:
+        return self._action_items.get(action_id)
+
+    async def aset(self, action_id: str, action_item: ActionItem) -> None:
+        self[action_id] = action_item
+
+    async def alist_for_ticket(
+        self,
+        ticket_id: str,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> tuple[list[ActionItem], int]:
+        return self.list_for_ticket(ticket_id, offset, limit)
+
+    def list_for_ticket(
+        self,
+        ticket_id: str,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> tuple[list[ActionItem], int]:
+        action_ids = self._ticket_to_actions.get(ticket_id, [])
+        end = None if limit is None else offset + limit
+        return [self._action_items[aid] for aid in action_ids[offset:end]], len(action_ids)
+
+    def _unlink(self, action_id: str, ticket_id: str) -> None:
+        """Remove an action item from the action items of a ticket"""
+        action_ids = self._ticket_to_actions.get(ticket_id, [])
+        if action_id in action_ids:
+            action_ids.remove(action_id)
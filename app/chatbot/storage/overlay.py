@@ -0,0 +1,339 @@
+import heapq
+from collections.abc import Iterator
+from dataclasses import replace
+from itertools import chain
+
+from app.chatbot.data_models.ticket_models import (
+    ActionItem,
+    SupportTicket,
+    TicketPriority,
+)
+from app.chatbot.data_models.ticket_store import TicketStore
+from app.chatbot.storage.memory import InMemoryActionItemRepository, InMemoryTicketRepository
+from app.chatbot.storage.repository import ActionItemRepository, TicketRepository
+
+
+class OverlayTicketRepository(TicketRepository):
+    """
+    A private, copy-on-write view of a shared ticket repository.
+
+    Writes and deletes are kept in the overlay and never reach the base repository, reads see the
+    base tickets plus the overlay's own changes. Base tickets are copied when read, so the shared
+    data is not copied up front and cannot be changed in place.
+
+    Searches page through the base repository, fetching only enough base tickets to fill the
+    requested page. Changed tickets keep the place of their base ticket, and tickets that only match
+    in the overlay are ranked among the base tickets by relevance, or follow them without a query.
+    """
+
+    def __init__(self, base: TicketRepository):
+        """
+        Args:
+            base (TicketRepository): The shared repository, which is only read.
+        """
+        self._base = base
+        self._changes = InMemoryTicketRepository()
+        # Base tickets deleted from the overlay, and tickets that only exist in the overlay
+        self._deleted: set[str] = set()
+        self._created: set[str] = set()
+
+    def __getitem__(self, ticket_id: str) -> SupportTicket:
+        if ticket_id in self._deleted:
+            raise KeyError(ticket_id)
+        if ticket_id in self._changes:
+            return self._changes[ticket_id]
+        return replace(self._base[ticket_id])
+
+    def __setitem__(self, ticket_id: str, ticket: SupportTicket) -> None:
+        if ticket_id not in self._changes and ticket_id not in self._deleted and ticket_id not in self._base:
+            self._created.add(ticket_id)
+        self._write(ticket_id, ticket)
+
+    def __delitem__(self, ticket_id: str) -> None:
+        if ticket_id not in self:
+            raise KeyError(ticket_id)
+        if ticket_id in self._changes:
+            del self._changes[ticket_id]
+        if ticket_id in self._created:
+            self._created.discard(ticket_id)
+        else:
+            self._deleted.add(ticket_id)
+
+    def __iter__(self) -> Iterator[str]:
+        base_ids = (ticket_id for ticket_id in self._base if ticket_id not in self._deleted)
+        created_ids = (ticket_id for ticket_id in self._changes if ticket_id in self._created)
+        return chain(base_ids, created_ids)
+
+    def __len__(self) -> int:
+        return len(self._base) - len(self._deleted) + len(self._created)
+
+    def __contains__(self, ticket_id: object) -> bool:
+        if ticket_id in self._deleted:
+            return False
+        return ticket_id in self._changes or ticket_id in self._base
+
+    async def aget(self, ticket_id: str) -> SupportTicket | None:
+        if ticket_id in self._deleted:
+            return None
+        if ticket_id in self._changes:
+            return self._changes[ticket_id]
+        ticket = await self._base.aget(ticket_id)
+        return replace(ticket) if ticket is not None else None
+
+    async def aset(self, ticket_id: str, ticket: SupportTicket) -> None:
+        if ticket_id not in self._changes and ticket_id not in self._deleted and await self._base.aget(ticket_id) is None:
+            self._created.add(ticket_id)
+        self._write(ticket_id, ticket)
+
+    def search(
+        self,
+        query: str | None = None,
+        department_code: str | None = None,
+        priority: TicketPriority | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> tuple[list[SupportTicket], int]:
+        if not self._changes and not self._deleted:
+            tickets, total_count = self._base.search(query, department_code, priority, offset, limit)
+            return [replace(ticket) for ticket in tickets], total_count
+
+        base_tickets, base_count = self._base.search(
+            query, department_code, priority, 0, self._base_window(offset, limit)
+        )
+        touched = [self._base[ticket_id] for ticket_id in self._touched_base_ids()]
+        return self._merge(query, department_code, priority, base_tickets, base_count, touched, offset, limit)
+
+    async def asearch(
+        self,
+        query: str | None = None,
+        department_code: str | None = None,
+        priority: TicketPriority | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> tuple[list[SupportTicket], int]:
+        if not self._changes and not self._deleted:
+            tickets, total_count = await self._base.asearch(query, department_code, priority, offset, limit)
+            return [replace(ticket) for ticket in tickets], total_count
+
+        base_tickets, base_count = await self._base.asearch(
+            query, department_code, priority, 0, self._base_window(offset, limit)
+        )
+        touched: list[SupportTicket] = []
+        for ticket_id in self._touched_base_ids():
+            ticket = await self._base.aget(ticket_id)
+            if ticket is not None:
+                touched.append(ticket)
+        return self._merge(query, department_code, priority, base_tickets, base_count, touched, offset, limit)
+
+    def _write(self, ticket_id: str, ticket: SupportTicket) -> None:
+        self._deleted.discard(ticket_id)
+        self._changes[ticket_id] = ticket
+
+    def _base_window(self, offset: int, limit: int | None) -> int | None:
+        """Number of base tickets filling a page, even if all changed and deleted tickets are among them"""
+        return None if limit is None else offset + limit + len(self._changes) + len(self._deleted)
+
+    def _touched_base_ids(self) -> list[str]:
+        """Ids of the base tickets changed or deleted in the overlay"""
+        return [ticket_id for ticket_id in chain(self._changes, self._deleted) if ticket_id not in self._created]
+
+    def _merge(
+        self,
+        query: str | None,
+        department_code: str | None,
+        priority: TicketPriority | None,
+        base_tickets: list[SupportTicket],
+        base_count: int,
+        touched: list[SupportTicket],
+        offset: int,
+        limit: int | None,
+    ) -> tuple[list[SupportTicket], int]:
+        """
+        Page through the base search results merged with the overlay changes.
+        Args:
+            query (str|None): The full-text query of the search.
+            department_code (str|None): The department filter of the search.
+            priority (TicketPriority|None): The priority filter of the search.
+            base_tickets (list[SupportTicket]): The first base search results, at least up to the base window.
+            base_count (int): The total number of base search results.
+            touched (list[SupportTicket]): The base versions of the tickets changed or deleted in the overlay.
+            offset (int): Number of matching tickets to skip.
+            limit (int|None): Maximum number of tickets to return.
+        Returns:
+            tuple[list[SupportTicket], int]: The requested tickets and the total number of matches.
+        """
+        changed = {ticket.ticket_id: ticket for ticket in self._changes.search(query, department_code, priority)[0]}
+        # Base tickets counted by the base search that are changed or deleted in the overlay
+        touched_ids = {
+            ticket.ticket_id
+            for ticket in InMemoryTicketRepository({ticket.ticket_id: ticket for ticket in touched}).search(
+                query, department_code, priority
+            )[0]
+        }
+        # Changed tickets that only match in the overlay, e.g. created ones
+        added = [ticket for ticket_id, ticket in changed.items() if ticket_id not in touched_ids]
+        total_count = base_count - len(touched_ids - changed.keys()) + len(added)
+
+        # Changed tickets that still match keep the place of their base ticket
+        base_matches = [
+            changed.get(ticket.ticket_id, ticket)
+            for ticket in base_tickets
+            if ticket.ticket_id not in self._deleted
+            and (ticket.ticket_id not in self._changes or ticket.ticket_id in changed)
+        ]
+        if query and added:
+            matches = _merge_by_relevance(query, base_matches, added)
+        else:
+            # Without a query tickets are listed in insertion order, the overlay's own tickets come last
+            matches = base_matches + added
+
+        end = None if limit is None else offset + limit
+        # Only the returned base tickets are copied
+        page = [
+            ticket if ticket.ticket_id in self._changes else replace(ticket)
+            for ticket in matches[offset:end]
+        ]
+        return page, total_count
+
+
+def _merge_by_relevance(
+    query: str, base_tickets: list[SupportTicket], added: list[SupportTicket]
+) -> list[SupportTicket]:
+    """
+    Rank tickets found in the overlay among the base search results, scoring both with the same
+    in-memory full-text index. The base tickets keep the order of the base repository.
+    """
+    candidates = TicketStore({ticket.ticket_id: ticket for ticket in [*base_tickets, *added]})
+    ranks = {ticket_id: rank for rank, ticket_id in enumerate(candidates.search_ids(query))}
+    added = sorted(added, key=lambda ticket: ranks.get(ticket.ticket_id, len(ranks)))
+    return list(heapq.merge(base_tickets, added, key=lambda ticket: ranks.get(ticket.ticket_id, len(ranks))))
+
+
+class OverlayActionItemRepository(ActionItemRepository):
+    """
+    A private, copy-on-write view of a shared action item repository.
+
+    Writes and deletes are kept in the overlay and never reach the base repository, reads see the
+    base action items plus the overlay's own changes. Base action items are copied when read, so the
+    shared data is not copied up front and cannot be changed in place.
+    """
+
+    def __init__(self, base: ActionItemRepository):
+        """
+        Args:
+            base (ActionItemRepository): The shared repository, which is only read.
+        """
+        self._base = base
+        self._changes = InMemoryActionItemRepository()
+        # Base action items deleted from the overlay, and action items that only exist in the overlay
+        self._deleted: set[str] = set()
+        self._created: set[str] = set()
+
+    def __getitem__(self, action_id: str) -> ActionItem:
+        if action_id in self._deleted:
+            raise KeyError(action_id)
+        if action_id in self._changes:
+            return self._changes[action_id]
+        return replace(self._base[action_id])
+
+    def __setitem__(self, action_id: str, action_item: ActionItem) -> None:
+        if action_id not in self._changes and action_id not in self._deleted and action_id not in self._base:
+            self._created.add(action_id)
+        self._write(action_id, action_item)
+
+    def __delitem__(self, action_id: str) -> None:
+        if action_id not in self:
+            raise KeyError(action_id)
+        if action_id in self._changes:
+            del self._changes[action_id]
+        if action_id in self._created:
+            self._created.discard(action_id)
+        else:
+            self._deleted.add(action_id)
+
+    def __iter__(self) -> Iterator[str]:
+        base_ids = (action_id for action_id in self._base if action_id not in self._deleted)
+        created_ids = (action_id for action_id in self._changes if action_id in self._created)
+        return chain(base_ids, created_ids)
+
+    def __len__(self) -> int:
+        return len(self._base) - len(self._deleted) + len(self._created)
+
+    def __contains__(self, action_id: object) -> bool:
+        if action_id in self._deleted:
+            return False
+        return action_id in self._changes or action_id in self._base
+
+    async def aget(self, action_id: str) -> ActionItem | None:
+        if action_id in self._deleted:
+            return None
+        if action_id in self._changes:
+            return self._changes[action_id]
+        action_item = await self._base.aget(action_id)
+        return replace(action_item) if action_item is not None else None
+
+    async def aset(self, action_id: str, action_item: ActionItem) -> None:
+        if action_id not in self._changes and action_id not in self._deleted and await self._base.aget(action_id) is None:
+            self._created.add(action_id)
+        self._write(action_id, action_item)
+
+    def list_for_ticket(
+        self,
+        ticket_id: str,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> tuple[list[ActionItem], int]:
+        if not self._changes and not self._deleted:
+            action_items, total_count = self._base.list_for_ticket(ticket_id, offset, limit)
+            return [replace(action_item) for action_item in action_items], total_count
+
+        base_items, _ = self._base.list_for_ticket(ticket_id)
+        return self._merge(ticket_id, base_items, offset, limit)
+
+    async def alist_for_ticket(
+        self,
+        ticket_id: str,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> tuple[list[ActionItem], int]:
+        if not self._changes and not self._deleted:
+            action_items, total_count = await self._base.alist_for_ticket(ticket_id, offset, limit)
+            return [replace(action_item) for action_item in action_items], total_count
+
+        base_items, _ = await self._base.alist_for_ticket(ticket_id)
+        return self._merge(ticket_id, base_items, offset, limit)
+
+    def _write(self, action_id: str, action_item: ActionItem) -> None:
+        self._deleted.discard(action_id)
+        self._changes[action_id] = action_item
+
+    def _merge(
+        self,
+        ticket_id: str,
+        base_items: list[ActionItem],
+        offset: int,
+        limit: int | None,
+    ) -> tuple[list[ActionItem], int]:
+        """
+        Page through the base action items of a ticket, with changed ones in place, followed by the
+        action items added to the ticket in the overlay
+        """
+        base_ids = {action_item.action_id for action_item in base_items}
+        changed, _ = self._changes.list_for_ticket(ticket_id)
+
+        matches = [
+            self._changes.get(action_item.action_id, action_item)
+            for action_item in base_items
+            if action_item.action_id not in self._deleted
+            # Changed action items that moved to another ticket are no longer listed here
+            and self._changes.get(action_item.action_id, action_item).parent_ticket_id == ticket_id
+        ]
+        matches.extend(action_item for action_item in changed if action_item.action_id not in base_ids)
+
+        end = None if limit is None else offset + limit
+        # Only the returned base action items are copied
+        page = [
+            action_item if action_item.action_id in self._changes else replace(action_item)
+            for action_item in matches[offset:end]
+        ]
+        return page, len(matches)
@@ -0,0 +1,406 @@
+import asyncio
+import logging
+import queue
+import threading
+from collections.abc import AsyncIterator, Iterator, Sequence
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any
+
+import psycopg
+
+from app.chatbot.data_models.ticket_models import (
+    ActionItem,
+    SupportTicket,
+    TicketPriority,
+)
+from app.chatbot.data_models.ticket_search_index import tokenize
+from app.chatbot.storage.repository import ActionItemRepository, TicketRepository
+from app.chatbot.storage.rows import (
+    ACTION_ITEM_COLUMNS,
+    TICKET_COLUMNS,
+    action_item_from_row,
+    action_item_to_row,
+    ticket_from_row,
+    ticket_to_row,
+)
+
+_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS tickets (
+        seq BIGSERIAL UNIQUE,
+        ticket_id TEXT PRIMARY KEY,
+        title TEXT NOT NULL,
+        department_code TEXT NOT NULL,
+        priority TEXT NOT NULL,
+        workflow_type TEXT NOT NULL,
+        description TEXT NOT NULL,
+        expected_outcome TEXT NOT NULL,
+        resolution TEXT,
+        customer_visible BOOLEAN NOT NULL DEFAULT FALSE,
+        created_at TIMESTAMP,
+        updated_at TIMESTAMP,
+        search_vector TSVECTOR GENERATED ALWAYS AS (
+            to_tsvector('simple', title || ' ' || description || ' ' || expected_outcome)
+        ) STORED
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS tickets_department_priority_idx ON tickets (department_code, priority, seq)",
+    "CREATE INDEX IF NOT EXISTS tickets_priority_idx ON tickets (priority, seq)",
+    "CREATE INDEX IF NOT EXISTS tickets_search_idx ON tickets USING GIN (search_vector)",
+    """
+    CREATE TABLE IF NOT EXISTS action_items (
+        seq BIGSERIAL UNIQUE,
+        action_id TEXT PRIMARY KEY,
+        parent_ticket_id TEXT NOT NULL,
+        title TEXT NOT NULL,
+        assignee TEXT NOT NULL,
+        status TEXT NOT NULL,
+        due_date TIMESTAMP,
+        created_at TIMESTAMP,
+        updated_at TIMESTAMP
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS action_items_parent_idx ON action_items (parent_ticket_id, seq)",
+]
+
+
+def _upsert_statement(table: str, columns: Sequence[str]) -> str:
+    updates = ", ".join(f"{column} = EXCLUDED.{column}" for column in columns[1:])
+    return (
+        f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('%s' for _ in columns)}) "
+        f"ON CONFLICT ({columns[0]}) DO UPDATE SET {updates}"
+    )
+
+
+class PostgresConnectionPool:
+    """
+    A small thread-safe pool of autocommit connections to a PostgreSQL database.
+
+    Connections are opened on demand up to `max_size` and kept open for reuse, so that the
+    statements they have prepared stay prepared. Broken connections are discarded.
+    """
+
+    def __init__(self, conninfo: str, max_size: int = 10, timeout_seconds: float = 30.0):
+        if max_size <= 0:
+            raise ValueError("max_size must be greater than 0")
+
+        self.conninfo = conninfo
+        self.max_size = max_size
+        self.timeout_seconds = timeout_seconds
+        self._idle: queue.LifoQueue[psycopg.Connection[tuple[Any, ...]]] = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max_size)
+
+    @contextmanager
+    def connection(self) -> Iterator[psycopg.Connection[tuple[Any, ...]]]:
+        """Borrow a connection, waiting up to `timeout_seconds` when all connections are in use"""
+        if not self._slots.acquire(timeout=self.timeout_seconds):
+            raise TimeoutError(f"No PostgreSQL connection available after {self.timeout_seconds}s")
+
+        try:
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                connection = psycopg.connect(self.conninfo, autocommit=True)
+
+            try:
+                yield connection
+            finally:
+                if connection.closed or connection.broken:
+                    connection.close()
+                else:
+                    self._idle.put(connection)
+        finally:
+            self._slots.release()
+
+    def execute(self, sql: str, parameters: Sequence[Any] = ()) -> list[tuple[Any, ...]]:
+        """Run a prepared statement on a pooled connection and return all result rows"""
+        with self.connection() as connection:
+            cursor = connection.execute(sql, parameters, prepare=True)  # pyright: ignore[reportArgumentType] - Statements are built from constant fragments only
+            return cursor.fetchall() if cursor.description else []
+
+    def close(self) -> None:
+        """Close all idle connections"""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+class AsyncPostgresConnectionPool:
+    """
+    The asyncio counterpart of PostgresConnectionPool, used by the async repository methods so
+    that database I/O does not block the event loop.
+
+    Connections belong to the event loop they were opened on, the pool closes its idle
+    connections and starts over when it is used from a new event loop.
+    """
+
+    def __init__(self, conninfo: str, max_size: int = 10, timeout_seconds: float = 30.0):
+        if max_size <= 0:
+            raise ValueError("max_size must be greater than 0")
+
+        self.conninfo = conninfo
+        self.max_size = max_size
+        self.timeout_seconds = timeout_seconds
+        self._idle: list[psycopg.AsyncConnection[tuple[Any, ...]]] = []
+        self._slots: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[psycopg.AsyncConnection[tuple[Any, ...]]]:
+        """Borrow a connection, waiting up to `timeout_seconds` when all connections are in use"""
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._loop is not loop:
+            # The idle connections of the previous event loop cannot be reused, close them
+            await self._close_idle(best_effort=True)
+            self._slots = asyncio.Semaphore(self.max_size)
+            self._loop = loop
+        slots = self._slots
+
+        try:
+            await asyncio.wait_for(slots.acquire(), self.timeout_seconds)
+        except TimeoutError:
+            raise TimeoutError(f"No PostgreSQL connection available after {self.timeout_seconds}s")
+
+        try:
+            if self._idle:
+                connection = self._idle.pop()
+            else:
+                connection = await psycopg.AsyncConnection.connect(self.conninfo, autocommit=True)
+
+            try:
+                yield connection
+            finally:
+                if connection.closed or connection.broken:
+                    await connection.close()
+                else:
+                    self._idle.append(connection)
+        finally:
+            slots.release()
+
+    async def execute(self, sql: str, parameters: Sequence[Any] = ()) -> list[tuple[Any, ...]]:
+        """Run a prepared statement on a pooled connection and return all result rows"""
+        async with self.connection() as connection:
+            cursor = await connection.execute(sql, parameters, prepare=True)  # pyright: ignore[reportArgumentType] - Statements are built from constant fragments only
+            return await cursor.fetchall() if cursor.description else []
+
+    async def aclose(self) -> None:
+        """Close all idle connections"""
+        await self._close_idle(best_effort=False)
+
+    async def _close_idle(self, best_effort: bool) -> None:
+        idle, self._idle = self._idle, []
+        for connection in idle:
+            try:
+                await connection.close()
+            except Exception as e:
+                if not best_effort:
+                    raise
+                logging.warning(f"Failed to close an idle PostgreSQL connection: {e}")
+
+
+def create_schema(pool: PostgresConnectionPool) -> None:
+    """Create the tables and indexes used by the PostgreSQL repositories, if they do not exist"""
+    with pool.connection() as connection:
+        for statement in _SCHEMA:
+            connection.execute(statement)  # pyright: ignore[reportArgumentType] - Statements are constants
+    logging.info("PostgreSQL storage initialized")
+
+
+class PostgresTicketRepository(TicketRepository):
+    """
+    Tickets stored in PostgreSQL.
+
+    Filters use B-tree indexes on department and priority, text search uses a GIN index on a
+    generated tsvector column, ranked with ts_rank. The async methods use psycopg's async driver.
+    """
+
+    _SELECT = f"SELECT {', '.join(f't.{column}' for column in TICKET_COLUMNS)}"
+    _UPSERT = _upsert_statement("tickets", TICKET_COLUMNS)
+
+    def __init__(self, pool: PostgresConnectionPool, async_pool: AsyncPostgresConnectionPool):
+        self._pool = pool
+        self._async_pool = async_pool
+
+    def __getitem__(self, ticket_id: str) -> SupportTicket:
+        rows = self._pool.execute(f"{self._SELECT} FROM tickets t WHERE t.ticket_id = %s", (ticket_id,))
+        if not rows:
+            raise KeyError(ticket_id)
+        return ticket_from_row(rows[0])
+
+    def __setitem__(self, ticket_id: str, ticket: SupportTicket) -> None:
+        self._pool.execute(self._UPSERT, ticket_to_row(ticket))
+
+    def __delitem__(self, ticket_id: str) -> None:
+        if not self._pool.execute("DELETE FROM tickets WHERE ticket_id = %s RETURNING seq", (ticket_id,)):
+            raise KeyError(ticket_id)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter([row[0] for row in self._pool.execute("SELECT ticket_id FROM tickets ORDER BY seq")])
+
+    def __len__(self) -> int:
+        return self._pool.execute("SELECT COUNT(*) FROM tickets")[0][0]
+
+    def __contains__(self, ticket_id: object) -> bool:
+        return bool(self._pool.execute("SELECT 1 FROM tickets WHERE ticket_id = %s", (ticket_id,)))
+
+    def search(
+        self,
+        query: str | None = None,
+        department_code: str | None = None,
+        priority: TicketPriority | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> tuple[list[SupportTicket], int]:
+        statements = _search_statements(self._SELECT, query, department_code, priority)
+        if statements is None:
+            return [], 0
+        sql, count_sql, parameters = statements
+
+        with self._pool.connection() as connection:
+            rows = connection.execute(sql, (*parameters, limit, offset), prepare=True).fetchall()  # pyright: ignore[reportArgumentType] - Statements are built from constant fragments only
+            count_row = connection.execute(count_sql, parameters, prepare=True).fetchone()  # pyright: ignore[reportArgumentType] - Statements are built from constant fragments only
+        return [ticket_from_row(row) for row in rows], count_row[0] if count_row else 0
+
+    async def aget(self, ticket_id: str) -> SupportTicket | None:
+        rows = await self._async_pool.execute(
+            f"{self._SELECT} FROM tickets t WHERE t.ticket_id = %s", (ticket_id,)
+        )
+        return ticket_from_row(rows[0]) if rows else None
+
+    async def aset(self, ticket_id: str, ticket: SupportTicket) -> None:
+        await self._async_pool.execute(self._UPSERT, ticket_to_row(ticket))
+
+    async def asearch(
+        self,
+        query: str | None = None,
+        department_code: str | None = None,
+        priority: TicketPriority | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> tuple[list[SupportTicket], int]:
+        statements = _search_statements(self._SELECT, query, department_code, priority)
+        if statements is None:
+            return [], 0
+        sql, count_sql, parameters = statements
+
+        async with self._async_pool.connection() as connection:
+            cursor = await connection.execute(sql, (*parameters, limit, offset), prepare=True)  # pyright: ignore[reportArgumentType] - Statements are built from constant fragments only
+            rows = await cursor.fetchall()
+            cursor = await connection.execute(count_sql, parameters, prepare=True)  # pyright: ignore[reportArgumentType] - Statements are built from constant fragments only
+            count_row = await cursor.fetchone()
+        return [ticket_from_row(row) for row in rows], count_row[0] if count_row else 0
+
+
+def _search_statements(
+    select: str,
+    query: str | None,
+    department_code: str | None,
+    priority: TicketPriority | None,
+) -> tuple[str, str, list[Any]] | None:
+    """
+    Build the ticket search statement (with LIMIT and OFFSET placeholders last) and its count statement.
+    Returns:
+        tuple[str, str, list[Any]]|None: The statements and their shared parameters, None if the query has no terms.
+    """
+    conditions: list[str] = []
+    parameters: list[Any] = []
+
+    if query:
+        terms = tokenize(query)
+        if not terms:
+            return None
+        # Match any of the terms, also as a prefix (e.g. "print" matches "printer")
+        source = "tickets t, to_tsquery('simple', %s) q"
+        parameters.append(" | ".join(f"{term}:*" for term in terms))
+        conditions.append("t.search_vector @@ q")
+        order = "ts_rank(t.search_vector, q) DESC, t.seq"
+    else:
+        source = "tickets t"
+        order = "t.seq"
+
+    if department_code:
+        conditions.append("t.department_code = %s")
+        parameters.append(department_code)
+    if priority:
+        conditions.append("t.priority = %s")
+        parameters.append(priority.value)
+
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    return (
+        f"{select} FROM {source} {where} ORDER BY {order} LIMIT %s OFFSET %s",
+        f"SELECT COUNT(*) FROM {source} {where}",
+        parameters,
+    )
+
+
+class PostgresActionItemRepository(ActionItemRepository):
+    """
+    Action items stored in PostgreSQL, indexed by their parent ticket.
+    The async methods use psycopg's async driver.
+    """
+
+    _SELECT = f"SELECT {', '.join(ACTION_ITEM_COLUMNS)}"
+    _UPSERT = _upsert_statement("action_items", ACTION_ITEM_COLUMNS)
+    _LIST = f"{_SELECT} FROM action_items WHERE parent_ticket_id = %s ORDER BY seq LIMIT %s OFFSET %s"
+    _COUNT = "SELECT COUNT(*) FROM action_items WHERE parent_ticket_id = %s"
+
+    def __init__(self, pool: PostgresConnectionPool, async_pool: AsyncPostgresConnectionPool):
+        self._pool = pool
+        self._async_pool = async_pool
+
+    def __getitem__(self, action_id: str) -> ActionItem:
+        rows = self._pool.execute(f"{self._SELECT} FROM action_items WHERE action_id = %s", (action_id,))
+        if not rows:
+            raise KeyError(action_id)
+        return action_item_from_row(rows[0])
+
+    def __setitem__(self, action_id: str, action_item: ActionItem) -> None:
+        self._pool.execute(self._UPSERT, action_item_to_row(action_item))
+
+    def __delitem__(self, action_id: str) -> None:
+        if not self._pool.execute("DELETE FROM action_items WHERE action_id = %s RETURNING seq", (action_id,)):
+            raise KeyError(action_id)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter([row[0] for row in self._pool.execute("SELECT action_id FROM action_items ORDER BY seq")])
+
+    def __len__(self) -> int:
+        return self._pool.execute("SELECT COUNT(*) FROM action_items")[0][0]
+
+    def __contains__(self, action_id: object) -> bool:
+        return bool(self._pool.execute("SELECT 1 FROM action_items WHERE action_id = %s", (action_id,)))
+
+    def list_for_ticket(
+        self,
+        ticket_id: str,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> tuple[list[ActionItem], int]:
+        with self._pool.connection() as connection:
+            rows = connection.execute(self._LIST, (ticket_id, limit, offset), prepare=True).fetchall()  # pyright: ignore[reportArgumentType] - Statements are built from constant fragments only
+            count_row = connection.execute(self._COUNT, (ticket_id,), prepare=True).fetchone()
+        return [action_item_from_row(row) for row in rows], count_row[0] if count_row else 0
+
+    async def aget(self, action_id: str) -> ActionItem | None:
+        rows = await self._async_pool.execute(
+            f"{self._SELECT} FROM action_items WHERE action_id = %s", (action_id,)
+        )
+        return action_item_from_row(rows[0]) if rows else None
+
+    async def aset(self, action_id: str, action_item: ActionItem) -> None:
+        await self._async_pool.execute(self._UPSERT, action_item_to_row(action_item))
+
+    async def alist_for_ticket(
+        self,
+        ticket_id: str,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> tuple[list[ActionItem], int]:
+        async with self._async_pool.connection() as connection:
+            cursor = await connection.execute(self._LIST, (ticket_id, limit, offset), prepare=True)  # pyright: ignore[reportArgumentType] - Statements are built from constant fragments only
+            rows = await cursor.fetchall()
+            cursor = await connection.execute(self._COUNT, (ticket_id,), prepare=True)
+            count_row = await cursor.fetchone()
+        return [action_item_from_row(row) for row in rows], count_row[0] if count_row else 0
@@ -0,0 +1,108 @@
+import asyncio
+from abc import abstractmethod
+from collections.abc import MutableMapping
+
+from app.chatbot.data_models.ticket_models import (
+    ActionItem,
+    SupportTicket,
+    TicketPriority,
+)
+
+
+class TicketRepository(MutableMapping[str, SupportTicket]):
+    """
+    Storage of support tickets by ID.
+
+    Stored tickets are copies: a ticket changed in place must be written back with
+    `repository[ticket_id] = ticket` for the change to be persisted and indexed.
+
+    The async methods do not block the event loop. By default they run the blocking methods in a
+    worker thread, backends with an async driver override them.
+    """
+
+    async def aget(self, ticket_id: str) -> SupportTicket | None:
+        """Async version of `get`"""
+        return await asyncio.to_thread(self.get, ticket_id)
+
+    async def aset(self, ticket_id: str, ticket: SupportTicket) -> None:
+        """Async version of `repository[ticket_id] = ticket`"""
+        await asyncio.to_thread(self.__setitem__, ticket_id, ticket)
+
+    @abstractmethod
+    def search(
+        self,
+        query: str | None = None,
+        department_code: str | None = None,
+        priority: TicketPriority | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> tuple[list[SupportTicket], int]:
+        """
+        Find tickets by text and filters.
+        Args:
+            query (str|None): Full-text query, tickets matching any of its terms are returned best match first.
+                If None, tickets are returned in insertion order.
+            department_code (str|None): Only include tickets of this department.
+            priority (TicketPriority|None): Only include tickets with this priority.
+            offset (int): Number of matching tickets to skip.
+            limit (int|None): Maximum number of tickets to return. If None, all matches are returned.
+        Returns:
+            tuple[list[SupportTicket], int]: The requested tickets and the total number of matches.
+        """
+
+    async def asearch(
+        self,
+        query: str | None = None,
+        department_code: str | None = None,
+        priority: TicketPriority | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> tuple[list[SupportTicket], int]:
+        """Async version of `search`"""
+        return await asyncio.to_thread(self.search, query, department_code, priority, offset, limit)
+
+
+class ActionItemRepository(MutableMapping[str, ActionItem]):
+    """
+    Storage of action items by ID, indexed by their parent ticket.
+
+    Stored action items are copies: an action item changed in place must be written back with
+    `repository[action_id] = action_item` for the change to be persisted.
+
+    The async methods do not block the event loop. By default they run the blocking methods in a
+    worker thread, backends with an async driver override them.
+    """
+
+    async def aget(self, action_id: str) -> ActionItem | None:
+        """Async version of `get`"""
+        return await asyncio.to_thread(self.get, action_id)
+
+    async def aset(self, action_id: str, action_item: ActionItem) -> None:
+        """Async version of `repository[action_id] = action_item`"""
+        await asyncio.to_thread(self.__setitem__, action_id, action_item)
+
+    @abstractmethod
+    def list_for_ticket(
+        self,
+        ticket_id: str,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> tuple[list[ActionItem], int]:
+        """
+        List the action items of a ticket in creation order.
+        Args:
+            ticket_id (str): The parent ticket ID.
+            offset (int): Number of action items to skip.
+            limit (int|None): Maximum number of action items to return. If None, all are returned.
+        Returns:
+            tuple[list[ActionItem], int]: The requested action items and the total number of action items of the ticket.
+        """
+
+    async def alist_for_ticket(
+        self,
+        ticket_id: str,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> tuple[list[ActionItem], int]:
+        """Async version of `list_for_ticket`"""
+        return await asyncio.to_thread(self.list_for_ticket, ticket_id, offset, limit)
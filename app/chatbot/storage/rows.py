@@ -0,0 +1,109 @@
+"""
+Conversion of tickets and action items to and from database rows, shared by the SQL backends.
+Timestamps are accepted either as datetime objects or as ISO 8601 strings.
+"""
+
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+
+from app.chatbot.data_models.ticket_models import (
+    ActionItem,
+    ActionItemStatus,
+    SupportTicket,
+    TicketPriority,
+    TicketWorkflowType,
+)
+
+TICKET_COLUMNS = (
+    "ticket_id",
+    "title",
+    "department_code",
+    "priority",
+    "workflow_type",
+    "description",
+    "expected_outcome",
+    "resolution",
+    "customer_visible",
+    "created_at",
+    "updated_at",
+)
+
+ACTION_ITEM_COLUMNS = (
+    "action_id",
+    "parent_ticket_id",
+    "title",
+    "assignee",
+    "status",
+    "due_date",
+    "created_at",
+    "updated_at",
+)
+
+
+def _to_datetime(value: datetime | str | None) -> datetime | None:
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+
+def ticket_to_row(ticket: SupportTicket) -> tuple[Any, ...]:
+    """The column values of a ticket, in TICKET_COLUMNS order"""
+    return (
+        ticket.ticket_id,
+        ticket.title,
+        ticket.department_code,
+        ticket.priority.value,
+        ticket.workflow_type.value,
+        ticket.description,
+        ticket.expected_outcome,
+        ticket.resolution,
+        ticket.customer_visible,
+        ticket.created_at,
+        ticket.updated_at,
+    )
+
+
+def ticket_from_row(row: Sequence[Any]) -> SupportTicket:
+    """Create a ticket from column values in TICKET_COLUMNS order"""
+    return SupportTicket(
+        ticket_id=row[0],
+        title=row[1],
+        department_code=row[2],
+        priority=TicketPriority(row[3]),
+        workflow_type=TicketWorkflowType(row[4]),
+        description=row[5],
+        expected_outcome=row[6],
+        resolution=row[7],
+        customer_visible=bool(row[8]),
+        created_at=_to_datetime(row[9]),
+        updated_at=_to_datetime(row[10]),
+    )
+
+
+def action_item_to_row(action_item: ActionItem) -> tuple[Any, ...]:
+    """The column values of an action item, in ACTION_ITEM_COLUMNS order"""
+    return (
+        action_item.action_id,
+        action_item.parent_ticket_id,
+        action_item.title,
+        action_item.assignee,
+        action_item.status.value,
+        action_item.due_date,
+        action_item.created_at,
+        action_item.updated_at,
+    )
+
+
+def action_item_from_row(row: Sequence[Any]) -> ActionItem:
+    """Create an action item from column values in ACTION_ITEM_COLUMNS order"""
+    return ActionItem(
+        action_id=row[0],
+        parent_ticket_id=row[1],
+        title=row[2],
+        assignee=row[3],
+        status=ActionItemStatus(row[4]),
+        due_date=_to_datetime(row[5]),
+        created_at=_to_datetime(row[6]),
+        updated_at=_to_datetime(row[7]),
+    )
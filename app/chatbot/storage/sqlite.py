@@ -0,0 +1,235 @@
+import logging
+import sqlite3
+import threading
+from collections.abc import Iterator, Sequence
+from datetime import datetime
+from typing import Any
+
+from app.chatbot.data_models.ticket_models import (
+    ActionItem,
+    SupportTicket,
+    TicketPriority,
+)
+from app.chatbot.data_models.ticket_search_index import tokenize
+from app.chatbot.storage.repository import ActionItemRepository, TicketRepository
+from app.chatbot.storage.rows import (
+    ACTION_ITEM_COLUMNS,
+    TICKET_COLUMNS,
+    action_item_from_row,
+    action_item_to_row,
+    ticket_from_row,
+    ticket_to_row,
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tickets (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    ticket_id TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    department_code TEXT NOT NULL,
+    priority TEXT NOT NULL,
+    workflow_type TEXT NOT NULL,
+    description TEXT NOT NULL,
+    expected_outcome TEXT NOT NULL,
+    resolution TEXT,
+    customer_visible INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT,
+    updated_at TEXT
+);
+CREATE INDEX IF NOT EXISTS tickets_department_priority_idx ON tickets (department_code, priority);
+CREATE INDEX IF NOT EXISTS tickets_priority_idx ON tickets (priority);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS tickets_fts USING fts5(
+    title, description, expected_outcome, content='tickets', content_rowid='seq'
+);
+CREATE TRIGGER IF NOT EXISTS tickets_fts_insert AFTER INSERT ON tickets BEGIN
+    INSERT INTO tickets_fts (rowid, title, description, expected_outcome)
+    VALUES (new.seq, new.title, new.description, new.expected_outcome);
+END;
+CREATE TRIGGER IF NOT EXISTS tickets_fts_delete AFTER DELETE ON tickets BEGIN
+    INSERT INTO tickets_fts (tickets_fts, rowid, title, description, expected_outcome)
+    VALUES ('delete', old.seq, old.title, old.description, old.expected_outcome);
+END;
+CREATE TRIGGER IF NOT EXISTS tickets_fts_update AFTER UPDATE ON tickets BEGIN
+    INSERT INTO tickets_fts (tickets_fts, rowid, title, description, expected_outcome)
+    VALUES ('delete', old.seq, old.title, old.description, old.expected_outcome);
+    INSERT INTO tickets_fts (rowid, title, description, expected_outcome)
+    VALUES (new.seq, new.title, new.description, new.expected_outcome);
+END;
+
+CREATE TABLE IF NOT EXISTS action_items (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    action_id TEXT NOT NULL UNIQUE,
+    parent_ticket_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    assignee TEXT NOT NULL,
+    status TEXT NOT NULL,
+    due_date TEXT,
+    created_at TEXT,
+    updated_at TEXT
+);
+CREATE INDEX IF NOT EXISTS action_items_parent_idx ON action_items (parent_ticket_id, seq);
+"""
+
+
+def _upsert_statement(table: str, columns: Sequence[str]) -> str:
+    updates = ", ".join(f"{column} = excluded.{column}" for column in columns[1:])
+    return (
+        f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)}) "
+        f"ON CONFLICT ({columns[0]}) DO UPDATE SET {updates}"
+    )
+
+
+def _to_sqlite(row: tuple[Any, ...]) -> tuple[Any, ...]:
+    """Store timestamps as ISO 8601 text"""
+    return tuple(value.isoformat() if isinstance(value, datetime) else value for value in row)
+
+
+class SQLiteDatabase:
+    """
+    A SQLite database file shared by the ticket and action item repositories.
+
+    The database runs in WAL mode so that several UI worker processes can use the same file.
+    A single connection is shared by all threads of a process and serialized with a lock.
+    """
+
+    def __init__(self, path: str, busy_timeout_seconds: float = 5.0):
+        self.path = path
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(
+            path,
+            timeout=busy_timeout_seconds,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(_SCHEMA)
+        logging.info(f"SQLite storage initialized: {path}")
+
+    def execute(self, sql: str, parameters: Sequence[Any] = ()) -> list[tuple[Any, ...]]:
+        """Run a statement and return all result rows"""
+        with self._lock:
+            return self._connection.execute(sql, parameters).fetchall()
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class SQLiteTicketRepository(TicketRepository):
+    """Tickets stored in SQLite, searched with an FTS5 full-text index ranked by BM25"""
+
+    _SELECT = f"SELECT {', '.join(f't.{column}' for column in TICKET_COLUMNS)}"
+    _UPSERT = _upsert_statement("tickets", TICKET_COLUMNS)
+
+    def __init__(self, database: SQLiteDatabase):
+        self._db = database
+
+    def __getitem__(self, ticket_id: str) -> SupportTicket:
+        rows = self._db.execute(f"{self._SELECT} FROM tickets t WHERE t.ticket_id = ?", (ticket_id,))
+        if not rows:
+            raise KeyError(ticket_id)
+        return ticket_from_row(rows[0])
+
+    def __setitem__(self, ticket_id: str, ticket: SupportTicket) -> None:
+        self._db.execute(self._UPSERT, _to_sqlite(ticket_to_row(ticket)))
+
+    def __delitem__(self, ticket_id: str) -> None:
+        if not self._db.execute("DELETE FROM tickets WHERE ticket_id = ? RETURNING seq", (ticket_id,)):
+            raise KeyError(ticket_id)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter([row[0] for row in self._db.execute("SELECT ticket_id FROM tickets ORDER BY seq")])
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM tickets")[0][0]
+
+    def __contains__(self, ticket_id: object) -> bool:
+        return bool(self._db.execute("SELECT 1 FROM tickets WHERE ticket_id = ?", (ticket_id,)))
+
+    def search(
+        self,
+        query: str | None = None,
+        department_code: str | None = None,
+        priority: TicketPriority | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> tuple[list[SupportTicket], int]:
+        conditions: list[str] = []
+        parameters: list[Any] = []
+
+        if query:
+            terms = tokenize(query)
+            if not terms:
+                return [], 0
+            # Match any of the terms, also as a prefix (e.g. "print" matches "printer")
+            source = "tickets_fts JOIN tickets t ON t.seq = tickets_fts.rowid"
+            conditions.append("tickets_fts MATCH ?")
+            parameters.append(" OR ".join(f'"{term}"*' for term in terms))
+            order = "bm25(tickets_fts), t.seq"
+        else:
+            source = "tickets t"
+            order = "t.seq"
+
+        # Filters are answered by the department and priority indexes
+        if department_code:
+            conditions.append("t.department_code = ?")
+            parameters.append(department_code)
+        if priority:
+            conditions.append("t.priority = ?")
+            parameters.append(priority.value)
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        rows = self._db.execute(
+            f"{self._SELECT} FROM {source} {where} ORDER BY {order} LIMIT ? OFFSET ?",
+            (*parameters, -1 if limit is None else limit, offset),
+        )
+        total_count = self._db.execute(f"SELECT COUNT(*) FROM {source} {where}", parameters)[0][0]
+        return [ticket_from_row(row) for row in rows], total_count
+
+
+class SQLiteActionItemRepository(ActionItemRepository):
+    """Action items stored in SQLite, indexed by their parent ticket"""
+
+    _SELECT = f"SELECT {', '.join(ACTION_ITEM_COLUMNS)}"
+    _UPSERT = _upsert_statement("action_items", ACTION_ITEM_COLUMNS)
+
+    def __init__(self, database: SQLiteDatabase):
+        self._db = database
+
+    def __getitem__(self, action_id: str) -> ActionItem:
+        rows = self._db.execute(f"{self._SELECT} FROM action_items WHERE action_id = ?", (action_id,))
+        if not rows:
+            raise KeyError(action_id)
+        return action_item_from_row(rows[0])
+
+    def __setitem__(self, action_id: str, action_item: ActionItem) -> None:
+        self._db.execute(self._UPSERT, _to_sqlite(action_item_to_row(action_item)))
+
+    def __delitem__(self, action_id: str) -> None:
+        if not self._db.execute("DELETE FROM action_items WHERE action_id = ? RETURNING seq", (action_id,)):
+            raise KeyError(action_id)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter([row[0] for row in self._db.execute("SELECT action_id FROM action_items ORDER BY seq")])
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM action_items")[0][0]
+
+    def __contains__(self, action_id: object) -> bool:
+        return bool(self._db.execute("SELECT 1 FROM action_items WHERE action_id = ?", (action_id,)))
+
+    def list_for_ticket(
+        self,
+        ticket_id: str,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> tuple[list[ActionItem], int]:
+        rows = self._db.execute(
+            f"{self._SELECT} FROM action_items WHERE parent_ticket_id = ? ORDER BY seq LIMIT ? OFFSET ?",
+            (ticket_id, -1 if limit is None else limit, offset),
+        )
+        total_count = self._db.execute(
+            "SELECT COUNT(*) FROM action_items WHERE parent_ticket_id = ?", (ticket_id,)
+        )[0][0]
+        return [action_item_from_row(row) for row in rows], total_count
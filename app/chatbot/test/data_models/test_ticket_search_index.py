@@ -0,0 +1,60 @@
+import unittest
+
+from app.chatbot.data_models.ticket_search_index import TicketSearchIndex, tokenize
+
+
+class TestTicketSearchIndex(unittest.TestCase):
+    """Test cases for the Ticket Search Index"""
+
+    def setUp(self):
+        """Set up the test environment before each test method"""
+        self.index = TicketSearchIndex()
+        self.index.add("TKT-1", "Printer not working on the third floor")
+        self.index.add("TKT-2", "Printer jam, printer shows error, printer offline")
+        self.index.add("TKT-3", "VPN connection drops every hour")
+
+    def test_tokenize(self):
+        """Test that text is split into lowercase alphanumeric tokens"""
+        self.assertEqual(tokenize("VPN-Client v2.0 FAILS!"), ["vpn", "client", "v2", "0", "fails"])
+
+    def test_search_ranks_by_relevance(self):
+        """Test that documents with more occurrences of the query terms rank higher"""
+        results = self.index.search("printer")
+
+        self.assertEqual([ticket_id for ticket_id, _ in results], ["TKT-2", "TKT-1"])
+        self.assertGreater(results[0][1], results[1][1])
+
+    def test_search_matches_any_term(self):
+        """Test that a document matching any of the query terms is returned"""
+        results = self.index.search("vpn floor")
+
+        self.assertEqual({ticket_id for ticket_id, _ in results}, {"TKT-1", "TKT-3"})
+
+    def test_search_expands_prefixes(self):
+        """Test that unknown query terms match indexed terms they are a prefix of"""
+        results = self.index.search("print")
+
+        self.assertEqual({ticket_id for ticket_id, _ in results}, {"TKT-1", "TKT-2"})
+
+    def test_search_with_limit_and_candidates(self):
+        """Test restricting the search to candidate documents and limiting the results"""
+        self.assertEqual(len(self.index.search("printer", limit=1)), 1)
+        self.assertEqual(
+            [ticket_id for ticket_id, _ in self.index.search("printer", ticket_ids={"TKT-1"})],
+            ["TKT-1"],
+        )
+
+    def test_documents_are_updated_incrementally(self):
+        """Test that replacing and removing documents updates the postings"""
+        self.index.add("TKT-3", "Printer toner is empty")
+        self.index.remove("TKT-1")
+
+        self.assertEqual(self.index.search("vpn"), [])
+        self.assertEqual(
+            {ticket_id for ticket_id, _ in self.index.search("printer")}, {"TKT-2", "TKT-3"}
+        )
+        self.assertEqual(len(self.index), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+
+from app.chatbot.data_models.ticket_models import (
+    SupportTicket,
+    TicketPriority,
+    TicketWorkflowType,
+)
+from app.chatbot.data_models.ticket_store import TicketStore
+
+
+def _ticket(ticket_id: str, department_code: str, priority: TicketPriority, title: str) -> SupportTicket:
+    return SupportTicket(
+        ticket_id=ticket_id,
+        title=title,
+        department_code=department_code,
+        priority=priority,
+        workflow_type=TicketWorkflowType.STANDARD,
+        description="",
+        expected_outcome="",
+    )
+
+
+class TestTicketStore(unittest.TestCase):
+    """Test cases for the Ticket Store"""
+
+    def setUp(self):
+        """Set up the test environment before each test method"""
+        self.store = TicketStore(
+            {
+                "TKT-1": _ticket("TKT-1", "IT", TicketPriority.HIGH, "Printer offline"),
+                "TKT-2": _ticket("TKT-2", "IT", TicketPriority.LOW, "Printer toner low"),
+                "TKT-3": _ticket("TKT-3", "HR", TicketPriority.HIGH, "Payroll printer access"),
+            }
+        )
+
+    def test_filter_ids(self):
+        """Test that filters are answered from the secondary indexes"""
+        self.assertIsNone(self.store.filter_ids())
+        self.assertEqual(list(self.store.filter_ids(department_code="IT") or []), ["TKT-1", "TKT-2"])
+        self.assertEqual(list(self.store.filter_ids(priority=TicketPriority.HIGH) or []), ["TKT-1", "TKT-3"])
+        self.assertEqual(
+            list(self.store.filter_ids(department_code="IT", priority=TicketPriority.HIGH) or []),
+            ["TKT-1"],
+        )
+        self.assertEqual(list(self.store.filter_ids(department_code="FIN") or []), [])
+
+    def test_reindex_after_in_place_update(self):
+        """Test that a ticket moves between index buckets when it is changed in place"""
+        self.store["TKT-2"].priority = TicketPriority.HIGH
+        self.store.reindex("TKT-2")
+
+        self.assertEqual(list(self.store.filter_ids(priority=TicketPriority.LOW) or []), [])
+        self.assertEqual(
+            set(self.store.filter_ids(department_code="IT", priority=TicketPriority.HIGH) or []),
+            {"TKT-1", "TKT-2"},
+        )
+
+    def test_delete_removes_from_indexes(self):
+        """Test that deleted tickets are no longer returned by filters or search"""
+        del self.store["TKT-1"]
+
+        self.assertEqual(list(self.store.filter_ids(department_code="IT") or []), ["TKT-2"])
+        self.assertEqual(self.store.search("offline"), [])
+
+    def test_search_within_filtered_ids(self):
+        """Test that text search is restricted to the filtered tickets"""
+        ticket_ids = self.store.filter_ids(priority=TicketPriority.HIGH)
+
+        results = self.store.search("printer", ticket_ids=ticket_ids)
+
+        self.assertEqual({ticket.ticket_id for ticket in results}, {"TKT-1", "TKT-3"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,18 +5,17 @@ from app.chatbot.plugins.support_ticket_system.action_item_plugin import (
     ActionItemPlugin,
 )
 from app.chatbot.data_models.ticket_models import ActionItem, ActionItemStatus
+from app.chatbot.storage.memory import InMemoryActionItemRepository
 
 # Disabling the pyright error for private usage in this test file
 # pyright: reportPrivateUsage=false
-class TestActionItemPlugin(unittest.TestCase):
+class TestActionItemPlugin(unittest.IsolatedAsyncioTestCase):
     """Test cases for the Action Item Plugin"""
 
     def setUp(self):
         """Set up the test environment before each test method"""
-        self.plugin = ActionItemPlugin()
         # For testing, ensure we have clean storage
-        self.plugin._action_items = {}
-        self.plugin._ticket_to_actions = {}
+        self.plugin = ActionItemPlugin(InMemoryActionItemRepository())
 
         # Create a sample action item for testing
         self.sample_action_item = ActionItem(
@@ -30,11 +29,10 @@ class TestActionItemPlugin(unittest.TestCase):
         self.plugin._action_items[self.sample_action_item.action_id] = (
             self.sample_action_item
         )
-        self.plugin._ticket_to_actions["TKT-TEST123"] = ["ACT-TEST123"]
 
-    def test_create_action_item(self):
+    async def test_create_action_item(self):
         """Test creating a new action item"""
-        result = self.plugin.create_action_item(
+        result = await self.plugin.create_action_item(
             parent_ticket_id="TKT-TEST456",
             title="New Test Action Item",
             assignee="John Doe",
@@ -61,13 +59,13 @@ class TestActionItemPlugin(unittest.TestCase):
         if action_item.due_date:
             self.assertEqual(action_item.due_date.isoformat().split("T")[0], "2025-06-01")
 
-        # Verify the ticket-to-actions mapping was updated
-        self.assertIn("TKT-TEST456", self.plugin._ticket_to_actions)
-        self.assertIn(action_id, self.plugin._ticket_to_actions["TKT-TEST456"])
+        # Verify the action item is indexed by its ticket
+        ticket_action_items, _ = self.plugin._action_items.list_for_ticket("TKT-TEST456")
+        self.assertIn(action_id, [item.action_id for item in ticket_action_items])
 
-    def test_get_action_item(self):
+    async def test_get_action_item(self):
         """Test retrieving an action item by ID"""
-        result = self.plugin.get_action_item(action_id="ACT-TEST123")
+        result = await self.plugin.get_action_item(action_id="ACT-TEST123")
 
         # Check that the action item is returned correctly
         self.assertEqual(result["action_id"], "ACT-TEST123")
@@ -77,16 +75,16 @@ class TestActionItemPlugin(unittest.TestCase):
         self.assertEqual(result["status"], "Open")
         self.assertTrue("due_date" in result)
 
-    def test_get_nonexistent_action_item(self):
+    async def test_get_nonexistent_action_item(self):
         """Test retrieving an action item that doesn't exist"""
-        result = self.plugin.get_action_item(action_id="ACT-NONEXISTENT")
+        result = await self.plugin.get_action_item(action_id="ACT-NONEXISTENT")
 
         # Check that an error is returned
         self.assertIn("error", result)
 
-    def test_update_action_item_status(self):
+    async def test_update_action_item_status(self):
         """Test updating the status of an action item"""
-        result = self.plugin.update_action_item_status(
+        result = await self.plugin.update_action_item_status(
             action_id="ACT-TEST123", status="In Progress"
         )
 
@@ -99,9 +97,9 @@ class TestActionItemPlugin(unittest.TestCase):
         updated_action = self.plugin._action_items["ACT-TEST123"]
         self.assertEqual(updated_action.status, ActionItemStatus.IN_PROGRESS)
 
-    def test_update_action_item_with_invalid_status(self):
+    async def test_update_action_item_with_invalid_status(self):
         """Test updating an action item with invalid status"""
-        result = self.plugin.update_action_item_status(
+        result = await self.plugin.update_action_item_status(
             action_id="ACT-TEST123",
             status="InvalidStatus",  # This is invalid
         )
@@ -109,9 +107,9 @@ class TestActionItemPlugin(unittest.TestCase):
         # Check that an error is returned
         self.assertIn("error", result)
 
-    def test_update_action_item(self):
+    async def test_update_action_item(self):
         """Test updating multiple fields of an action item"""
-        result = self.plugin.update_action_item(
+        result = await self.plugin.update_action_item(
             action_id="ACT-TEST123",
             title="Updated Action Item Title",
             assignee="Jane Smith",
@@ -135,7 +133,16 @@ class TestActionItemPlugin(unittest.TestCase):
                 updated_action.due_date.isoformat().split("T")[0], "2025-07-01"
             )
 
-    def test_get_ticket_action_items(self):
+    async def test_update_action_item_with_invalid_status_changes_no_field(self):
+        """Test that an update with an invalid status changes no field"""
+        result = await self.plugin.update_action_item(
+            action_id="ACT-TEST123", title="Renamed action item", status="InvalidStatus"
+        )
+
+        self.assertIn("error", result)
+        self.assertEqual(self.plugin._action_items["ACT-TEST123"].title, "Test Action Item")
+
+    async def test_get_ticket_action_items(self):
         """Test retrieving all action items for a specific ticket"""
         # Add another action item for the same ticket
         second_action = ActionItem(
@@ -146,10 +153,9 @@ class TestActionItemPlugin(unittest.TestCase):
             status=ActionItemStatus.IN_PROGRESS,
         )
         self.plugin._action_items[second_action.action_id] = second_action
-        self.plugin._ticket_to_actions["TKT-TEST123"].append("ACT-TEST456")
 
         # Test retrieving action items for the ticket
-        result = self.plugin.get_ticket_action_items(ticket_id="TKT-TEST123")
+        result = await self.plugin.get_ticket_action_items(ticket_id="TKT-TEST123")
 
         # Check that both action items are returned
         self.assertEqual(result["count"], 2)
@@ -157,9 +163,23 @@ class TestActionItemPlugin(unittest.TestCase):
         self.assertIn("ACT-TEST123", action_ids)
         self.assertIn("ACT-TEST456", action_ids)
 
-    def test_get_action_items_for_nonexistent_ticket(self):
+        # Test pagination and projection
+        first_page = await self.plugin.get_ticket_action_items(
+            ticket_id="TKT-TEST123", page_size=1, fields=["status"]
+        )
+        self.assertEqual(first_page["count"], 1)
+        self.assertEqual(first_page["total_count"], 2)
+        self.assertEqual(first_page["action_items"], [{"action_id": "ACT-TEST123", "status": "Open"}])
+
+        second_page = await self.plugin.get_ticket_action_items(
+            ticket_id="TKT-TEST123", page_size=1, cursor=first_page["next_cursor"]
+        )
+        self.assertEqual(second_page["action_items"][0]["action_id"], "ACT-TEST456")
+        self.assertIsNone(second_page["next_cursor"])
+
+    async def test_get_action_items_for_nonexistent_ticket(self):
         """Test retrieving action items for a ticket that has none"""
-        result = self.plugin.get_ticket_action_items(ticket_id="TKT-NONEXISTENT")
+        result = await self.plugin.get_ticket_action_items(ticket_id="TKT-NONEXISTENT")
 
         # Check that an empty list is returned
         self.assertEqual(result["count"], 0)
@@ -5,16 +5,16 @@ from app.chatbot.plugins.support_ticket_system.reference_data_plugin import (
 )
 
 
-class TestReferenceDataPlugin(unittest.TestCase):
+class TestReferenceDataPlugin(unittest.IsolatedAsyncioTestCase):
     """Test cases for the Reference Data Plugin"""
 
     def setUp(self):
         """Set up the test environment before each test method"""
         self.plugin = ReferenceDataPlugin()
 
-    def test_get_departments(self):
+    async def test_get_departments(self):
         """Test retrieving all departments"""
-        result = self.plugin.get_departments()
+        result = await self.plugin.get_departments()
 
         # Check the structure of the response
         self.assertIn("departments", result)
@@ -29,26 +29,26 @@ class TestReferenceDataPlugin(unittest.TestCase):
             self.assertIn("name", dept)
             self.assertIn("description", dept)
 
-    def test_get_department_by_code(self):
+    async def test_get_department_by_code(self):
         """Test retrieving a specific department by its code"""
         # Test with a valid department code
-        result = self.plugin.get_department_by_code(department_code="IT")
+        result = await self.plugin.get_department_by_code(department_code="IT")
 
         # Check that the department info is returned correctly
         self.assertEqual(result["code"], "IT")
         self.assertEqual(result["name"], "Information Technology")
         self.assertIn("description", result)
 
-    def test_get_nonexistent_department(self):
+    async def test_get_nonexistent_department(self):
         """Test retrieving a department that doesn't exist"""
-        result = self.plugin.get_department_by_code(department_code="NONEXISTENT")
+        result = await self.plugin.get_department_by_code(department_code="NONEXISTENT")
 
         # Check that an error is returned
         self.assertIn("error", result)
 
-    def test_get_priority_levels(self):
+    async def test_get_priority_levels(self):
         """Test retrieving all priority levels"""
-        result = self.plugin.get_priority_levels()
+        result = await self.plugin.get_priority_levels()
 
         # Check the structure of the response
         self.assertIn("priority_levels", result)
@@ -69,9 +69,9 @@ class TestReferenceDataPlugin(unittest.TestCase):
         self.assertIn("High", priority_values)
         self.assertIn("Critical", priority_values)
 
-    def test_get_workflow_types(self):
+    async def test_get_workflow_types(self):
         """Test retrieving all workflow types"""
-        result = self.plugin.get_workflow_types()
+        result = await self.plugin.get_workflow_types()
 
         # Check the structure of the response
         self.assertIn("workflow_types", result)
@@ -90,9 +90,9 @@ class TestReferenceDataPlugin(unittest.TestCase):
         self.assertIn("Standard", workflow_values)
         self.assertIn("Expedited", workflow_values)
 
-    def test_get_action_item_statuses(self):
+    async def test_get_action_item_statuses(self):
         """Test retrieving all action item statuses"""
-        result = self.plugin.get_action_item_statuses()
+        result = await self.plugin.get_action_item_statuses()
 
         # Check the structure of the response
         self.assertIn("action_item_statuses", result)
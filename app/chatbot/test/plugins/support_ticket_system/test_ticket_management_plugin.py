@@ -8,17 +8,17 @@ from app.chatbot.data_models.ticket_models import (
     TicketPriority,
     TicketWorkflowType,
 )
+from app.chatbot.storage.memory import InMemoryTicketRepository
 
 # Disabling the pyright error for private usage in this test file
 # pyright: reportPrivateUsage=false
-class TestTicketManagementPlugin(unittest.TestCase):
+class TestTicketManagementPlugin(unittest.IsolatedAsyncioTestCase):
     """Test cases for the Ticket Management Plugin"""
 
     def setUp(self):
         """Set up the test environment before each test method"""
-        self.plugin = TicketManagementPlugin()
         # For testing, ensure we have a clean ticket storage
-        self.plugin._tickets = {}
+        self.plugin = TicketManagementPlugin(InMemoryTicketRepository())
 
         # Create a sample ticket for testing
         self.sample_ticket = SupportTicket(
@@ -33,9 +33,9 @@ class TestTicketManagementPlugin(unittest.TestCase):
         )
         self.plugin._tickets[self.sample_ticket.ticket_id] = self.sample_ticket
 
-    def test_create_support_ticket(self):
+    async def test_create_support_ticket(self):
         """Test creating a new support ticket"""
-        result = self.plugin.create_support_ticket(
+        result = await self.plugin.create_support_ticket(
             title="New Test Ticket",
             department_code="HR",
             priority="High",
@@ -64,9 +64,9 @@ class TestTicketManagementPlugin(unittest.TestCase):
         self.assertEqual(ticket.expected_outcome, "Expected resolution")
         self.assertTrue(ticket.customer_visible)
 
-    def test_create_support_ticket_with_invalid_priority(self):
+    async def test_create_support_ticket_with_invalid_priority(self):
         """Test creating a ticket with invalid priority value"""
-        result = self.plugin.create_support_ticket(
+        result = await self.plugin.create_support_ticket(
             title="Invalid Priority Ticket",
             department_code="IT",
             priority="InvalidPriority",  # This is invalid
@@ -78,9 +78,9 @@ class TestTicketManagementPlugin(unittest.TestCase):
         # Check that an error is returned
         self.assertIn("error", result)
 
-    def test_get_support_ticket(self):
+    async def test_get_support_ticket(self):
         """Test retrieving a support ticket by ID"""
-        result = self.plugin.get_support_ticket(ticket_id="TKT-TEST123")
+        result = await self.plugin.get_support_ticket(ticket_id="TKT-TEST123")
 
         # Check that the ticket is returned correctly
         self.assertEqual(result["ticket_id"], "TKT-TEST123")
@@ -88,16 +88,16 @@ class TestTicketManagementPlugin(unittest.TestCase):
         self.assertEqual(result["department"], "IT")
         self.assertEqual(result["priority"], "Medium")
 
-    def test_get_nonexistent_ticket(self):
+    async def test_get_nonexistent_ticket(self):
         """Test retrieving a ticket that doesn't exist"""
-        result = self.plugin.get_support_ticket(ticket_id="TKT-NONEXISTENT")
+        result = await self.plugin.get_support_ticket(ticket_id="TKT-NONEXISTENT")
 
         # Check that an error is returned
         self.assertIn("error", result)
 
-    def test_update_support_ticket(self):
+    async def test_update_support_ticket(self):
         """Test updating an existing support ticket"""
-        result = self.plugin.update_support_ticket(
+        result = await self.plugin.update_support_ticket(
             ticket_id="TKT-TEST123",
             title="Updated Test Ticket",
             priority="High",
@@ -118,7 +118,17 @@ class TestTicketManagementPlugin(unittest.TestCase):
         self.assertEqual(updated_ticket.expected_outcome, "Successful test completion")
         self.assertEqual(updated_ticket.department_code, "IT")
 
-    def test_search_tickets(self):
+    async def test_update_support_ticket_with_invalid_priority(self):
+        """Test that an update with an invalid priority changes no field"""
+        result = await self.plugin.update_support_ticket(
+            ticket_id="TKT-TEST123", title="Renamed ticket", priority="Urgent"
+        )
+
+        self.assertIn("error", result)
+        self.assertEqual(self.plugin._tickets["TKT-TEST123"].title, "Test Support Ticket")
+        self.assertEqual((await self.plugin.search_tickets(search_query="renamed"))["count"], 0)
+
+    async def test_search_tickets(self):
         """Test searching for tickets based on criteria"""
         # Add another ticket with different department and priority for testing search
         second_ticket = SupportTicket(
@@ -134,25 +144,71 @@ class TestTicketManagementPlugin(unittest.TestCase):
         self.plugin._tickets[second_ticket.ticket_id] = second_ticket
 
         # Test search by department
-        dept_result = self.plugin.search_tickets(department_code="IT")
+        dept_result = await self.plugin.search_tickets(department_code="IT")
         self.assertEqual(dept_result["count"], 1)
         self.assertEqual(dept_result["tickets"][0]["ticket_id"], "TKT-TEST123")
 
         # Test search by priority
-        priority_result = self.plugin.search_tickets(priority="High")
+        priority_result = await self.plugin.search_tickets(priority="High")
         self.assertEqual(priority_result["count"], 1)
         self.assertEqual(priority_result["tickets"][0]["ticket_id"], "TKT-TEST456")
 
         # Test search by text
-        text_result = self.plugin.search_tickets(search_query="another")
+        text_result = await self.plugin.search_tickets(search_query="another")
         self.assertEqual(text_result["count"], 1)
         self.assertEqual(text_result["tickets"][0]["ticket_id"], "TKT-TEST456")
 
         # Test search with no results
-        no_result = self.plugin.search_tickets(search_query="nonexistent")
+        no_result = await self.plugin.search_tickets(search_query="nonexistent")
         self.assertEqual(no_result["count"], 0)
         self.assertEqual(len(no_result["tickets"]), 0)
 
+    async def test_search_tickets_ranked_and_paginated(self):
+        """Test that text search results are ranked by relevance and paginated"""
+        await self.plugin.create_support_ticket(
+            title="Printer offline",
+            department_code="IT",
+            priority="Low",
+            workflow_type="Standard",
+            description="The printer is offline, restarting the printer did not help",
+            expected_outcome="Printer back online",
+        )
+
+        result = await self.plugin.search_tickets(search_query="printer test", page_size=1)
+
+        self.assertEqual(result["count"], 1)
+        self.assertEqual(result["total_count"], 2)
+        self.assertEqual(result["tickets"][0]["title"], "Printer offline")
+
+        # Continue with the next page
+        next_page = await self.plugin.search_tickets(
+            search_query="printer test", page_size=1, cursor=result["next_cursor"]
+        )
+        self.assertEqual([t["ticket_id"] for t in next_page["tickets"]], ["TKT-TEST123"])
+        self.assertIsNone(next_page["next_cursor"])
+
+    async def test_search_tickets_with_projection(self):
+        """Test that only the requested ticket fields are returned"""
+        result = await self.plugin.search_tickets(fields=["title", "priority"])
+
+        self.assertEqual(
+            result["tickets"],
+            [{"ticket_id": "TKT-TEST123", "title": "Test Support Ticket", "priority": "Medium"}],
+        )
+
+        # Test with unknown fields and invalid cursors
+        self.assertIn("error", await self.plugin.search_tickets(fields=["secret"]))
+        self.assertIn("error", await self.plugin.search_tickets(cursor="not-a-cursor"))
+
+    async def test_search_tickets_after_update(self):
+        """Test that updated ticket text is searchable"""
+        await self.plugin.update_support_ticket(
+            ticket_id="TKT-TEST123", description="Keyboard is missing keys"
+        )
+
+        self.assertEqual((await self.plugin.search_tickets(search_query="keyboard"))["count"], 1)
+        self.assertEqual((await self.plugin.search_tickets(search_query="description"))["count"], 0)
+
 
 if __name__ == "__main__":
     unittest.main()
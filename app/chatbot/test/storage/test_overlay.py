@@ -0,0 +1,211 @@
+import asyncio
+import unittest
+from datetime import datetime
+
+from app.chatbot.data_models.ticket_models import (
+    ActionItem,
+    SupportTicket,
+    TicketPriority,
+    TicketWorkflowType,
+)
+from app.chatbot.storage.backends import Storage, create_session_storage
+from app.chatbot.storage.memory import InMemoryActionItemRepository, InMemoryTicketRepository
+from app.chatbot.storage.sqlite import (
+    SQLiteActionItemRepository,
+    SQLiteDatabase,
+    SQLiteTicketRepository,
+)
+
+
+def _ticket(ticket_id: str, title: str) -> SupportTicket:
+    return SupportTicket(
+        ticket_id=ticket_id,
+        title=title,
+        department_code="IT",
+        priority=TicketPriority.HIGH,
+        workflow_type=TicketWorkflowType.STANDARD,
+        description=f"{title} reported by a user",
+        expected_outcome="Issue resolved",
+        created_at=datetime(2025, 1, 1, 12, 0),
+    )
+
+
+def _action_item(action_id: str, ticket_id: str) -> ActionItem:
+    return ActionItem(action_id=action_id, parent_ticket_id=ticket_id, title=f"Action {action_id}", assignee="Support")
+
+
+class RecordingTicketRepository(InMemoryTicketRepository):
+    """An in-memory repository recording the limits of its searches"""
+
+    def __init__(self, tickets: dict[str, SupportTicket]):
+        super().__init__(tickets)
+        self.limits: list[int | None] = []
+
+    def search(
+        self,
+        query: str | None = None,
+        department_code: str | None = None,
+        priority: TicketPriority | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> tuple[list[SupportTicket], int]:
+        self.limits.append(limit)
+        return super().search(query, department_code, priority, offset, limit)
+
+
+class TestOverlayRepositories(unittest.TestCase):
+    """Test cases for the copy-on-write session repositories"""
+
+    def setUp(self):
+        """Set up the test environment before each test method"""
+        self.base = Storage(tickets=InMemoryTicketRepository(), action_items=InMemoryActionItemRepository())
+        for ticket in [_ticket("TKT-1", "Printer offline"), _ticket("TKT-2", "VPN drops")]:
+            self.base.tickets[ticket.ticket_id] = ticket
+        for action_id, ticket_id in [("ACT-1", "TKT-1"), ("ACT-2", "TKT-2"), ("ACT-3", "TKT-1")]:
+            self.base.action_items[action_id] = _action_item(action_id, ticket_id)
+
+        self.session = create_session_storage(self.base)
+        self.other_session = create_session_storage(self.base)
+
+    def test_changes_stay_in_the_session(self):
+        """Test that created, updated and deleted tickets are only seen by their session"""
+        ticket = self.session.tickets["TKT-1"]
+        ticket.title = "Scanner offline"
+        self.session.tickets["TKT-1"] = ticket
+        self.session.tickets["TKT-3"] = _ticket("TKT-3", "Laptop broken")
+        del self.session.tickets["TKT-2"]
+
+        self.assertEqual(list(self.session.tickets), ["TKT-1", "TKT-3"])
+        self.assertEqual(len(self.session.tickets), 2)
+        self.assertEqual(self.session.tickets["TKT-1"].title, "Scanner offline")
+
+        for storage in [self.base, self.other_session]:
+            self.assertEqual(list(storage.tickets), ["TKT-1", "TKT-2"])
+            self.assertEqual(storage.tickets["TKT-1"].title, "Printer offline")
+
+    def test_base_records_cannot_be_changed_in_place(self):
+        """Test that records read from the base are copies"""
+        self.session.tickets["TKT-1"].title = "Changed in place"
+        self.session.tickets.search()[0][0].title = "Changed in place"
+        self.session.action_items["ACT-1"].title = "Changed in place"
+
+        self.assertEqual(self.base.tickets["TKT-1"].title, "Printer offline")
+        self.assertEqual(self.session.tickets["TKT-1"].title, "Printer offline")
+        self.assertEqual(self.base.action_items["ACT-1"].title, "Action ACT-1")
+
+    def test_search_merges_session_changes(self):
+        """Test that searches see the session tickets and skip changed or deleted base tickets"""
+        self.session.tickets["TKT-3"] = _ticket("TKT-3", "Printer jammed")
+        ticket = self.session.tickets["TKT-1"]
+        ticket.title = "Scanner offline"
+        ticket.description = "Scanner offline reported by a user"
+        self.session.tickets["TKT-1"] = ticket
+
+        tickets, total_count = self.session.tickets.search(query="printer")
+        self.assertEqual(([t.ticket_id for t in tickets], total_count), (["TKT-3"], 1))
+
+        # Changed tickets keep their place, created tickets follow the base tickets
+        tickets, total_count = self.session.tickets.search(offset=1, limit=2)
+        self.assertEqual(([t.ticket_id for t in tickets], total_count), (["TKT-2", "TKT-3"], 3))
+        self.assertEqual(self.session.tickets.search(limit=1)[0][0].title, "Scanner offline")
+
+        del self.session.tickets["TKT-2"]
+        self.assertEqual(self.session.tickets.search(query="vpn"), ([], 0))
+        self.assertEqual(self.other_session.tickets.search(query="vpn")[1], 1)
+
+    def test_search_ranks_session_tickets_by_relevance(self):
+        """Test that created tickets are ranked among the base tickets instead of ahead of them"""
+        self.base.tickets["TKT-3"] = _ticket("TKT-3", "Printer printer toner printer")
+        self.session.tickets["TKT-4"] = _ticket("TKT-4", "Printer toner printer")
+
+        tickets, total_count = self.session.tickets.search(query="printer")
+
+        self.assertEqual(([t.ticket_id for t in tickets], total_count), (["TKT-3", "TKT-4", "TKT-1"], 3))
+
+    def test_search_fetches_a_bounded_page_of_base_tickets(self):
+        """Test that searches after a session change only read the base tickets needed for the page"""
+        base = RecordingTicketRepository({f"TKT-{i}": _ticket(f"TKT-{i}", f"Printer {i}") for i in range(1, 101)})
+        session = create_session_storage(
+            Storage(tickets=base, action_items=InMemoryActionItemRepository())
+        )
+        session.tickets["TKT-101"] = _ticket("TKT-101", "Printer 101")
+        del session.tickets["TKT-2"]
+        ticket = session.tickets["TKT-3"]
+        ticket.department_code = "HR"
+        session.tickets["TKT-3"] = ticket
+
+        tickets, total_count = session.tickets.search(department_code="IT", offset=5, limit=5)
+
+        self.assertEqual([t.ticket_id for t in tickets], ["TKT-8", "TKT-9", "TKT-10", "TKT-11", "TKT-12"])
+        self.assertEqual(total_count, 99)
+        # The page, plus one base ticket for each changed or deleted ticket
+        self.assertEqual(base.limits, [13])
+
+        tickets, total_count = session.tickets.search(offset=98, limit=5)
+        self.assertEqual(([t.ticket_id for t in tickets], total_count), (["TKT-100", "TKT-101"], 100))
+
+    def test_recreating_a_deleted_ticket(self):
+        """Test that a deleted base ticket can be written again"""
+        del self.session.tickets["TKT-1"]
+        self.session.tickets["TKT-1"] = _ticket("TKT-1", "Printer replaced")
+
+        self.assertEqual(len(self.session.tickets), 2)
+        self.assertEqual(self.session.tickets["TKT-1"].title, "Printer replaced")
+        with self.assertRaises(KeyError):
+            del self.session.tickets["TKT-9"]
+
+    def test_action_items_of_a_ticket(self):
+        """Test that action items keep their order and follow changes of their parent ticket"""
+        self.session.action_items["ACT-4"] = _action_item("ACT-4", "TKT-1")
+        moved = self.session.action_items["ACT-2"]
+        moved.parent_ticket_id = "TKT-1"
+        self.session.action_items["ACT-2"] = moved
+        del self.session.action_items["ACT-1"]
+
+        action_items, total_count = self.session.action_items.list_for_ticket("TKT-1")
+        self.assertEqual(([a.action_id for a in action_items], total_count), (["ACT-3", "ACT-4", "ACT-2"], 3))
+        self.assertEqual(self.session.action_items.list_for_ticket("TKT-2"), ([], 0))
+
+        action_items, total_count = self.session.action_items.list_for_ticket("TKT-1", offset=1, limit=1)
+        self.assertEqual(([a.action_id for a in action_items], total_count), (["ACT-4"], 3))
+
+        action_items, _ = self.other_session.action_items.list_for_ticket("TKT-1")
+        self.assertEqual([a.action_id for a in action_items], ["ACT-1", "ACT-3"])
+        self.assertEqual(len(self.base.action_items), 3)
+
+    def test_async_methods(self):
+        """Test that the async methods see the session changes"""
+
+        async def run():
+            await self.session.tickets.aset("TKT-3", _ticket("TKT-3", "Printer jammed"))
+            await self.session.action_items.aset("ACT-4", _action_item("ACT-4", "TKT-3"))
+            return await asyncio.gather(
+                self.session.tickets.asearch(query="printer"),
+                self.session.tickets.aget("TKT-2"),
+                self.session.action_items.alist_for_ticket("TKT-3"),
+            )
+
+        tickets, ticket, action_items = asyncio.run(run())
+
+        self.assertEqual(([t.ticket_id for t in tickets[0]], tickets[1]), (["TKT-1", "TKT-3"], 2))
+        self.assertEqual(ticket and ticket.title, "VPN drops")
+        self.assertEqual([a.action_id for a in action_items[0]], ["ACT-4"])
+        self.assertEqual(len(self.session.tickets), 3)
+        self.assertNotIn("TKT-3", self.base.tickets)
+
+    def test_database_base(self):
+        """Test that sessions only read from a database backend"""
+        database = SQLiteDatabase(":memory:")
+        self.addCleanup(database.close)
+        base = Storage(tickets=SQLiteTicketRepository(database), action_items=SQLiteActionItemRepository(database))
+        base.tickets["TKT-1"] = _ticket("TKT-1", "Printer offline")
+
+        session = create_session_storage(base)
+        session.tickets["TKT-2"] = _ticket("TKT-2", "Printer jammed")
+
+        self.assertEqual(session.tickets.search(query="printer")[1], 2)
+        self.assertEqual(list(base.tickets), ["TKT-1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,244 @@
+import asyncio
+import os
+import unittest
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from app.chatbot.data_models.ticket_models import (
+    ActionItem,
+    ActionItemStatus,
+    SupportTicket,
+    TicketPriority,
+    TicketWorkflowType,
+)
+from app.chatbot.storage.memory import InMemoryActionItemRepository, InMemoryTicketRepository
+from app.chatbot.storage.overlay import OverlayActionItemRepository, OverlayTicketRepository
+from app.chatbot.storage.repository import ActionItemRepository, TicketRepository
+from app.chatbot.storage.sqlite import (
+    SQLiteActionItemRepository,
+    SQLiteDatabase,
+    SQLiteTicketRepository,
+)
+
+
+def _ticket(ticket_id: str, department_code: str, priority: TicketPriority, title: str) -> SupportTicket:
+    return SupportTicket(
+        ticket_id=ticket_id,
+        title=title,
+        department_code=department_code,
+        priority=priority,
+        workflow_type=TicketWorkflowType.STANDARD,
+        description=f"{title} reported by a user",
+        expected_outcome="Issue resolved",
+        created_at=datetime(2025, 1, 1, 12, 0),
+    )
+
+
+# The contract is only collected through the backend test cases below
+_ContractBase = unittest.TestCase if TYPE_CHECKING else object
+
+
+class RepositoryContract(_ContractBase):
+    """Behavior shared by all storage backends, run for each backend by the test cases below"""
+
+    tickets: TicketRepository
+    action_items: ActionItemRepository
+
+    def add_sample_data(self):
+        for ticket in [
+            _ticket("TKT-1", "IT", TicketPriority.HIGH, "Printer offline"),
+            _ticket("TKT-2", "IT", TicketPriority.LOW, "VPN drops"),
+            _ticket("TKT-3", "HR", TicketPriority.HIGH, "Payroll printer access"),
+        ]:
+            self.tickets[ticket.ticket_id] = ticket
+        for action_id, ticket_id in [("ACT-1", "TKT-1"), ("ACT-2", "TKT-2"), ("ACT-3", "TKT-1")]:
+            self.action_items[action_id] = ActionItem(
+                action_id=action_id,
+                parent_ticket_id=ticket_id,
+                title=f"Action {action_id}",
+                assignee="Support",
+            )
+
+    def test_ticket_round_trip(self):
+        """Test that stored tickets are read back unchanged"""
+        ticket = self.tickets["TKT-1"]
+
+        self.assertEqual(ticket, _ticket("TKT-1", "IT", TicketPriority.HIGH, "Printer offline"))
+        self.assertEqual(list(self.tickets), ["TKT-1", "TKT-2", "TKT-3"])
+        self.assertIn("TKT-2", self.tickets)
+        self.assertNotIn("TKT-9", self.tickets)
+
+    def test_ticket_update_is_searchable(self):
+        """Test that written back tickets are persisted and reindexed"""
+        ticket = self.tickets["TKT-2"]
+        ticket.title = "Keyboard broken"
+        ticket.description = "Several keys are missing"
+        ticket.priority = TicketPriority.CRITICAL
+        self.tickets["TKT-2"] = ticket
+
+        self.assertEqual(self.tickets["TKT-2"].title, "Keyboard broken")
+        tickets, total_count = self.tickets.search(query="keyboard", priority=TicketPriority.CRITICAL)
+        self.assertEqual(([t.ticket_id for t in tickets], total_count), (["TKT-2"], 1))
+        self.assertEqual(self.tickets.search(query="vpn")[1], 0)
+        self.assertEqual(len(self.tickets), 3)
+
+    def test_search_with_filters_and_pagination(self):
+        """Test that search combines text, filters and pagination"""
+        tickets, total_count = self.tickets.search(query="printer")
+        self.assertEqual(({t.ticket_id for t in tickets}, total_count), ({"TKT-1", "TKT-3"}, 2))
+
+        tickets, total_count = self.tickets.search(query="print", department_code="HR")
+        self.assertEqual(([t.ticket_id for t in tickets], total_count), (["TKT-3"], 1))
+
+        tickets, total_count = self.tickets.search(priority=TicketPriority.HIGH, offset=1, limit=1)
+        self.assertEqual(([t.ticket_id for t in tickets], total_count), (["TKT-3"], 2))
+
+    def test_delete_ticket(self):
+        """Test that deleted tickets are no longer found"""
+        del self.tickets["TKT-1"]
+
+        self.assertNotIn("TKT-1", self.tickets)
+        self.assertEqual(self.tickets.search(query="offline"), ([], 0))
+
+    def test_action_items_by_ticket(self):
+        """Test that action items are listed per ticket in creation order"""
+        action_items, total_count = self.action_items.list_for_ticket("TKT-1")
+        self.assertEqual(([a.action_id for a in action_items], total_count), (["ACT-1", "ACT-3"], 2))
+
+        action_items, total_count = self.action_items.list_for_ticket("TKT-1", offset=1, limit=5)
+        self.assertEqual(([a.action_id for a in action_items], total_count), (["ACT-3"], 2))
+
+        self.assertEqual(self.action_items.list_for_ticket("TKT-9"), ([], 0))
+
+    def test_async_methods(self):
+        """Test that the async methods see the same data as the blocking ones"""
+
+        async def run():
+            ticket = await self.tickets.aget("TKT-1")
+            assert ticket is not None
+            ticket.title = "Scanner offline"
+            await self.tickets.aset("TKT-1", ticket)
+
+            # Independent lookups can run concurrently
+            return await asyncio.gather(
+                self.tickets.asearch(query="scanner"),
+                self.tickets.aget("TKT-9"),
+                self.action_items.alist_for_ticket("TKT-1", limit=1),
+                self.action_items.aget("ACT-2"),
+            )
+
+        tickets, missing_ticket, action_items, action_item = asyncio.run(run())
+
+        self.assertEqual(([t.ticket_id for t in tickets[0]], tickets[1]), (["TKT-1"], 1))
+        self.assertEqual(missing_ticket, None)
+        self.assertEqual(([a.action_id for a in action_items[0]], action_items[1]), (["ACT-1"], 2))
+        self.assertEqual(action_item and action_item.parent_ticket_id, "TKT-2")
+
+    def test_action_item_update(self):
+        """Test that written back action items are persisted"""
+        action_item = self.action_items["ACT-2"]
+        action_item.status = ActionItemStatus.COMPLETED
+        self.action_items["ACT-2"] = action_item
+
+        self.assertEqual(self.action_items["ACT-2"].status, ActionItemStatus.COMPLETED)
+        self.assertEqual(len(self.action_items), 3)
+
+
+class TestInMemoryRepositories(RepositoryContract, unittest.TestCase):
+    """Test cases for the in-memory repositories"""
+
+    def setUp(self):
+        """Set up the test environment before each test method"""
+        self.tickets = InMemoryTicketRepository()
+        self.action_items = InMemoryActionItemRepository()
+        self.add_sample_data()
+
+
+class TestOverlayRepositories(RepositoryContract, unittest.TestCase):
+    """Test cases for the copy-on-write repositories on top of in-memory ones"""
+
+    def setUp(self):
+        """Set up the test environment before each test method"""
+        self.tickets = InMemoryTicketRepository()
+        self.action_items = InMemoryActionItemRepository()
+        self.add_sample_data()
+        self.tickets = OverlayTicketRepository(self.tickets)
+        self.action_items = OverlayActionItemRepository(self.action_items)
+
+
+class TestSQLiteRepositories(RepositoryContract, unittest.TestCase):
+    """Test cases for the SQLite repositories"""
+
+    def setUp(self):
+        """Set up the test environment before each test method"""
+        self.database = SQLiteDatabase(":memory:")
+        self.tickets = SQLiteTicketRepository(self.database)
+        self.action_items = SQLiteActionItemRepository(self.database)
+        self.add_sample_data()
+
+    def tearDown(self):
+        self.database.close()
+
+
+@unittest.skipUnless(
+    os.getenv("TICKET_STORAGE_POSTGRES_URL"), "TICKET_STORAGE_POSTGRES_URL is not set"
+)
+class TestPostgresRepositories(RepositoryContract, unittest.TestCase):
+    """Test cases for the PostgreSQL repositories, run against an empty test database"""
+
+    def setUp(self):
+        """Set up the test environment before each test method"""
+        from app.chatbot.storage.postgres import (
+            AsyncPostgresConnectionPool,
+            PostgresActionItemRepository,
+            PostgresConnectionPool,
+            PostgresTicketRepository,
+            create_schema,
+        )
+
+        conninfo = os.environ["TICKET_STORAGE_POSTGRES_URL"]
+        self.pool = PostgresConnectionPool(conninfo, max_size=2)
+        async_pool = AsyncPostgresConnectionPool(conninfo, max_size=2)
+        create_schema(self.pool)
+        self.pool.execute("TRUNCATE tickets, action_items RESTART IDENTITY")
+        self.tickets = PostgresTicketRepository(self.pool, async_pool)
+        self.action_items = PostgresActionItemRepository(self.pool, async_pool)
+        self.add_sample_data()
+
+    def tearDown(self):
+        self.pool.close()
+
+
+class TestAsyncPostgresConnectionPool(unittest.TestCase):
+    """Test cases for the async PostgreSQL connection pool, with fake connections"""
+
+    def test_idle_connections_are_closed_when_the_event_loop_changes(self):
+        """Test that the connections opened on a previous event loop are closed, not dropped"""
+        from unittest.mock import AsyncMock, patch
+
+        from app.chatbot.storage.postgres import AsyncPostgresConnectionPool
+
+        pool = AsyncPostgresConnectionPool("postgresql://test")
+        opened: list[AsyncMock] = []
+
+        async def connect(*args: object, **kwargs: object) -> AsyncMock:
+            connection = AsyncMock(closed=False, broken=False)
+            opened.append(connection)
+            return connection
+
+        async def borrow() -> None:
+            async with pool.connection():
+                pass
+
+        with patch("psycopg.AsyncConnection.connect", side_effect=connect):
+            asyncio.run(borrow())
+            asyncio.run(borrow())
+
+        self.assertEqual(len(opened), 2)
+        opened[0].close.assert_awaited_once()
+        opened[1].close.assert_not_awaited()
+        self.assertEqual(pool._idle, [opened[1]])  # pyright: ignore[reportPrivateUsage] The idle connections are not exposed
+
+
+if __name__ == "__main__":
+    unittest.main()
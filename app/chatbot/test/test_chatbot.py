@@ -0,0 +1,98 @@
+import unittest
+
+from semantic_kernel import Kernel
+
+from app.chatbot.chatbot import Chatbot, ChatStreamEventType
+from app.chatbot.factory import create_support_ticket_agent
+from app.chatbot.mock_chat_completion import MockChatCompletion, MockFunctionCall, MockResponse
+from app.chatbot.storage.backends import Storage, create_session_storage
+from app.chatbot.storage.memory import InMemoryActionItemRepository, InMemoryTicketRepository
+
+CREATE_TICKET = MockFunctionCall(
+    "TicketManagementPlugin-create_support_ticket",
+    {
+        "title": "Compliance audit",
+        "department_code": "IT",
+        "priority": "High",
+        "workflow_type": "Standard",
+        "description": "Upcoming compliance audit",
+        "expected_outcome": "Audit passed",
+    },
+)
+
+
+class TestChatbotSessions(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the plugin state of chat sessions"""
+
+    def setUp(self):
+        """Set up the test environment before each test method"""
+        self.shared = Storage(tickets=InMemoryTicketRepository(), action_items=InMemoryActionItemRepository())
+        # Every turn creates a ticket, then confirms it
+        kernel = Kernel()
+        kernel.add_service(
+            MockChatCompletion(
+                service_id="SupportTicketAgent",
+                responses=[MockResponse(function_calls=(CREATE_TICKET,)), MockResponse(content="Ticket created")],
+            )
+        )
+        self.agent = create_support_ticket_agent(name="SupportTicketAgent", kernel=kernel, storage=self.shared)
+
+    async def test_isolated_sessions_keep_their_changes_private(self):
+        """Test that each session only sees the tickets it created"""
+        session_storages: list[Storage] = []
+
+        def session_storage_factory() -> Storage:
+            storage = create_session_storage(self.shared)
+            session_storages.append(storage)
+            return storage
+
+        bot = Chatbot(self.agent, session_storage_factory=session_storage_factory)
+
+        self.assertEqual(await bot.chat("Create a ticket", session_id="first"), "Ticket created")
+        await bot.chat("Create another ticket", session_id="first")
+        events = [event async for event in bot.chat_stream("Create a ticket", session_id="second")]
+        self.assertEqual("".join(e.content for e in events if e.type == ChatStreamEventType.TEXT), "Ticket created")
+
+        self.assertEqual([len(storage.tickets) for storage in session_storages], [2, 1])
+        self.assertEqual(len(self.shared.tickets), 0)
+
+    async def test_sessions_share_the_agent_plugins_by_default(self):
+        """Test that without a session storage factory all sessions use the plugins of the agent"""
+        bot = Chatbot(self.agent)
+
+        await bot.chat("Create a ticket", session_id="first")
+        await bot.chat("Create a ticket", session_id="second")
+
+        self.assertIsNone(bot.sessions.get_session("first").kernel)
+        self.assertEqual(len(self.shared.tickets), 2)
+
+
+class TestChatbotStream(unittest.IsolatedAsyncioTestCase):
+    """Test cases for streaming chatbot responses"""
+
+    async def test_function_results_carry_the_id_of_their_call(self):
+        """Test that repeated calls to the same function can be told apart by their call ID"""
+        kernel = Kernel()
+        kernel.add_service(
+            MockChatCompletion(
+                service_id="SupportTicketAgent",
+                responses=[
+                    MockResponse(function_calls=(CREATE_TICKET, CREATE_TICKET)),
+                    MockResponse(content="Tickets created"),
+                ],
+            )
+        )
+        storage = Storage(tickets=InMemoryTicketRepository(), action_items=InMemoryActionItemRepository())
+        bot = Chatbot(create_support_ticket_agent(name="SupportTicketAgent", kernel=kernel, storage=storage))
+
+        events = [event async for event in bot.chat_stream("Create two tickets")]
+
+        call_ids = [e.call_id for e in events if e.type == ChatStreamEventType.FUNCTION_CALL]
+        result_ids = [e.call_id for e in events if e.type == ChatStreamEventType.FUNCTION_RESULT]
+        self.assertEqual(len(set(call_ids)), 2)
+        self.assertNotIn(None, call_ids)
+        self.assertCountEqual(result_ids, call_ids)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import asyncio
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from app.chatbot.client_registry import (
+    AzureOpenAIClientRegistry,
+    ConnectionPoolSettings,
+    close_client_registry,
+    get_client_registry,
+)
+
+ENDPOINT = "https://example.openai.azure.com"
+
+
+class OkHandler(BaseHTTPRequestHandler):
+    """Answers every request with a kept-alive "ok" response"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+class TestAzureOpenAIClientRegistry(unittest.TestCase):
+    """Test cases for the Azure OpenAI Client Registry"""
+
+    def setUp(self):
+        """Set up the test environment before each test method"""
+        self.registry = AzureOpenAIClientRegistry(
+            ConnectionPoolSettings(max_connections=10, max_keepalive_connections=5)
+        )
+
+    def tearDown(self):
+        asyncio.run(self.registry.aclose())
+
+    def test_same_deployment_reuses_client(self):
+        """Test that kernels for the same deployment share one client"""
+        first = self.registry.get_client("gpt-4o", ENDPOINT, "key")
+        second = self.registry.get_client("gpt-4o", ENDPOINT, "key")
+
+        self.assertIs(first, second)
+
+    def test_api_keys_get_their_own_client(self):
+        """Test that configurations differing only by API key do not share a client"""
+        first = self.registry.get_client("gpt-4o", ENDPOINT, "key")
+        second = self.registry.get_client("gpt-4o", ENDPOINT, "other-key")
+
+        self.assertIsNot(first, second)
+        self.assertEqual((first.api_key, second.api_key), ("key", "other-key"))
+
+    def test_deployments_share_connection_pool(self):
+        """Test that different deployments get their own client on the shared connection pool"""
+        first = self.registry.get_client("gpt-4o", ENDPOINT, "key")
+        second = self.registry.get_client("gpt-4o-mini", ENDPOINT, "key")
+
+        self.assertIsNot(first, second)
+        self.assertIs(first._client, self.registry.http_client)  # pyright: ignore[reportPrivateUsage]
+        self.assertIs(second._client, self.registry.http_client)  # pyright: ignore[reportPrivateUsage]
+
+    def test_clients_stay_usable_after_close(self):
+        """Test that closing the registry drops the pooled connections but not the clients"""
+        first = self.registry.get_client("gpt-4o", ENDPOINT, "key")
+        asyncio.run(self.registry.aclose())
+        second = self.registry.get_client("gpt-4o", ENDPOINT, "key")
+
+        self.assertIs(first, second)
+        self.assertFalse(self.registry.http_client.is_closed)
+
+    def test_connections_are_reopened_on_a_new_event_loop(self):
+        """Test that the shared HTTP client can be used on a new event loop once the registry is closed"""
+        server = HTTPServer(("127.0.0.1", 0), OkHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        url = f"http://127.0.0.1:{server.server_port}/"
+        # Held like the client of an already created kernel
+        http_client = self.registry.http_client
+
+        async def request() -> str:
+            try:
+                return (await http_client.get(url)).text
+            finally:
+                await self.registry.aclose()
+
+        self.assertEqual(asyncio.run(request()), "ok")
+        self.assertEqual(asyncio.run(request()), "ok")
+
+    def test_close_client_registry(self):
+        """Test that the shared registry can be closed at shutdown"""
+        http_client = get_client_registry().http_client
+
+        asyncio.run(close_client_registry())
+
+        self.assertIs(get_client_registry().http_client, http_client)
+        asyncio.run(close_client_registry())
+
+if __name__ == "__main__":
+    unittest.main()
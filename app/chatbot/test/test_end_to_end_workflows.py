@@ -9,32 +9,29 @@ from app.chatbot.plugins.support_ticket_system.reference_data_plugin import (
 from app.chatbot.plugins.support_ticket_system.action_item_plugin import (
     ActionItemPlugin,
 )
+from app.chatbot.storage.memory import InMemoryActionItemRepository, InMemoryTicketRepository
 
 # Disabling the pyright error for private usage in this test file
 # pyright: reportPrivateUsage=false
-class TestEndToEndWorkflows(unittest.TestCase):
+class TestEndToEndWorkflows(unittest.IsolatedAsyncioTestCase):
     """Test the end-to-end workflows for the support ticket management system"""
 
     def setUp(self):
         """Set up the test environment with fresh instances of all plugins"""
-        self.ticket_plugin = TicketManagementPlugin()
+        # Fresh in-memory repositories for clean testing
+        self.ticket_plugin = TicketManagementPlugin(InMemoryTicketRepository())
         self.reference_plugin = ReferenceDataPlugin()
-        self.action_plugin = ActionItemPlugin()
+        self.action_plugin = ActionItemPlugin(InMemoryActionItemRepository())
 
-        # Clear existing data for clean testing
-        self.ticket_plugin._tickets = {}
-        self.action_plugin._action_items = {}
-        self.action_plugin._ticket_to_actions = {}
-
-    def test_ticket_creation_workflow(self):
+    async def test_ticket_creation_workflow(self):
         """Test the complete workflow for creating a support ticket"""
         # First, get department information to ensure we use valid department codes
-        dept_result = self.reference_plugin.get_departments()
+        dept_result = await self.reference_plugin.get_departments()
         departments = dept_result["departments"]
         it_dept = next(dept for dept in departments if dept["code"] == "IT")
 
         # Create a new support ticket
-        ticket_result = self.ticket_plugin.create_support_ticket(
+        ticket_result = await self.ticket_plugin.create_support_ticket(
             title="Integration Test Ticket",
             department_code=it_dept["code"],
             priority="Medium",
@@ -50,15 +47,15 @@ class TestEndToEndWorkflows(unittest.TestCase):
         ticket_id = ticket_result["ticket_id"]
 
         # Retrieve the created ticket to verify details
-        get_result = self.ticket_plugin.get_support_ticket(ticket_id=ticket_id)
+        get_result = await self.ticket_plugin.get_support_ticket(ticket_id=ticket_id)
         self.assertEqual(get_result["title"], "Integration Test Ticket")
         self.assertEqual(get_result["department"], "IT")
         self.assertEqual(get_result["priority"], "Medium")
 
-    def test_ticket_update_workflow(self):
+    async def test_ticket_update_workflow(self):
         """Test the workflow for updating an existing support ticket"""
         # First create a ticket
-        ticket_result = self.ticket_plugin.create_support_ticket(
+        ticket_result = await self.ticket_plugin.create_support_ticket(
             title="Ticket To Update",
             department_code="HR",
             priority="Low",
@@ -69,7 +66,7 @@ class TestEndToEndWorkflows(unittest.TestCase):
         ticket_id = ticket_result["ticket_id"]
 
         # Now update the ticket
-        update_result = self.ticket_plugin.update_support_ticket(
+        update_result = await self.ticket_plugin.update_support_ticket(
             ticket_id=ticket_id,
             title="Updated Ticket Title",
             priority="High",
@@ -81,16 +78,16 @@ class TestEndToEndWorkflows(unittest.TestCase):
         self.assertEqual(update_result["status"], "updated")
 
         # Retrieve the updated ticket to verify changes
-        get_result = self.ticket_plugin.get_support_ticket(ticket_id=ticket_id)
+        get_result = await self.ticket_plugin.get_support_ticket(ticket_id=ticket_id)
         self.assertEqual(get_result["title"], "Updated Ticket Title")
         self.assertEqual(get_result["priority"], "High")
         self.assertEqual(get_result["description"], "This ticket has been updated")
         self.assertEqual(get_result["resolution"], "Issue has been resolved")
 
-    def test_action_item_creation_workflow(self):
+    async def test_action_item_creation_workflow(self):
         """Test the workflow for creating action items for a ticket"""
         # First create a ticket
-        ticket_result = self.ticket_plugin.create_support_ticket(
+        ticket_result = await self.ticket_plugin.create_support_ticket(
             title="Ticket With Actions",
             department_code="IT",
             priority="Medium",
@@ -101,7 +98,7 @@ class TestEndToEndWorkflows(unittest.TestCase):
         ticket_id = ticket_result["ticket_id"]
 
         # Create an action item for the ticket
-        action_result = self.action_plugin.create_action_item(
+        action_result = await self.action_plugin.create_action_item(
             parent_ticket_id=ticket_id,
             title="Investigate Issue",
             assignee="Test Engineer",
@@ -114,21 +111,21 @@ class TestEndToEndWorkflows(unittest.TestCase):
         action_id = action_result["action_id"]
 
         # Get the action item to verify details
-        get_result = self.action_plugin.get_action_item(action_id=action_id)
+        get_result = await self.action_plugin.get_action_item(action_id=action_id)
         self.assertEqual(get_result["parent_ticket_id"], ticket_id)
         self.assertEqual(get_result["title"], "Investigate Issue")
         self.assertEqual(get_result["assignee"], "Test Engineer")
         self.assertEqual(get_result["status"], "Open")
 
         # Verify the action item is linked to the ticket
-        ticket_actions = self.action_plugin.get_ticket_action_items(ticket_id=ticket_id)
+        ticket_actions = await self.action_plugin.get_ticket_action_items(ticket_id=ticket_id)
         self.assertEqual(ticket_actions["count"], 1)
         self.assertEqual(ticket_actions["action_items"][0]["action_id"], action_id)
 
-    def test_action_item_update_workflow(self):
+    async def test_action_item_update_workflow(self):
         """Test the workflow for updating action items"""
         # Create a ticket and action item
-        ticket_result = self.ticket_plugin.create_support_ticket(
+        ticket_result = await self.ticket_plugin.create_support_ticket(
             title="Ticket For Action Updates",
             department_code="OPS",
             priority="High",
@@ -138,13 +135,13 @@ class TestEndToEndWorkflows(unittest.TestCase):
         )
         ticket_id = ticket_result["ticket_id"]
 
-        action_result = self.action_plugin.create_action_item(
+        action_result = await self.action_plugin.create_action_item(
             parent_ticket_id=ticket_id, title="Deploy Fix", assignee="Deployment Team"
         )
         action_id = action_result["action_id"]
 
         # First update the status
-        status_result = self.action_plugin.update_action_item_status(
+        status_result = await self.action_plugin.update_action_item_status(
             action_id=action_id, status="In Progress"
         )
 
@@ -152,7 +149,7 @@ class TestEndToEndWorkflows(unittest.TestCase):
         self.assertEqual(status_result["current_action_status"], "In Progress")
 
         # Then update other fields
-        update_result = self.action_plugin.update_action_item(
+        update_result = await self.action_plugin.update_action_item(
             action_id=action_id,
             title="Deploy Critical Fix",
             assignee="Senior Deployment Team",
@@ -163,7 +160,7 @@ class TestEndToEndWorkflows(unittest.TestCase):
         self.assertEqual(update_result["status"], "updated")
 
         # Get the updated action item to verify changes
-        get_result = self.action_plugin.get_action_item(action_id=action_id)
+        get_result = await self.action_plugin.get_action_item(action_id=action_id)
         self.assertEqual(get_result["title"], "Deploy Critical Fix")
         self.assertEqual(get_result["assignee"], "Senior Deployment Team")
         self.assertEqual(
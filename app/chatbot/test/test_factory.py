@@ -0,0 +1,52 @@
+import unittest
+
+from semantic_kernel import Kernel
+
+from app.chatbot.factory import _create_plugin, _load_support_ticket_instructions, _load_support_ticket_plugins
+from app.chatbot.plugins.support_ticket_system.reference_data_plugin import (
+    ReferenceDataPlugin,
+)
+
+# Disabling the pyright error for private usage in this test file
+# pyright: reportPrivateUsage=false
+class TestFactory(unittest.TestCase):
+    """Test cases for the agent factory caches"""
+
+    def test_instructions_are_cached(self):
+        """Test that the rendered instructions are reused while the workflow file is unchanged"""
+        first = _load_support_ticket_instructions()
+        second = _load_support_ticket_instructions()
+
+        self.assertIn("POLICY:", first)
+        self.assertIs(first, second)
+
+    def test_plugins_reuse_function_metadata(self):
+        """Test that new plugin instances reuse the cached metadata but are bound to their own instance"""
+        first_instance = ReferenceDataPlugin()
+        second_instance = ReferenceDataPlugin()
+
+        first = _create_plugin("ReferenceDataPlugin", first_instance)
+        second = _create_plugin("ReferenceDataPlugin", second_instance)
+
+        self.assertEqual(set(first.functions), set(second.functions))
+        for name, function in second.functions.items():
+            self.assertIs(function.metadata, first.functions[name].metadata)
+            self.assertIs(function.method.__self__, second_instance)  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType]
+
+    def test_support_ticket_plugins_are_loaded(self):
+        """Test that all support ticket plugins are registered with fully qualified names"""
+        kernel = Kernel()
+        _load_support_ticket_plugins(kernel)
+
+        self.assertEqual(
+            set(kernel.plugins),
+            {"CommonPlugin", "TicketManagementPlugin", "ActionItemPlugin", "ReferenceDataPlugin"},
+        )
+        self.assertEqual(
+            kernel.get_function("TicketManagementPlugin", "search_tickets").fully_qualified_name,
+            "TicketManagementPlugin-search_tickets",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+import asyncio
+import unittest
+
+from semantic_kernel.agents import ChatHistoryAgentThread
+from semantic_kernel.contents import (
+    ChatMessageContent,
+    FunctionCallContent,
+    FunctionResultContent,
+)
+from semantic_kernel.contents.utils.author_role import AuthorRole
+
+from app.chatbot.history_reducer import TokenBudgetHistoryReducer, create_history_reducing_thread
+
+
+def search_turn(turn: int) -> list[ChatMessageContent]:
+    """Create a user turn with a bulky search_tickets function call and result"""
+    call_id = f"call-{turn}"
+    result = {
+        "count": 20,
+        "tickets": [
+            {"ticket_id": f"TKT-{turn}-{i}", "description": "A long ticket description " * 5}
+            for i in range(20)
+        ],
+    }
+    return [
+        ChatMessageContent(role=AuthorRole.USER, content=f"Search tickets {turn}"),
+        ChatMessageContent(
+            role=AuthorRole.ASSISTANT,
+            items=[
+                FunctionCallContent(
+                    id=call_id, name="TicketManagementPlugin-search_tickets", arguments="{}"
+                )
+            ],
+        ),
+        ChatMessageContent(
+            role=AuthorRole.TOOL,
+            items=[
+                FunctionResultContent(
+                    id=call_id, name="TicketManagementPlugin-search_tickets", result=result
+                )
+            ],
+        ),
+        ChatMessageContent(role=AuthorRole.ASSISTANT, content=f"Found 20 tickets for turn {turn}"),
+    ]
+
+
+class TestTokenBudgetHistoryReducer(unittest.TestCase):
+    """Test cases for the Token Budget History Reducer"""
+
+    def setUp(self):
+        """Set up the test environment before each test method"""
+        self.system_message = ChatMessageContent(role=AuthorRole.SYSTEM, content="Starting the simulation")
+
+    def test_history_within_budget_is_not_reduced(self):
+        """Test that a history within the budget is left untouched"""
+        reducer = TokenBudgetHistoryReducer(max_tokens=100_000)
+        reducer.messages = [self.system_message, *search_turn(1)]
+
+        result = asyncio.run(reducer.reduce())
+
+        self.assertIsNone(result)
+        self.assertIsNone(reducer.last_reduction)
+        self.assertEqual(len(reducer.messages), 5)
+
+    def test_old_function_results_are_summarized(self):
+        """Test that bulky function results of previous turns are collapsed into summaries"""
+        reducer = TokenBudgetHistoryReducer(max_tokens=1_500)
+        reducer.messages = [self.system_message, *search_turn(1), *search_turn(2)]
+        latest_result = reducer.messages[7].items[0]
+
+        asyncio.run(reducer.reduce())
+
+        # Both turns still fit once the old result is summarized
+        self.assertEqual(len(reducer.messages), 9)
+        summarized = reducer.messages[3].items[0]
+        assert isinstance(summarized, FunctionResultContent)
+        self.assertTrue(summarized.result["summarized"])
+        self.assertEqual(summarized.result["tickets"][0], "TKT-1-0")
+        # The most recent tool state is kept intact
+        self.assertIs(reducer.messages[7].items[0], latest_result)
+
+        assert reducer.last_reduction is not None
+        self.assertGreater(reducer.last_reduction.saved_tokens, 0)
+        self.assertLessEqual(reducer.count_tokens(), 1_500)
+
+    def test_oldest_turns_are_dropped_when_over_budget(self):
+        """Test that whole turns are dropped while the system message and latest turn are kept"""
+        reducer = TokenBudgetHistoryReducer(max_tokens=1_200, function_result_max_chars=100)
+        reducer.messages = [self.system_message, *[m for turn in range(1, 6) for m in search_turn(turn)]]
+
+        asyncio.run(reducer.reduce())
+
+        self.assertIs(reducer.messages[0], self.system_message)
+        self.assertEqual(reducer.messages[1].role, AuthorRole.USER)
+        self.assertEqual(reducer.messages[-1].content, "Found 20 tickets for turn 5")
+        self.assertNotIn("Search tickets 1", [m.content for m in reducer.messages])
+        self.assertLessEqual(reducer.count_tokens(), 1_200)
+
+        # Function calls are never separated from their results
+        call_ids = {item.id for m in reducer.messages for item in m.items if isinstance(item, FunctionCallContent)}
+        result_ids = {item.id for m in reducer.messages for item in m.items if isinstance(item, FunctionResultContent)}
+        self.assertEqual(call_ids, result_ids)
+
+
+class TestCreateHistoryReducingThread(unittest.TestCase):
+    """Test cases for creating history reducing threads"""
+
+    def test_threads_start_with_the_given_messages(self):
+        """Test that each thread starts with its own copy of the given messages"""
+        welcome = [ChatMessageContent(role=AuthorRole.ASSISTANT, content="Hi, I am Sam")]
+        first = create_history_reducing_thread(messages=welcome)
+        second = create_history_reducing_thread(messages=welcome)
+
+        async def contents(thread: ChatHistoryAgentThread) -> list[str]:
+            return [message.content for message in (await thread.get_messages()).messages]
+
+        asyncio.run(first.on_new_message(ChatMessageContent(role=AuthorRole.USER, content="Hello")))
+
+        self.assertEqual(asyncio.run(contents(first)), ["Hi, I am Sam", "Hello"])
+        self.assertEqual(asyncio.run(contents(second)), ["Hi, I am Sam"])
+        self.assertEqual(len(welcome), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
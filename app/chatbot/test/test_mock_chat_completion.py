@@ -0,0 +1,206 @@
+import asyncio
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from semantic_kernel.connectors.ai.completion_usage import CompletionUsage
+from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
+from semantic_kernel.agents import ChatHistoryAgentThread
+from semantic_kernel.contents import (
+    ChatHistory,
+    ChatMessageContent,
+    FunctionCallContent,
+    FunctionResultContent,
+)
+from semantic_kernel.contents.utils.author_role import AuthorRole
+
+from app.chatbot.factory import create_kernel_with_chat_completion, create_support_ticket_agent
+from app.chatbot.mock_chat_completion import (
+    MockChatCompletion,
+    MockFunctionCall,
+    MockResponse,
+    load_mock_script,
+    mock_conversation,
+    mock_responses_from_history,
+)
+
+
+class TestMockChatCompletion(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the scripted chat completion service"""
+
+    async def test_responses_are_replayed_in_order(self):
+        """Test that scripted responses are returned in order and replayed once exhausted"""
+        service = MockChatCompletion(responses=[MockResponse(content="first"), MockResponse(content="second")])
+        history = ChatHistory()
+        history.add_user_message("Hello")
+
+        contents = [
+            await service.get_chat_message_content(history, PromptExecutionSettings()) for _ in range(3)
+        ]
+
+        self.assertEqual([str(c) for c in contents], ["first", "second", "first"])
+
+    async def test_concurrent_conversations_replay_the_whole_script(self):
+        """Test that conversations sharing a service each replay its script from the start"""
+        service = MockChatCompletion(
+            responses=[MockResponse(content="first"), MockResponse(content="second")], latency_seconds=0.01
+        )
+
+        async def converse() -> list[str]:
+            with mock_conversation():
+                contents: list[str] = []
+                for _ in range(2):
+                    contents.append(str(await service.get_chat_message_content(ChatHistory(), PromptExecutionSettings())))
+                    await asyncio.sleep(0)
+                return contents
+
+        conversations = await asyncio.gather(converse(), converse(), converse())
+
+        self.assertEqual(conversations, [["first", "second"]] * 3)
+
+    async def test_function_calls_and_usage(self):
+        """Test that scripted tool calls are returned with their token usage"""
+        service = MockChatCompletion(
+            responses=[
+                MockResponse(
+                    function_calls=(MockFunctionCall("TicketManagementPlugin-get_ticket", {"ticket_id": "TKT-1"}),),
+                    prompt_tokens=100,
+                    completion_tokens=12,
+                )
+            ]
+        )
+
+        content = await service.get_chat_message_content(ChatHistory(), PromptExecutionSettings())
+
+        assert content is not None
+        function_calls = [item for item in content.items if isinstance(item, FunctionCallContent)]
+        self.assertEqual(len(function_calls), 1)
+        self.assertEqual(function_calls[0].plugin_name, "TicketManagementPlugin")
+        self.assertEqual(function_calls[0].function_name, "get_ticket")
+        self.assertEqual(function_calls[0].to_kernel_arguments(), {"ticket_id": "TKT-1"})
+        self.assertEqual(content.metadata["usage"], CompletionUsage(prompt_tokens=100, completion_tokens=12))
+
+    async def test_latency(self):
+        """Test that responses are delayed by the request and per token latency"""
+        service = MockChatCompletion(
+            responses=[MockResponse(content="Hi", completion_tokens=10)],
+            latency_seconds=0.05,
+            token_latency_seconds=0.005,
+        )
+
+        started_at = time.monotonic()
+        await service.get_chat_message_content(ChatHistory(), PromptExecutionSettings())
+
+        self.assertGreaterEqual(time.monotonic() - started_at, 0.1)
+
+    async def test_streaming(self):
+        """Test that the streamed chunks add up to the scripted response"""
+        service = MockChatCompletion(responses=[MockResponse(content="Your ticket was created")])
+
+        chunks = [
+            chunk[0]
+            async for chunk in service.get_streaming_chat_message_contents(ChatHistory(), PromptExecutionSettings())
+        ]
+
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual("".join(chunk.content for chunk in chunks), "Your ticket was created")
+
+    async def test_kernel_invokes_scripted_function_calls(self):
+        """Test that the kernel created by the factory uses the mock service and runs the scripted tool calls"""
+        with patch.dict(os.environ, {"CHAT_COMPLETION_SERVICE": "mock"}):
+            kernel = create_kernel_with_chat_completion(service_id="SupportTicketAgent")
+        self.assertIsInstance(kernel.get_service("SupportTicketAgent"), MockChatCompletion)
+
+        # Replace the default script with a tool call followed by an answer
+        kernel.remove_all_services()
+        kernel.add_service(
+            MockChatCompletion(
+                service_id="SupportTicketAgent",
+                responses=[
+                    MockResponse(function_calls=(MockFunctionCall("ReferenceDataPlugin-get_departments"),)),
+                    MockResponse(content="Here are the departments"),
+                ],
+            )
+        )
+        agent = create_support_ticket_agent(name="SupportTicketAgent", kernel=kernel)
+        thread = ChatHistoryAgentThread()
+
+        response = await agent.get_response(messages="Which departments are there?", thread=thread)
+
+        self.assertEqual(str(response), "Here are the departments")
+        history = await thread.get_messages()
+        function_results = [
+            item for message in history for item in message.items if isinstance(item, FunctionResultContent)
+        ]
+        self.assertEqual(len(function_results), 1)
+        self.assertIn("IT", str(function_results[0].result))
+
+    def test_recorded_conversation_is_replayed(self):
+        """Test that recorded assistant messages, including tool calls, become responses"""
+        history = ChatHistory()
+        history.add_user_message("Find my VPN tickets")
+        history.add_message(
+            ChatMessageContent(
+                role=AuthorRole.ASSISTANT,
+                items=[
+                    FunctionCallContent(
+                        id="call_1", name="TicketManagementPlugin-search_tickets", arguments='{"query": "VPN"}'
+                    )
+                ],
+            )
+        )
+        history.add_assistant_message("I found one ticket")
+
+        responses = mock_responses_from_history(history)
+
+        self.assertEqual(
+            responses,
+            [
+                MockResponse(
+                    function_calls=(MockFunctionCall("TicketManagementPlugin-search_tickets", {"query": "VPN"}),)
+                ),
+                MockResponse(content="I found one ticket"),
+            ],
+        )
+
+    def test_load_script(self):
+        """Test that scripts accept scripted and recorded entries and skip non-assistant messages"""
+        script = {
+            "UserAgent": [{"content": "The session is finished.", "completion_tokens": 5}],
+            "SupportTicketAgent": [
+                {"role": "user", "content": "Find my VPN tickets"},
+                {
+                    "role": "assistant",
+                    "tool_calls": [
+                        {
+                            "id": "call_1",
+                            "type": "function",
+                            "function": {"name": "TicketManagementPlugin-search_tickets", "arguments": '{"query": "VPN"}'},
+                        }
+                    ],
+                },
+            ],
+        }
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as f:
+            json.dump(script, f)
+        self.addCleanup(os.remove, f.name)
+
+        loaded = load_mock_script(f.name)
+
+        self.assertEqual(loaded["UserAgent"], (MockResponse(content="The session is finished.", completion_tokens=5),))
+        self.assertEqual(
+            loaded["SupportTicketAgent"],
+            (MockResponse(function_calls=(MockFunctionCall("TicketManagementPlugin-search_tickets", {"query": "VPN"}),)),),
+        )
+
+    def test_empty_responses(self):
+        """Test that a service needs at least one response"""
+        with self.assertRaises(ValueError):
+            MockChatCompletion(responses=[])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+import os
+import unittest
+from unittest.mock import patch
+
+from semantic_kernel.agents import ChatHistoryAgentThread
+from semantic_kernel.connectors.ai.completion_usage import CompletionUsage
+from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
+from semantic_kernel.contents import ChatHistory, FunctionCallContent
+from semantic_kernel.kernel import Kernel
+
+from app.chatbot.factory import create_kernel_with_chat_completion, create_support_ticket_agent
+from app.chatbot.mock_chat_completion import MockChatCompletion, MockFunctionCall, MockResponse
+from app.chatbot.response_cache import CacheMode, CachingChatCompletion, ChatResponseCache
+from app.chatbot.storage.backends import Storage
+from app.chatbot.storage.memory import InMemoryActionItemRepository, InMemoryTicketRepository
+
+
+def _history(message: str) -> ChatHistory:
+    history = ChatHistory()
+    history.add_user_message(message)
+    return history
+
+
+class TestResponseCache(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the chat completion response cache"""
+
+    def setUp(self):
+        self.cache = ChatResponseCache(":memory:")
+        self.addCleanup(self.cache.close)
+
+    def _service(self, content: str, mode: CacheMode) -> CachingChatCompletion:
+        return CachingChatCompletion(
+            MockChatCompletion(responses=[MockResponse(content=content, completion_tokens=3)], service_id="agent"),
+            self.cache,
+            mode,
+        )
+
+    async def test_replay_serves_recorded_responses(self):
+        """Test that replayed responses are the recorded ones, not the service responses"""
+        recorder = self._service("recorded", CacheMode.RECORD)
+        replayer = self._service("live", CacheMode.REPLAY)
+
+        await recorder.get_chat_message_content(_history("Hello"), PromptExecutionSettings())
+        replayed = await replayer.get_chat_message_content(_history("Hello"), PromptExecutionSettings())
+
+        assert replayed is not None
+        self.assertEqual(str(replayed), "recorded")
+        self.assertIsInstance(replayed.metadata["usage"], CompletionUsage)
+        self.assertEqual(replayed.metadata["usage"].completion_tokens, 3)
+
+    async def test_replay_records_cache_misses(self):
+        """Test that a replay cache miss calls the service and records its response"""
+        replayer = self._service("live", CacheMode.REPLAY)
+
+        first = await replayer.get_chat_message_content(_history("Hello"), PromptExecutionSettings())
+        other = await replayer.get_chat_message_content(_history("Goodbye"), PromptExecutionSettings())
+
+        self.assertEqual((str(first), str(other)), ("live", "live"))
+        self.assertEqual(len(self.cache), 2)
+
+    async def test_record_replaces_cached_responses(self):
+        """Test that record mode always calls the service"""
+        await self._service("old", CacheMode.RECORD).get_chat_message_content(_history("Hi"), PromptExecutionSettings())
+        await self._service("new", CacheMode.RECORD).get_chat_message_content(_history("Hi"), PromptExecutionSettings())
+
+        replayed = await self._service("live", CacheMode.REPLAY).get_chat_message_content(
+            _history("Hi"), PromptExecutionSettings()
+        )
+
+        self.assertEqual(str(replayed), "new")
+        self.assertEqual(len(self.cache), 1)
+
+    async def test_passthrough_does_not_use_the_cache(self):
+        """Test that passthrough mode neither reads nor writes the cache"""
+        await self._service("recorded", CacheMode.RECORD).get_chat_message_content(
+            _history("Hi"), PromptExecutionSettings()
+        )
+
+        response = await self._service("live", CacheMode.PASSTHROUGH).get_chat_message_content(
+            _history("Hi"), PromptExecutionSettings()
+        )
+
+        self.assertEqual(str(response), "live")
+        self.assertEqual(len(self.cache), 1)
+
+    def test_key_covers_model_settings_and_messages(self):
+        """Test that requests differing in model, settings or messages have different keys"""
+        key = ChatResponseCache.key("gpt-4o", {"temperature": 0.3}, _history("Hello"))
+
+        self.assertEqual(key, ChatResponseCache.key("gpt-4o", {"temperature": 0.3}, _history("Hello")))
+        self.assertNotEqual(key, ChatResponseCache.key("gpt-4o-mini", {"temperature": 0.3}, _history("Hello")))
+        self.assertNotEqual(key, ChatResponseCache.key("gpt-4o", {"temperature": 0.9}, _history("Hello")))
+        self.assertNotEqual(key, ChatResponseCache.key("gpt-4o", {"temperature": 0.3}, _history("Hello!")))
+
+    async def test_agent_replays_function_calls(self):
+        """Test that an agent replays recorded tool calls and still runs the functions"""
+        responses = [
+            MockResponse(function_calls=(MockFunctionCall("ReferenceDataPlugin-get_departments"),)),
+            MockResponse(content="Here are the departments"),
+        ]
+
+        async def ask(service: MockChatCompletion, mode: CacheMode) -> tuple[str, ChatHistory]:
+            kernel = Kernel()
+            kernel.add_service(CachingChatCompletion(service, self.cache, mode))
+            agent = create_support_ticket_agent(name="agent", kernel=kernel)
+            thread = ChatHistoryAgentThread()
+            response = await agent.get_response(messages="Which departments are there?", thread=thread)
+            return str(response), await thread.get_messages()
+
+        await ask(MockChatCompletion(responses=responses, service_id="agent"), CacheMode.RECORD)
+        response, history = await ask(
+            MockChatCompletion(responses=[MockResponse(content="live")], service_id="agent"), CacheMode.REPLAY
+        )
+
+        self.assertEqual(response, "Here are the departments")
+        function_calls = [item for message in history for item in message.items if isinstance(item, FunctionCallContent)]
+        self.assertEqual([f.name for f in function_calls], ["ReferenceDataPlugin-get_departments"])
+
+    async def test_agent_replays_created_tickets(self):
+        """Test that the ids and timestamps of created tickets do not make the following requests miss the cache"""
+        create_ticket = MockFunctionCall(
+            "TicketManagementPlugin-create_support_ticket",
+            {
+                "title": "Compliance audit",
+                "department_code": "IT",
+                "priority": "High",
+                "workflow_type": "Standard",
+                "description": "Upcoming compliance audit",
+                "expected_outcome": "Audit passed",
+            },
+        )
+
+        async def ask(service: MockChatCompletion, mode: CacheMode) -> str:
+            kernel = Kernel()
+            kernel.add_service(CachingChatCompletion(service, self.cache, mode))
+            storage = Storage(tickets=InMemoryTicketRepository(), action_items=InMemoryActionItemRepository())
+            agent = create_support_ticket_agent(name="agent", kernel=kernel, storage=storage)
+            response = await agent.get_response(messages="Create a ticket", thread=ChatHistoryAgentThread())
+            self.assertEqual(len(storage.tickets), 1)
+            return str(response)
+
+        responses = [MockResponse(function_calls=(create_ticket,)), MockResponse(content="Ticket created")]
+        await ask(MockChatCompletion(responses=responses, service_id="agent"), CacheMode.RECORD)
+        response = await ask(
+            MockChatCompletion(responses=[MockResponse(content="LIVE CALL")], service_id="agent"), CacheMode.REPLAY
+        )
+
+        self.assertEqual(response, "Ticket created")
+        self.assertEqual(len(self.cache), 2)
+
+    def test_factory_wraps_services_when_caching(self):
+        """Test that kernels use the cache only when a cache mode is configured"""
+        with patch.dict(os.environ, {"CHAT_COMPLETION_SERVICE": "mock"}):
+            self.assertIsInstance(create_kernel_with_chat_completion("agent").get_service("agent"), MockChatCompletion)
+
+        with patch.dict(
+            os.environ,
+            {"CHAT_COMPLETION_SERVICE": "mock", "CHAT_COMPLETION_CACHE_MODE": "replay", "CHAT_COMPLETION_CACHE_PATH": ":memory:"},
+        ):
+            service = create_kernel_with_chat_completion("agent").get_service("agent")
+
+        self.assertIsInstance(service, CachingChatCompletion)
+        assert isinstance(service, CachingChatCompletion)
+        self.assertEqual(service.mode, CacheMode.REPLAY)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+
+from app.chatbot.session_manager import ChatSessionManager
+
+
+class FakeClock:
+    """Manually advanced clock for deterministic timeout tests"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestChatSessionManager(unittest.TestCase):
+    """Test cases for the Chat Session Manager"""
+
+    def setUp(self):
+        """Set up the test environment before each test method"""
+        self.clock = FakeClock()
+        self.manager = ChatSessionManager(
+            idle_timeout_seconds=60, max_sessions=2, clock=self.clock
+        )
+
+    def test_sessions_have_separate_threads(self):
+        """Test that each session gets its own conversation thread"""
+        session_a = self.manager.get_session("a")
+        session_b = self.manager.get_session("b")
+
+        self.assertIsNot(session_a.thread, session_b.thread)
+        self.assertIs(self.manager.get_session("a").thread, session_a.thread)
+        self.assertEqual(len(self.manager), 2)
+
+    def test_idle_sessions_are_evicted(self):
+        """Test that sessions idle for longer than the timeout are evicted"""
+        self.manager.get_session("a")
+        self.clock.now = 30
+        self.manager.get_session("b")
+
+        self.clock.now = 70
+        self.manager.get_session("b")
+
+        self.assertNotIn("a", self.manager)
+        self.assertIn("b", self.manager)
+
+    def test_least_recently_used_session_is_evicted_at_capacity(self):
+        """Test that the live session cap evicts the least recently used session"""
+        self.manager.get_session("a")
+        self.manager.get_session("b")
+        # Touch "a" so that "b" becomes the least recently used session
+        self.manager.get_session("a")
+        self.manager.get_session("c")
+
+        self.assertEqual(len(self.manager), 2)
+        self.assertIn("a", self.manager)
+        self.assertNotIn("b", self.manager)
+        self.assertIn("c", self.manager)
+
+    def test_remove_session(self):
+        """Test removing a session explicitly"""
+        self.manager.get_session("a")
+        self.manager.remove_session("a")
+
+        self.assertNotIn("a", self.manager)
+
+
+if __name__ == "__main__":
+    unittest.main()
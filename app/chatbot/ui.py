@@ -1,30 +1,93 @@
 import asyncio
+import os
+from collections.abc import AsyncGenerator
 import gradio as gr
 
 from dotenv import load_dotenv
-from app.chatbot.chatbot import Chatbot
+from semantic_kernel.contents import ChatMessageContent
+from semantic_kernel.contents.utils.author_role import AuthorRole
+from app.chatbot.chatbot import Chatbot, ChatStreamEventType
+from app.chatbot.client_registry import close_client_registry
+from app.chatbot.history_reducer import DEFAULT_HISTORY_TOKEN_BUDGET, create_history_reducing_thread
+from app.chatbot.session_manager import DEFAULT_SESSION_ID, ChatSessionManager
 
 
 async def main():
-    # Create an instance of the Support Ticket ChatBot
-    bot = Chatbot.create_support_ticket_chatbot()
-    title = "Sam, your Support Ticket Assistant"
+    # Every conversation starts with the welcome message, added once it is generated below
+    welcome_messages: list[ChatMessageContent] = []
 
-    welcome_message: gr.MessageDict = gr.MessageDict(
-        content=await bot.chat(""), role="assistant"
+    # Create an instance of the Support Ticket ChatBot with one conversation thread per browser session
+    bot = Chatbot.create_support_ticket_chatbot(
+        session_manager=ChatSessionManager(
+            idle_timeout_seconds=float(os.getenv("CHATBOT_SESSION_IDLE_TIMEOUT", 30 * 60)),
+            max_sessions=int(os.getenv("CHATBOT_MAX_SESSIONS", 1000)),
+            thread_factory=lambda: create_history_reducing_thread(
+                max_tokens=int(os.getenv("CHATBOT_HISTORY_TOKEN_BUDGET", DEFAULT_HISTORY_TOKEN_BUDGET)),
+                messages=welcome_messages,
+            ),
+        ),
+        # Keep the ticket changes of each browser session private instead of sharing them with all users
+        isolate_sessions=os.getenv("CHATBOT_ISOLATE_SESSIONS", "false").lower() == "true",
     )
+    title = "Sam, your Support Ticket Assistant"
+
+    welcome = await bot.chat("")
+    welcome_message: gr.MessageDict = gr.MessageDict(content=welcome, role="assistant")
+    # The welcome message is shared by all users, drop the thread that produced it and
+    # seed the thread of each browser session with it instead
+    bot.sessions.remove_session(DEFAULT_SESSION_ID)
+    welcome_messages.append(ChatMessageContent(role=AuthorRole.ASSISTANT, content=welcome))
+
+    async def chat(
+        message: str, history: list[gr.MessageDict], request: gr.Request
+    ) -> AsyncGenerator[list[gr.ChatMessage], None]:
+        # Gradio injects the request, its session hash identifies the browser session
+        session_id = request.session_hash or DEFAULT_SESSION_ID
+
+        # Tool calls are shown as collapsible steps above the streamed answer
+        tool_steps: list[gr.ChatMessage] = []
+        # Pending steps with the call ID of their function call, a function can be called several times
+        pending_steps: list[tuple[str | None, gr.ChatMessage]] = []
+        answer = ""
+        async for event in bot.chat_stream(message, session_id=session_id):
+            if event.type == ChatStreamEventType.FUNCTION_CALL:
+                step = gr.ChatMessage(
+                    role="assistant",
+                    content=f"Calling `{event.content}`",
+                    metadata={"title": "🛠️ Working on your request", "status": "pending"},
+                )
+                tool_steps.append(step)
+                pending_steps.append((event.call_id, step))
+            elif event.type == ChatStreamEventType.FUNCTION_RESULT:
+                # Complete the step of the same call, or the first pending step of the function without a call ID
+                for index, (call_id, step) in enumerate(pending_steps):
+                    same_call = call_id == event.call_id if event.call_id else step.content == f"Calling `{event.content}`"
+                    if same_call:
+                        step.metadata["status"] = "done"
+                        del pending_steps[index]
+                        break
+            else:
+                answer += event.content
+
+            yield [*tool_steps, gr.ChatMessage(role="assistant", content=answer)]
 
     # Create Support Ticket Management interface
     chat_interface = gr.ChatInterface(
         type="messages",
-        fn=bot.chat,
+        fn=chat,
         chatbot=gr.Chatbot(type="messages", value=[welcome_message]),
         title=title,
         description="I can help you create and manage support tickets and action items.",
         theme="default",
+        # Independent sessions can be served in parallel
+        concurrency_limit=None,
     )
 
-    chat_interface.launch()
+    try:
+        chat_interface.launch()
+    finally:
+        # Close the pooled Azure OpenAI connections at shutdown
+        await close_client_registry()
 
 
 # Run the main function
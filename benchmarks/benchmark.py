@@ -0,0 +1,154 @@
+import json
+import os
+import platform
+import statistics
+import timeit
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any
+
+DEFAULT_REPEAT = 5
+DEFAULT_MIN_TIME = 0.2
+DEFAULT_THRESHOLD = 0.2
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    Timings of one benchmark at one data size, in seconds per call.
+    """
+    name: str
+    size: int
+    # Number of calls timed together, repeated `repeat` times
+    number: int
+    repeat: int
+    best: float
+    median: float
+    mean: float
+
+
+@dataclass
+class Comparison:
+    """
+    A benchmark result compared to the baseline result of the same benchmark and size.
+    """
+    name: str
+    size: int
+    baseline: float
+    current: float
+    # Current time relative to the baseline time, 1.2 means 20% slower
+    ratio: float
+    regression: bool
+
+
+def measure(
+    name: str,
+    size: int,
+    function: Callable[[], object],
+    repeat: int = DEFAULT_REPEAT,
+    min_time: float = DEFAULT_MIN_TIME,
+) -> BenchmarkResult:
+    """
+    Time a function, calling it as many times as needed for each timing to take at least min_time.
+
+    Args:
+        name (str): name of the benchmark
+        size (int): data size of the benchmark
+        function (Callable[[], object]): the function to time
+        repeat (int): number of timings
+        min_time (float): minimum duration of each timing in seconds
+    Returns:
+        BenchmarkResult: the time per call
+    """
+    timer = timeit.Timer(function)
+    number = 1
+    # Same approach as Timer.autorange, with a configurable minimum duration
+    while timer.timeit(number) < min_time:
+        number *= 10 if number < 1000 else 2
+    timings = [total / number for total in timer.repeat(repeat=repeat, number=number)]
+    return BenchmarkResult(
+        name=name,
+        size=size,
+        number=number,
+        repeat=repeat,
+        best=min(timings),
+        median=statistics.median(timings),
+        mean=statistics.fmean(timings),
+    )
+
+
+def save_results(results: list[BenchmarkResult], path: str) -> None:
+    """
+    Save benchmark results to a JSON file, with the environment they were measured in.
+
+    Args:
+        results (list[BenchmarkResult]): the results to save
+        path (str): path to the JSON file
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    report = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": [asdict(result) for result in results],
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=4)
+
+
+def load_results(path: str) -> list[BenchmarkResult]:
+    """
+    Load benchmark results saved by save_results.
+
+    Args:
+        path (str): path to the JSON file
+    Returns:
+        list[BenchmarkResult]: the saved results
+    """
+    with open(path, encoding="utf-8") as f:
+        report: dict[str, Any] = json.load(f)
+    return [BenchmarkResult(**result) for result in report["results"]]
+
+
+def compare_results(
+    results: list[BenchmarkResult],
+    baseline: list[BenchmarkResult],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[Comparison]:
+    """
+    Compare results to a baseline on the best time of each benchmark, the least noisy timing.
+    Results without a baseline result of the same benchmark and size are skipped.
+
+    Args:
+        results (list[BenchmarkResult]): the current results
+        baseline (list[BenchmarkResult]): the baseline results
+        threshold (float): relative slowdown above which a result is a regression, 0.2 for 20%
+    Returns:
+        list[Comparison]: the comparisons, in the order of the current results
+    """
+    baseline_times = {(result.name, result.size): result.best for result in baseline}
+    comparisons: list[Comparison] = []
+    for result in results:
+        baseline_time = baseline_times.get((result.name, result.size))
+        if baseline_time is None:
+            continue
+        ratio = result.best / baseline_time if baseline_time > 0 else float("inf")
+        comparisons.append(
+            Comparison(
+                name=result.name,
+                size=result.size,
+                baseline=baseline_time,
+                current=result.best,
+                ratio=ratio,
+                regression=ratio > 1 + threshold,
+            )
+        )
+    return comparisons
+
+
+def format_duration(seconds: float) -> str:
+    for unit, scale in [("s", 1.0), ("ms", 1e-3), ("µs", 1e-6)]:
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
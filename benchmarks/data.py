@@ -0,0 +1,170 @@
+import random
+from datetime import datetime, timedelta
+
+from app.chatbot.data_models.ticket_models import (
+    ActionItem,
+    ActionItemStatus,
+    SupportTicket,
+    TicketPriority,
+    TicketWorkflowType,
+)
+from evaluation.chatbot.models import FunctionCall
+
+RANDOM_SEED = 42
+
+DEPARTMENT_CODES = ["IT", "HR", "FIN", "MKTG", "OPS", "CUST", "PROD"]
+ASSIGNEES = ["Alice Smith", "Bob Jones", "Carol White", "David Brown", "Eve Davis"]
+WORDS = (
+    "printer network vpn laptop access password email server database backup invoice payroll "
+    "onboarding audit license update outage slow crash error report campaign budget contract "
+    "shipment customer refund portal dashboard migration policy training security certificate "
+    "storage monitor keyboard meeting calendar approval vendor release deployment"
+).split()
+FUNCTION_NAMES = [
+    "TicketManagementPlugin-create_support_ticket",
+    "TicketManagementPlugin-update_support_ticket",
+    "TicketManagementPlugin-get_support_ticket",
+    "TicketManagementPlugin-search_tickets",
+    "ActionItemPlugin-create_action_item",
+    "ActionItemPlugin-update_action_item",
+    "ActionItemPlugin-get_ticket_action_items",
+    "ReferenceDataPlugin-get_departments",
+]
+BASE_TIME = datetime(2025, 1, 1, 9, 0)
+
+
+def ticket_id(index: int) -> str:
+    return f"TKT-{index:07d}"
+
+
+def generate_tickets(count: int, seed: int = RANDOM_SEED) -> dict[str, SupportTicket]:
+    """
+    Generate synthetic support tickets with random text from a small vocabulary, so that
+    searches match a realistic share of the tickets.
+
+    Args:
+        count (int): number of tickets
+        seed (int): random seed, the same seed always generates the same tickets
+    Returns:
+        dict[str, SupportTicket]: the tickets by ID
+    """
+    rng = random.Random(seed)
+    priorities = list(TicketPriority)
+    workflow_types = list(TicketWorkflowType)
+    tickets: dict[str, SupportTicket] = {}
+    for index in range(count):
+        created_at = BASE_TIME + timedelta(minutes=index)
+        tickets[ticket_id(index)] = SupportTicket(
+            ticket_id=ticket_id(index),
+            title=" ".join(rng.choices(WORDS, k=3)).capitalize(),
+            department_code=rng.choice(DEPARTMENT_CODES),
+            priority=rng.choice(priorities),
+            workflow_type=rng.choice(workflow_types),
+            description=" ".join(rng.choices(WORDS, k=12)).capitalize(),
+            expected_outcome=" ".join(rng.choices(WORDS, k=4)).capitalize(),
+            customer_visible=rng.random() < 0.5,
+            created_at=created_at,
+        )
+    return tickets
+
+
+def generate_action_items(
+    tickets: dict[str, SupportTicket], per_ticket: int = 3, seed: int = RANDOM_SEED
+) -> dict[str, ActionItem]:
+    """
+    Generate synthetic action items for tickets.
+
+    Args:
+        tickets (dict[str, SupportTicket]): the tickets the action items belong to
+        per_ticket (int): maximum number of action items per ticket, each ticket gets 0 to per_ticket
+        seed (int): random seed, the same seed always generates the same action items
+    Returns:
+        dict[str, ActionItem]: the action items by ID
+    """
+    rng = random.Random(seed)
+    statuses = list(ActionItemStatus)
+    action_items: dict[str, ActionItem] = {}
+    for ticket in tickets.values():
+        for _ in range(rng.randint(0, per_ticket)):
+            action_id = f"ACT-{len(action_items):07d}"
+            action_items[action_id] = ActionItem(
+                action_id=action_id,
+                parent_ticket_id=ticket.ticket_id,
+                title=" ".join(rng.choices(WORDS, k=4)).capitalize(),
+                assignee=rng.choice(ASSIGNEES),
+                status=rng.choice(statuses),
+                due_date=BASE_TIME + timedelta(days=rng.randint(1, 60)),
+                created_at=ticket.created_at,
+            )
+    return action_items
+
+
+def generate_function_calls(
+    count: int, seed: int = RANDOM_SEED
+) -> tuple[list[FunctionCall], list[FunctionCall]]:
+    """
+    Generate the actual and expected function calls of a conversation. The actual calls are the
+    expected calls shuffled, with some argument values reworded, some calls missing and some
+    unexpected calls added.
+
+    Args:
+        count (int): number of expected calls
+        seed (int): random seed, the same seed always generates the same calls
+    Returns:
+        tuple[list[FunctionCall], list[FunctionCall]]: the actual calls and the expected calls
+    """
+    rng = random.Random(seed)
+    expected_calls = [
+        FunctionCall(
+            functionName=rng.choice(FUNCTION_NAMES),
+            arguments={
+                "ticket_id": ticket_id(rng.randrange(count)),
+                "title": " ".join(rng.choices(WORDS, k=3)).capitalize(),
+                "description": " ".join(rng.choices(WORDS, k=8)),
+                "priority": rng.choice(list(TicketPriority)).value,
+            },
+        )
+        for _ in range(count)
+    ]
+
+    actual_calls: list[FunctionCall] = []
+    for call in expected_calls:
+        draw = rng.random()
+        if draw < 0.1:
+            continue
+        arguments = dict(call.arguments)
+        if draw < 0.4:
+            arguments["description"] = f"{arguments['description']} {rng.choice(WORDS)}".upper()
+        actual_calls.append(FunctionCall(functionName=call.functionName, arguments=arguments))
+    actual_calls.extend(
+        FunctionCall(functionName=rng.choice(FUNCTION_NAMES), arguments={"title": rng.choice(WORDS)})
+        for _ in range(count // 10)
+    )
+    rng.shuffle(actual_calls)
+    return actual_calls, expected_calls
+
+
+def generate_text_pairs(count: int, seed: int = RANDOM_SEED) -> list[tuple[str, str]]:
+    """
+    Generate pairs of texts to compare: identical, reworded and unrelated texts.
+
+    Args:
+        count (int): number of pairs
+        seed (int): random seed, the same seed always generates the same pairs
+    Returns:
+        list[tuple[str, str]]: the pairs of texts
+    """
+    rng = random.Random(seed)
+    pairs: list[tuple[str, str]] = []
+    for index in range(count):
+        text = " ".join(rng.choices(WORDS, k=rng.randint(2, 20)))
+        if index % 3 == 0:
+            other = text
+        elif index % 3 == 1:
+            words = text.split()
+            words[rng.randrange(len(words))] = rng.choice(WORDS)
+            other = f"{' '.join(words).title()}!"
+        else:
+            other = " ".join(rng.choices(WORDS, k=rng.randint(2, 20)))
+        pairs.append((text, other))
+    return pairs
@@ -0,0 +1,200 @@
+import argparse
+import asyncio
+import gc
+import itertools
+import os
+import sys
+from collections.abc import Callable
+
+from app.chatbot.plugins.support_ticket_system.action_item_plugin import ActionItemPlugin
+from app.chatbot.plugins.support_ticket_system.ticket_management_plugin import TicketManagementPlugin
+from app.chatbot.storage.memory import InMemoryActionItemRepository, InMemoryTicketRepository
+from benchmarks.benchmark import (
+    DEFAULT_MIN_TIME,
+    DEFAULT_REPEAT,
+    DEFAULT_THRESHOLD,
+    BenchmarkResult,
+    Comparison,
+    compare_results,
+    format_duration,
+    load_results,
+    measure,
+    save_results,
+)
+from benchmarks.data import (
+    generate_action_items,
+    generate_function_calls,
+    generate_text_pairs,
+    generate_tickets,
+)
+from evaluation.chatbot.evaluators.compare import is_similar, normalize_text
+from evaluation.chatbot.evaluators.matching import match_function_calls
+
+# pyright: reportPrivateUsage=false
+
+# Number of tickets in the ticket store
+DEFAULT_STORE_SIZES = [10**2, 10**3, 10**4, 10**5, 10**6]
+# Number of function calls matched and of texts compared by the evaluators
+DEFAULT_EVALUATOR_SIZES = [10, 100, 1000]
+DEFAULT_OUTPUT = "benchmarks/results/latest.json"
+# Tickets whose action items are listed, cycled through so lookups are not always the same
+ACTION_ITEM_TICKET_SAMPLE = 1000
+
+
+def run_store_benchmarks(size: int, repeat: int, min_time: float) -> list[BenchmarkResult]:
+    """
+    Benchmark the plugins on an in-memory store of synthetic tickets and action items.
+
+    Args:
+        size (int): number of tickets in the store
+        repeat (int): number of timings of each benchmark
+        min_time (float): minimum duration of each timing in seconds
+    Returns:
+        list[BenchmarkResult]: the results of the plugin benchmarks
+    """
+    tickets = generate_tickets(size)
+    action_items = generate_action_items(tickets)
+    ticket_plugin = TicketManagementPlugin(InMemoryTicketRepository(tickets))
+    action_item_plugin = ActionItemPlugin(InMemoryActionItemRepository(action_items))
+    ticket_ids = itertools.cycle(list(itertools.islice(tickets, ACTION_ITEM_TICKET_SAMPLE)))
+
+    with asyncio.Runner() as runner:
+        benchmarks: list[tuple[str, Callable[[], object]]] = [
+            (
+                "search_tickets[query]",
+                lambda: runner.run(ticket_plugin.search_tickets(search_query="printer outage")),
+            ),
+            (
+                "search_tickets[filters]",
+                lambda: runner.run(ticket_plugin.search_tickets(department_code="IT", priority="High")),
+            ),
+            (
+                "search_tickets[query+filters]",
+                lambda: runner.run(
+                    ticket_plugin.search_tickets(search_query="printer outage", department_code="IT", priority="High")
+                ),
+            ),
+            (
+                "get_ticket_action_items",
+                lambda: runner.run(action_item_plugin.get_ticket_action_items(next(ticket_ids))),
+            ),
+            (
+                "_ticket_to_dict",
+                lambda: [ticket_plugin._ticket_to_dict(ticket) for ticket in tickets.values()],
+            ),
+        ]
+        return [_measure(name, size, function, repeat, min_time) for name, function in benchmarks]
+
+
+def run_evaluator_benchmarks(size: int, repeat: int, min_time: float) -> list[BenchmarkResult]:
+    """
+    Benchmark the evaluators on synthetic function calls and texts. The text normalization cache is
+    cleared before every call, as evaluation rows rarely repeat texts.
+
+    Args:
+        size (int): number of expected function calls and of compared texts
+        repeat (int): number of timings of each benchmark
+        min_time (float): minimum duration of each timing in seconds
+    Returns:
+        list[BenchmarkResult]: the results of the evaluator benchmarks
+    """
+    actual_calls, expected_calls = generate_function_calls(size)
+    text_pairs = generate_text_pairs(size)
+
+    def match_calls() -> object:
+        normalize_text.cache_clear()
+        return match_function_calls(actual_calls, expected_calls)
+
+    def compare_texts() -> object:
+        normalize_text.cache_clear()
+        return [is_similar(text, other) for text, other in text_pairs]
+
+    return [
+        _measure("match_function_calls", size, match_calls, repeat, min_time),
+        _measure("is_similar", size, compare_texts, repeat, min_time),
+    ]
+
+
+def run_benchmarks(
+    store_sizes: list[int] = DEFAULT_STORE_SIZES,
+    evaluator_sizes: list[int] = DEFAULT_EVALUATOR_SIZES,
+    repeat: int = DEFAULT_REPEAT,
+    min_time: float = DEFAULT_MIN_TIME,
+) -> list[BenchmarkResult]:
+    """
+    Run all benchmarks at every size.
+
+    Args:
+        store_sizes (list[int]): numbers of tickets in the store for the plugin benchmarks
+        evaluator_sizes (list[int]): numbers of function calls and texts for the evaluator benchmarks
+        repeat (int): number of timings of each benchmark
+        min_time (float): minimum duration of each timing in seconds
+    Returns:
+        list[BenchmarkResult]: the results, by benchmark then size
+    """
+    results: list[BenchmarkResult] = []
+    for size in store_sizes:
+        print(f"Generating {size} tickets...", flush=True)
+        results.extend(run_store_benchmarks(size, repeat, min_time))
+        # Free the tickets of this size before generating the next ones
+        gc.collect()
+    for size in evaluator_sizes:
+        results.extend(run_evaluator_benchmarks(size, repeat, min_time))
+    return sorted(results, key=lambda result: result.name)
+
+
+def _measure(
+    name: str, size: int, function: Callable[[], object], repeat: int, min_time: float
+) -> BenchmarkResult:
+    result = measure(name, size, function, repeat=repeat, min_time=min_time)
+    print(f"{name:<32} {size:>9} {format_duration(result.best):>12}", flush=True)
+    return result
+
+
+def print_comparisons(comparisons: list[Comparison], threshold: float) -> None:
+    print(f"\n{'Benchmark':<32} {'Size':>9} {'Baseline':>12} {'Current':>12} {'Change':>8}")
+    for comparison in comparisons:
+        flag = "  REGRESSION" if comparison.regression else ""
+        print(
+            f"{comparison.name:<32} {comparison.size:>9} {format_duration(comparison.baseline):>12} "
+            f"{format_duration(comparison.current):>12} {comparison.ratio - 1:>+8.0%}{flag}"
+        )
+    regressions = sum(comparison.regression for comparison in comparisons)
+    print(f"\n{regressions} of {len(comparisons)} benchmarks are more than {threshold:.0%} slower than the baseline")
+
+
+def parse_sizes(value: str) -> list[int]:
+    return [int(size) for size in value.split(",") if size]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the chatbot plugins and the evaluators.")
+    parser.add_argument("--store-sizes", type=parse_sizes, default=DEFAULT_STORE_SIZES,
+                        help="Comma-separated numbers of tickets in the store for the plugin benchmarks")
+    parser.add_argument("--evaluator-sizes", type=parse_sizes, default=DEFAULT_EVALUATOR_SIZES,
+                        help="Comma-separated numbers of function calls and texts for the evaluator benchmarks")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Number of timings of each benchmark")
+    parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME,
+                        help="Minimum duration of each timing in seconds")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="JSON file the results are saved to")
+    parser.add_argument("--compare", help="JSON file of baseline results to flag regressions against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Relative slowdown above which a benchmark is a regression, 0.2 for 20%%")
+    args = parser.parse_args()
+
+    if args.compare and not os.path.exists(args.compare):
+        parser.error(f"Baseline results not found: {args.compare}")
+
+    results = run_benchmarks(args.store_sizes, args.evaluator_sizes, args.repeat, args.min_time)
+    save_results(results, args.output)
+    print(f"Results saved to {args.output}")
+
+    if args.compare:
+        comparisons = compare_results(results, load_results(args.compare), args.threshold)
+        print_comparisons(comparisons, args.threshold)
+        if any(comparison.regression for comparison in comparisons):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
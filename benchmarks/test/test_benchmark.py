@@ -0,0 +1,67 @@
+from pathlib import Path
+
+import pytest
+
+from benchmarks.benchmark import BenchmarkResult, compare_results, load_results, measure, save_results
+from benchmarks.data import generate_action_items, generate_function_calls, generate_tickets
+from benchmarks.run import run_benchmarks
+
+
+def result(name: str, size: int, best: float) -> BenchmarkResult:
+    return BenchmarkResult(name=name, size=size, number=1, repeat=1, best=best, median=best, mean=best)
+
+
+def test_compare_results_flags_regressions_above_the_threshold():
+    baseline = [result("search", 100, 1.0), result("search", 1000, 2.0), result("match", 10, 1.0)]
+    current = [result("search", 100, 1.1), result("search", 1000, 3.0), result("match", 100, 5.0)]
+
+    comparisons = compare_results(current, baseline, threshold=0.2)
+
+    # The match benchmark has no baseline at size 100
+    assert [(c.name, c.size, c.regression) for c in comparisons] == [("search", 100, False), ("search", 1000, True)]
+    assert comparisons[1].ratio == pytest.approx(1.5)
+    assert compare_results(current, baseline, threshold=0.6)[1].regression is False
+
+
+def test_results_round_trip(tmp_path: Path):
+    results = [result("search", 100, 0.5), result("match", 10, 0.25)]
+    path = str(tmp_path / "results" / "latest.json")
+
+    save_results(results, path)
+
+    assert load_results(path) == results
+
+
+def test_measure_times_each_call():
+    calls: list[int] = []
+
+    measured = measure("append", 1, lambda: calls.append(1), repeat=3, min_time=0)
+
+    assert (measured.number, measured.repeat) == (1, 3)
+    # One call to calibrate the number of calls, then one per timing
+    assert len(calls) == 4
+    assert 0 <= measured.best <= measured.median
+
+
+def test_synthetic_data_is_reproducible():
+    tickets = generate_tickets(50)
+    action_items = generate_action_items(tickets)
+
+    assert len(tickets) == 50
+    assert {item.parent_ticket_id for item in action_items.values()} <= set(tickets)
+    assert [t.title for t in generate_tickets(50).values()] == [t.title for t in tickets.values()]
+    assert generate_function_calls(20) == generate_function_calls(20)
+
+
+def test_run_benchmarks():
+    results = run_benchmarks(store_sizes=[100], evaluator_sizes=[10], repeat=1, min_time=0)
+
+    assert sorted((r.name, r.size) for r in results) == [
+        ("_ticket_to_dict", 100),
+        ("get_ticket_action_items", 100),
+        ("is_similar", 10),
+        ("match_function_calls", 10),
+        ("search_tickets[filters]", 100),
+        ("search_tickets[query+filters]", 100),
+        ("search_tickets[query]", 100),
+    ]
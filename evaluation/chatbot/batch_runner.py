@@ -0,0 +1,143 @@
+import asyncio
+import itertools
+import logging
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from typing import Any
+
+from evaluation.chatbot.eval_target import error_output
+from evaluation.jsonl import JsonlWriter
+
+# Simulates one dataset row from its instructions, task completion condition and expected function calls
+SimulationTarget = Callable[[str, str, list[dict[str, Any]] | None], Awaitable[dict[str, Any]]]
+
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_ROW_TIMEOUT_SECONDS = 600.0
+
+
+class EvaluationBatchRunner:
+    """
+    Runs the conversation simulations of all evaluation dataset rows concurrently.
+
+    At most `max_concurrency` simulations run at the same time and each row is cancelled after
+    `row_timeout_seconds`, so a stuck conversation cannot stall the whole evaluation. The
+    outputs are precomputed for the evaluation SDK, which then only runs the evaluators.
+    """
+
+    def __init__(
+        self,
+        target: SimulationTarget,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        row_timeout_seconds: float | None = DEFAULT_ROW_TIMEOUT_SECONDS,
+    ):
+        """
+        Args:
+            target (SimulationTarget): Simulates a row, e.g. SupportTicketEvaluationTarget().simulate.
+            max_concurrency (int): Maximum number of rows simulated at the same time.
+            row_timeout_seconds (float|None): Time limit of a single row. If None, rows are not limited.
+        """
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be greater than 0")
+
+        self.target = target
+        self.max_concurrency = max_concurrency
+        self.row_timeout_seconds = row_timeout_seconds
+
+    async def run(self, rows: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Simulate all rows.
+        Args:
+            rows (Iterable[dict[str, Any]]): The dataset rows, with instructions and task_completion_condition.
+        Returns:
+            list[dict[str, Any]]: The rows, in the same order, extended with the simulation outputs
+                (chat_history, function_calls and error_message for failed rows).
+        """
+        return [output async for output in self.iter_ordered_outputs(rows)]
+
+    async def run_to_file(self, rows: Iterable[dict[str, Any]], output_path: str) -> str:
+        """
+        Simulate all rows and write the simulated rows to a JSONL file in the order of the dataset,
+        each row as soon as the rows before it are written. Only the rows completing before an
+        earlier row are kept in memory, and the rows written survive a crash.
+        Args:
+            rows (Iterable[dict[str, Any]]): The dataset rows, e.g. lazily read with iter_rows.
+            output_path (str): Path to the JSONL file.
+        Returns:
+            str: Path to the JSONL file.
+        """
+        with JsonlWriter(output_path) as writer:
+            async for output in self.iter_ordered_outputs(rows):
+                writer.write(output)
+        return output_path
+
+    async def iter_ordered_outputs(self, rows: Iterable[dict[str, Any]]) -> AsyncIterator[dict[str, Any]]:
+        """
+        Simulate the rows and yield their outputs in the order of the dataset.
+        Args:
+            rows (Iterable[dict[str, Any]]): The dataset rows.
+        Returns:
+            AsyncIterator[dict[str, Any]]: The rows extended with their simulation outputs, in the same
+                order. Rows completing before an earlier row are held until that row completes.
+        """
+        completed: dict[int, dict[str, Any]] = {}
+        next_index = 0
+        async for index, output in self.iter_outputs(rows):
+            completed[index] = output
+            while next_index in completed:
+                yield completed.pop(next_index)
+                next_index += 1
+
+    async def iter_outputs(self, rows: Iterable[dict[str, Any]]) -> AsyncIterator[tuple[int, dict[str, Any]]]:
+        """
+        Simulate the rows, only taking the next row from `rows` when a simulation slot is free.
+        Args:
+            rows (Iterable[dict[str, Any]]): The dataset rows.
+        Returns:
+            AsyncIterator[tuple[int, dict[str, Any]]]: The index of each row and the row extended with its
+                simulation outputs, in the order the simulations complete.
+        """
+        started_at = time.monotonic()
+        indexed_rows = enumerate(rows)
+        pending = {
+            asyncio.create_task(self._run_row(index, row))
+            for index, row in itertools.islice(indexed_rows, self.max_concurrency)
+        }
+        row_count = 0
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    next_row = next(indexed_rows, None)
+                    if next_row is not None:
+                        pending.add(asyncio.create_task(self._run_row(*next_row)))
+                    row_count += 1
+                    yield task.result()
+        finally:
+            # The caller stopped early, do not leave simulations running
+            for task in pending:
+                task.cancel()
+
+        logging.info(
+            f"Simulated {row_count} dataset rows in {time.monotonic() - started_at:.1f}s "
+            f"with up to {self.max_concurrency} concurrent simulations"
+        )
+
+    async def _run_row(self, index: int, row: dict[str, Any]) -> tuple[int, dict[str, Any]]:
+        logging.info(f"Simulating dataset row {index + 1}")
+        try:
+            output = await asyncio.wait_for(
+                self.target(
+                    row["instructions"],
+                    row["task_completion_condition"],
+                    row.get("expected_function_calls"),
+                ),
+                timeout=self.row_timeout_seconds,
+            )
+        except TimeoutError:
+            logging.error(f"Dataset row {index + 1} timed out after {self.row_timeout_seconds}s")
+            output = error_output(f"Simulation timed out after {self.row_timeout_seconds}s")
+        except Exception as e:
+            logging.error(f"Dataset row {index + 1} failed: {e}")
+            output = error_output(str(e))
+
+        return index, {**row, **output}
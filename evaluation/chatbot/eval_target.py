@@ -1,5 +1,8 @@
 import asyncio
 import logging
+from typing import Any
+
+from app.chatbot.client_registry import close_client_registry
 from evaluation.chatbot.simulation.chat_simulator import SupportTicketChatSimulator
 from semantic_kernel.contents import ChatHistory
 
@@ -12,23 +15,57 @@ class SupportTicketEvaluationTarget:
         """
         Instantiates a Support Ticket Evaluation Target
         """
+        # Shared by all dataset rows, each simulated conversation gets its own plugin state
+        self.simulator = SupportTicketChatSimulator()
 
-    def __call__(self, instructions: str, task_completion_condition: str): # pyright: ignore[reportUnknownParameterType] As required by the Azure AI Evaluation SDK
+    def __call__(self, instructions: str, task_completion_condition: str, expected_function_calls: list[dict[str, Any]] | None = None): # pyright: ignore[reportUnknownParameterType] As required by the Azure AI Evaluation SDK
         """
         This method simulates a support ticket conversation and should be used by the evaluation framework only.
+        It runs simulate on a new event loop, rows are simulated concurrently by EvaluationBatchRunner instead.
+        The pooled Azure OpenAI connections are closed before the loop ends, the next call opens new ones.
 
         Args:
             instructions (str): instructions for the simulated user
             task_completion_condition (str): task completion identifier string
+            expected_function_calls (list[dict[str, Any]]|None): function calls expected by the task, used to end the conversation early
         """
 
-        try:
-            simulator = SupportTicketChatSimulator()
-            history: ChatHistory = asyncio.get_event_loop().run_until_complete(
-                simulator.run(
+        async def simulate() -> dict[str, Any]:
+            try:
+                return await self.simulate(
                     instructions=instructions,
                     task_completion_condition=task_completion_condition,
+                    expected_function_calls=expected_function_calls,
                 )
+            finally:
+                await close_client_registry()
+
+        return asyncio.run(simulate())
+
+    async def simulate(
+        self,
+        instructions: str,
+        task_completion_condition: str,
+        expected_function_calls: list[dict[str, Any]] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Simulates a support ticket conversation without blocking the event loop, so that several
+        dataset rows can be simulated concurrently (see EvaluationBatchRunner).
+
+        Args:
+            instructions (str): instructions for the simulated user
+            task_completion_condition (str): task completion identifier string
+            expected_function_calls (list[dict[str, Any]]|None): function calls expected by the task, used to end the conversation early
+        Returns:
+            dict[str, Any]: the chat history and function calls of the conversation, or an error message
+        """
+
+        try:
+            simulator = self.simulator
+            history: ChatHistory = await simulator.run(
+                instructions=instructions,
+                task_completion_condition=task_completion_condition,
+                expected_function_calls=expected_function_calls,
             )
 
             function_calls = simulator.get_function_calls(history)
@@ -40,8 +77,13 @@ class SupportTicketEvaluationTarget:
 
         except Exception as e:
             logging.error(f"Error: {e}")
-            return { # pyright: ignore[reportUnknownVariableType] As required by the Azure AI Evaluation SDK
-                "chat_history": [],
-                "function_calls": [],
-                "error_message": str(e)
-            }
+            return error_output(str(e))
+
+
+def error_output(error_message: str) -> dict[str, Any]:
+    """The target output of a dataset row whose simulation failed"""
+    return {
+        "chat_history": [],
+        "function_calls": [],
+        "error_message": error_message,
+    }
@@ -1,4 +1,5 @@
 import argparse
+import asyncio
 from pathlib import Path
 from typing import Any
 import pandas as pd
@@ -8,22 +9,21 @@ import os
 from azure.ai.evaluation import AzureAIProject, EvaluatorConfig
 from semantic_kernel.utils.logging import setup_logging
 
+from app.chatbot.client_registry import close_client_registry
 from evaluation.chatbot.evaluators.evaluator import Evaluator
 from evaluation.chatbot.root_path import chatbot_eval_root_path
-from evaluation.chatbot.evaluators.function_call_precision import (
-    FunctionCallArgsPrecisionEvaluator,
-    FunctionCallPrecisionEvaluator,
+from evaluation.chatbot.evaluators.function_call_metrics import (
+    FunctionCallMetricsEvaluator,
 )
-from evaluation.chatbot.evaluators.function_call_recall import (
-    FunctionCallArgsRecallEvaluator,
-    FunctionCallRecallEvaluator,
-)
-from evaluation.chatbot.evaluators.function_call_reliability import (
-    FunctionCallReliabilityEvaluator,
+from evaluation.chatbot.batch_runner import (
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_ROW_TIMEOUT_SECONDS,
+    EvaluationBatchRunner,
 )
 from evaluation.chatbot.eval_target import SupportTicketEvaluationTarget
 from evaluation.evaluation_service import EvaluationService
 from evaluation.common import copy_and_execute_notebook, generate_experiment_name
+from evaluation.jsonl import iter_rows
 
 # Set the logging level for semantic_kernel.kernel to DEBUG.
 setup_logging()
@@ -31,10 +31,14 @@ logging.basicConfig(level=logging.INFO)
 
 
 def run_support_ticket_evaluation(
-    ground_truth_data_path: str | None, experiment_name: str | None
+    ground_truth_data_path: str | None,
+    experiment_name: str | None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    row_timeout_seconds: float | None = DEFAULT_ROW_TIMEOUT_SECONDS,
 ) -> list[dict[str, Any]]:
     """
-    Run evaluation for the support ticket management system
+    Run evaluation for the support ticket management system.
+    The conversations of all dataset rows are simulated concurrently, up to max_concurrency at a time.
     """
 
     subscription_id = os.getenv("AZURE_SUBSCRIPTION_ID")
@@ -64,19 +68,17 @@ def run_support_ticket_evaluation(
     )
     output_path = f"{chatbot_eval_root_path()}/output/{experiment_name}"
 
+    # One evaluator emits Precision_fn, Recall_fn, Precision_args, Recall_args and Reliability
+    # from a single match of the function calls of each row
     evaluators: dict[str, Evaluator] = {
-        "Precision_fn": FunctionCallPrecisionEvaluator(),
-        "Recall_fn": FunctionCallRecallEvaluator(),
-        "Precision_args": FunctionCallArgsPrecisionEvaluator(),
-        "Recall_args": FunctionCallArgsRecallEvaluator(),
-        "Reliability": FunctionCallReliabilityEvaluator(),
+        "FunctionCalls": FunctionCallMetricsEvaluator(),
     }
 
     # Setup evaluator inputs (__call__ function arguments)
     evaluators_config: dict[str, EvaluatorConfig] = {
         "default": {
             "column_mapping": {
-                "actual_function_calls": "${target.function_calls}",
+                "actual_function_calls": "${data.function_calls}",
                 "expected_function_calls": "${data.expected_function_calls}",
                 "instructions": "${data.instructions}",
                 "scenarioType": "${data.scenarioType}",
@@ -85,12 +87,30 @@ def run_support_ticket_evaluation(
         }
     }
 
-    # run evaluation for Chatbot
+    # Simulate the conversations of all rows concurrently, the evaluation SDK would run them one by one.
+    # Rows are read lazily from the JSON or JSONL dataset and written in the order of the dataset as they complete.
+    runner = EvaluationBatchRunner(
+        target=SupportTicketEvaluationTarget().simulate,
+        max_concurrency=max_concurrency,
+        row_timeout_seconds=row_timeout_seconds,
+    )
+    async def simulate() -> str:
+        try:
+            return await runner.run_to_file(
+                iter_rows(ground_truth_data_path),
+                f"{output_path}/simulated_conversations.jsonl",
+            )
+        finally:
+            # Close the pooled Azure OpenAI connections on the event loop that opened them
+            await close_client_registry()
+
+    simulated_data_path = asyncio.run(simulate())
+
+    # run evaluation for Chatbot on the precomputed conversations
     results: list[dict[str, Any]] = evaluation_service.evaluate(
         evaluators=evaluators,
         evaluators_config=evaluators_config,
-        eval_target=SupportTicketEvaluationTarget(),
-        ground_truth_data_path=ground_truth_data_path,
+        ground_truth_data_path=simulated_data_path,
         output_path=output_path,
         experiment_name=experiment_name,
     )
@@ -118,7 +138,22 @@ if __name__ == "__main__":
     parser.add_argument(
         "--experiment-name", type=str, required=False, help="Experiment name"
     )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=int(os.getenv("EVAL_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY)),
+        help="Maximum number of conversations simulated at the same time",
+    )
+    parser.add_argument(
+        "--row-timeout",
+        type=float,
+        default=float(os.getenv("EVAL_ROW_TIMEOUT_SECONDS", DEFAULT_ROW_TIMEOUT_SECONDS)),
+        help="Time limit in seconds of a single simulated conversation",
+    )
     args = parser.parse_args()
     run_support_ticket_evaluation(
-        ground_truth_data_path=args.data_path, experiment_name=args.experiment_name
+        ground_truth_data_path=args.data_path,
+        experiment_name=args.experiment_name,
+        max_concurrency=args.max_concurrency,
+        row_timeout_seconds=args.row_timeout,
     )
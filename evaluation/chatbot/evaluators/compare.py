@@ -1,32 +1,78 @@
 import re
+from collections.abc import Iterable
 from difflib import SequenceMatcher
+from functools import lru_cache
 
+# Normalized strings only keep lowercase ASCII letters, digits and single spaces
+_NON_ALPHANUMERIC = re.compile(r"[^a-z0-9\s]")
+_WHITESPACE = re.compile(r"\s+")
 
+NORMALIZE_CACHE_SIZE = 8192
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
 def normalize_text(text: str) -> str:
-    # 1 lowercase
-    text = text.lower()
-    # 2 remove special characters
-    text = re.sub(r"[^a-zA-Z0-9\s]", "", text)
-    # 3 remove extra spaces
-    text = re.sub(r"\s+", " ", text)
-    # 4 remove accents/diacritics (normalize unicode)
-    # text = unicodedata.normalize('NFKD', text)
-    # text = "".join(c for c in text if not unicodedata.combining(c))
-    # 5 remove leading and trailing spaces
-    text = text.strip()
-    # 6 remove new lines
-    text = re.sub(r"\n+", " ", text)
-    # 7 remove tabs
-    text = re.sub(r"\t+", " ", text)
-    # 8 remove all whitespace
-    text = re.sub(r"\s+", " ", text)
-    # 9 Remove punctuation
-    text = re.sub(r"[^\w\s]", "", text)
-    return text
+    """
+    Normalize a text for comparison: lowercase it, remove special characters and punctuation,
+    and collapse all whitespace (spaces, new lines, tabs) into single spaces.
 
+    The same argument values are compared by every evaluator on every row, so normalized
+    texts are cached.
+    Args:
+        text (str): The text to normalize.
+    Returns:
+        str: The normalized text.
+    """
+    text = _NON_ALPHANUMERIC.sub("", text.lower())
+    return _WHITESPACE.sub(" ", text).strip()
 
-def is_similar(t1: str, t2: str, threshold: float = 0.95) -> bool:
+
+def _is_similar_normalized(matcher: SequenceMatcher[str], threshold: float) -> bool:
+    # The quick ratios are cheap upper bounds of the ratio, only compute the full ratio when they pass
     return (
-        SequenceMatcher(None, normalize_text(t1), normalize_text(t2)).ratio()
-        >= threshold
+        matcher.real_quick_ratio() >= threshold
+        and matcher.quick_ratio() >= threshold
+        and matcher.ratio() >= threshold
     )
+
+
+def is_similar(t1: str, t2: str, threshold: float = 0.95) -> bool:
+    """
+    Check whether two texts are similar once normalized.
+    Args:
+        t1 (str): The first text.
+        t2 (str): The second text.
+        threshold (float): The minimum similarity ratio between 0 and 1.
+    Returns:
+        bool: True if the similarity ratio of the normalized texts reaches the threshold.
+    """
+    n1, n2 = normalize_text(t1), normalize_text(t2)
+    if n1 == n2:
+        return True
+    return _is_similar_normalized(SequenceMatcher(None, n1, n2), threshold)
+
+
+def similar_pairs(pairs: Iterable[tuple[str, str]], threshold: float = 0.95) -> list[bool]:
+    """
+    Check many pairs of texts for similarity at once.
+
+    Pairs sharing the same second text reuse one matcher, so the second text is only indexed once.
+    Args:
+        pairs (Iterable[tuple[str, str]]): The pairs of texts to compare, typically (actual, expected).
+        threshold (float): The minimum similarity ratio between 0 and 1.
+    Returns:
+        list[bool]: Whether each pair is similar, in the order of the pairs.
+    """
+    results: list[bool] = []
+    matchers: dict[str, SequenceMatcher[str]] = {}
+    for t1, t2 in pairs:
+        n1, n2 = normalize_text(t1), normalize_text(t2)
+        if n1 == n2:
+            results.append(True)
+            continue
+        matcher = matchers.get(n2)
+        if matcher is None:
+            matcher = matchers[n2] = SequenceMatcher(None, b=n2)
+        matcher.set_seq1(n1)
+        results.append(_is_similar_normalized(matcher, threshold))
+    return results
@@ -4,7 +4,14 @@ from typing import Any
 
 
 @dataclass
-class EvaluatorResult:
+class EvaluatorMetrics:
+    """
+    Base class of the evaluator result models, each field is reported as a metric
+    """
+
+
+@dataclass
+class EvaluatorResult(EvaluatorMetrics):
     """
     Class to represent the evaluator result model
     """
@@ -13,5 +20,5 @@ class EvaluatorResult:
 
 class Evaluator(ABC):
     @abstractmethod
-    def __call__(self, **kwargs: Any) -> EvaluatorResult:
+    def __call__(self, **kwargs: Any) -> EvaluatorMetrics:
         pass
@@ -0,0 +1,140 @@
+from dataclasses import dataclass
+from typing import Any
+
+from evaluation.chatbot.evaluators.evaluator import Evaluator, EvaluatorMetrics
+from evaluation.chatbot.evaluators.matching import (
+    FunctionCallMatch,
+    match_function_calls,
+)
+from evaluation.chatbot.models import FunctionCall
+
+
+def function_precision(match_result: FunctionCallMatch, expected_count: int) -> float:
+    """
+    Precision = Number of correct function_calls / Actual number of function_calls
+    """
+    if len(match_result.matched_calls) == 0 or expected_count == 0:
+        # If either list is empty, precision is undefined
+        return 0.0
+
+    result: float = len(match_result.matched_calls) / (
+        len(match_result.matched_calls) + len(match_result.unmatched_actual_calls)
+    )
+    return round(result, 2)
+
+
+def function_recall(match_result: FunctionCallMatch, expected_count: int) -> float:
+    """
+    Recall = Number of correct function_calls / Expected number of function_calls
+    """
+    if len(match_result.matched_calls) == 0 or expected_count == 0:
+        # If either list is empty, recall is undefined
+        return 0.0
+
+    result: float = len(match_result.matched_calls) / expected_count
+    return round(result, 2)
+
+
+def args_precision(match_result: FunctionCallMatch) -> float:
+    """
+    Average over the matched function calls of:
+    Precision = Number of correct arguments / Actual number of arguments
+    """
+    precision_scores: list[float] = []
+    for matched_call in match_result.matched_calls:
+        if len(matched_call.actual_args) == 0 and len(matched_call.expected_args) == 0:
+            # Both actual and expected args are empty, treat as perfect match
+            precision_scores.append(1.0)
+        elif len(matched_call.actual_args) == 0:
+            # No actual args, treat as no precision
+            precision_scores.append(0.0)
+        else:
+            precision_scores.append(matched_call.correct_args / len(matched_call.actual_args))
+
+    if not precision_scores:
+        return 0.0
+
+    overall_precision: float = sum(precision_scores) / len(precision_scores)
+    return round(overall_precision, 2)
+
+
+def args_recall(match_result: FunctionCallMatch) -> float:
+    """
+    Average over the matched function calls of:
+    Recall = Number of correct arguments / Expected number of arguments
+    """
+    recall_scores: list[float] = []
+    for matched_call in match_result.matched_calls:
+        if len(matched_call.expected_args) == 0:
+            # If there are no expected arguments, recall is 1.0
+            recall_scores.append(1.0)
+        else:
+            recall_scores.append(matched_call.correct_args / len(matched_call.expected_args))
+
+    if not recall_scores:
+        return 0.0
+
+    overall_recall: float = sum(recall_scores) / len(recall_scores)
+    return round(overall_recall, 2)
+
+
+def reliability(recall_fn: float, recall_args: float) -> float:
+    """
+    Reliability = average of the function call recall and the argument recall
+    """
+    return (recall_fn + recall_args) / 2
+
+
+@dataclass
+class FunctionCallMetricsResult(EvaluatorMetrics):
+    """
+    Class to represent all function call metrics of a row. There is no separate score field, so the
+    reliability is reported once. Metric names match the names of the single metric evaluators in
+    the evaluation results.
+    """
+    Precision_fn: float
+    Recall_fn: float
+    Precision_args: float
+    Recall_args: float
+    Reliability: float
+
+
+class FunctionCallMetricsEvaluator(Evaluator):
+    """
+    An evaluator calculating the function call precision, recall, argument precision, argument recall
+    and reliability at once.
+
+    The function calls of a row are parsed and matched once and all metrics are derived from the
+    same match, instead of each single metric evaluator parsing and matching the row again.
+    """
+
+    # Ignore certain type checks as the Azure AI Evaluation SDK does not support Python complex types
+    def __call__(self, *, actual_function_calls: dict, expected_function_calls: dict, **kwargs: Any) -> FunctionCallMetricsResult: # pyright: ignore[reportUnknownParameterType, reportMissingTypeArgument] As required by the Azure AI Evaluation SDK
+        actual = [FunctionCall.from_dict(f) for f in actual_function_calls] # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType, reportUnknownVariableType]
+        expected = [FunctionCall.from_dict(f) for f in expected_function_calls] # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType, reportUnknownVariableType]
+        return self.compute(actual, expected)
+
+    def compute(
+        self, actual_function_calls: list[FunctionCall], expected_function_calls: list[FunctionCall]
+    ) -> FunctionCallMetricsResult:
+        """
+        Calculate all function call metrics from a single match of the function calls.
+        Args:
+            actual_function_calls (list[FunctionCall]): The function calls made by the chatbot
+            expected_function_calls (list[FunctionCall]): The expected function calls
+        Returns:
+            FunctionCallMetricsResult: All metrics
+        """
+        # The alignment already counts the correct arguments of each matched call
+        match_result = match_function_calls(actual_function_calls, expected_function_calls)
+        expected_count = len(expected_function_calls)
+
+        recall_fn = function_recall(match_result, expected_count)
+        recall_args = args_recall(match_result)
+        return FunctionCallMetricsResult(
+            Precision_fn=function_precision(match_result, expected_count),
+            Recall_fn=recall_fn,
+            Precision_args=args_precision(match_result),
+            Recall_args=recall_args,
+            Reliability=reliability(recall_fn, recall_args),
+        )
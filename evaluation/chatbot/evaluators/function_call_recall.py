@@ -4,7 +4,10 @@ from evaluation.chatbot.evaluators.matching import (
     FunctionCallMatch,
     match_function_calls,
 )
-from evaluation.chatbot.evaluators.compare import is_similar
+from evaluation.chatbot.evaluators.function_call_metrics import (
+    args_recall,
+    function_recall,
+)
 
 
 class FunctionCallRecallEvaluator(FunctionCallEvaluator):
@@ -21,15 +24,7 @@ class FunctionCallRecallEvaluator(FunctionCallEvaluator):
         match_result: FunctionCallMatch = match_function_calls(
             actual_function_calls, expected_function_calls
         )
-
-        if len(match_result.matched_calls) == 0 or len(expected_function_calls) == 0:
-            # If either list is empty, precision is undefined
-            return 0.0
-
-        # Calculate recall
-        result: float = len(match_result.matched_calls) / len(expected_function_calls)
-
-        return round(result, 2)
+        return function_recall(match_result, len(expected_function_calls))
 
 
 class FunctionCallArgsRecallEvaluator(FunctionCallEvaluator):
@@ -49,30 +44,4 @@ class FunctionCallArgsRecallEvaluator(FunctionCallEvaluator):
         match_result: FunctionCallMatch = match_function_calls(
             actual_function_calls, expected_function_calls
         )
-
-        # Calculate precision for each function call
-        recall_scores: dict[str, float] = {}
-        for fn_name, grouped_args in match_result.matched_calls.items():
-            if len(grouped_args.expected_args) == 0:
-                # If there are no expected arguments, recall is 1.0
-                recall_scores[fn_name] = 1.0
-            else:
-                # Calculate recall
-                correct_args = sum(
-                    1
-                    for key in grouped_args.actual_args
-                    if is_similar(
-                        str(grouped_args.actual_args[key]),
-                        str(grouped_args.expected_args.get(key, "__invalid__")),
-                    )
-                )
-                recall_score = correct_args / len(grouped_args.expected_args)
-                recall_scores[fn_name] = recall_score
-
-        # Calculate overall precision
-        if not recall_scores:
-            return 0.0
-
-        overall_precision = sum(recall_scores.values()) / len(recall_scores)
-
-        return round(overall_precision, 2)
+        return args_recall(match_result)
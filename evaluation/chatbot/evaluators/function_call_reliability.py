@@ -1,7 +1,13 @@
 from evaluation.chatbot.evaluators.function_call_evaluator import FunctionCallEvaluator
 from evaluation.chatbot.models import FunctionCall
-from evaluation.chatbot.evaluators.function_call_recall import (
-    FunctionCallRecallEvaluator, FunctionCallArgsRecallEvaluator
+from evaluation.chatbot.evaluators.matching import (
+    FunctionCallMatch,
+    match_function_calls,
+)
+from evaluation.chatbot.evaluators.function_call_metrics import (
+    args_recall,
+    function_recall,
+    reliability,
 )
 
 
@@ -19,13 +25,11 @@ class FunctionCallReliabilityEvaluator(FunctionCallEvaluator):
         """
         Calculate the reliability of function calls.
         """
-
-        scores: list[float] = []
-        evaluators = [
-            FunctionCallRecallEvaluator(),
-            FunctionCallArgsRecallEvaluator(),
-        ]
-        for evaluator in evaluators:
-            scores.append(evaluator.evaluate(actual_function_calls, expected_function_calls))
-        
-        return sum(scores) / len(scores)
+        # Both recalls are derived from the same match
+        match_result: FunctionCallMatch = match_function_calls(
+            actual_function_calls, expected_function_calls
+        )
+        return reliability(
+            function_recall(match_result, len(expected_function_calls)),
+            args_recall(match_result),
+        )
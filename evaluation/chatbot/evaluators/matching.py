@@ -1,78 +1,185 @@
+import heapq
+import json
+from collections import defaultdict
 from dataclasses import dataclass
 
+from evaluation.chatbot.evaluators.compare import similar_pairs
 from evaluation.chatbot.models import FunctionCall
 
 
 @dataclass
 class FunctionArgsMatch:
+    """
+    An actual function call aligned with an expected call of the same function.
+    """
+    function_name: str
+    actual_index: int
+    expected_index: int
     actual_args: dict[str, str]
     expected_args: dict[str, str]
+    # Number of actual arguments similar to the expected argument of the same name
+    correct_args: int
 
 
 @dataclass
 class FunctionCallMatch:
-    matched_calls: dict[str, FunctionArgsMatch]
+    """
+    One-to-one alignment of actual and expected function calls, shared by all metrics.
+    Matched calls are in the order of the expected calls, unmatched calls in their original order.
+    """
+    matched_calls: list[FunctionArgsMatch]
     unmatched_expected_calls: list[str]
     unmatched_actual_calls: list[str]
 
 
+DEFAULT_IGNORE_CALLS = [
+    "CommonPlugin-summarize_ticket_details",
+    "CommonPlugin-explain_workflow",
+    "CommonPlugin-start_over",
+]
+
+
 def match_function_calls(
     actual_calls: list[FunctionCall],
     expected_calls: list[FunctionCall],
-    ignore_calls: list[str] = [
-        "CommonPlugin-summarize_ticket_details",
-        "CommonPlugin-explain_workflow",
-        "CommonPlugin-start_over",
-    ],
+    ignore_calls: list[str] = DEFAULT_IGNORE_CALLS,
 ) -> FunctionCallMatch:
     """
-    Group function calls by their function names, creating a FunctionGroup that tracks matched calls
-    and unmatched calls on both sides.
+    Align actual and expected function calls one-to-one. Calls only match calls of the same
+    function (case-insensitive), repeated calls of a function are paired by best argument similarity.
 
+    Actual calls of ignored functions can match expected calls but are never reported as unmatched.
     Args:
-        actual_calls (list[dict]): List of actual function calls
-        expected_calls (list[dict]): List of expected function calls
+        actual_calls (list[FunctionCall]): List of actual function calls
+        expected_calls (list[FunctionCall]): List of expected function calls
+        ignore_calls (list[str]): Functions the chatbot may call without being expected to
     Returns:
-        FunctionGroup: Object containing matched calls and lists of unmatched calls
+        FunctionCallMatch: Object containing the matched calls and lists of unmatched calls
     """
-    matched_calls: dict[str, FunctionArgsMatch] = {}
-    unmatched_actual_calls: list[str] = []
-    unmatched_expected_calls: list[str] = []
-
-    actual_function_names = {call.functionName.lower() for call in actual_calls}
-    expected_function_names = {call.functionName.lower() for call in expected_calls}
     ignored_function_names = {fn.lower() for fn in ignore_calls}
 
-    # Process actual calls
-    for call in actual_calls:
-        function_name = call.functionName.lower()
-        if function_name in ignored_function_names:
+    actual_by_name: dict[str, list[int]] = defaultdict(list)
+    for index, call in enumerate(actual_calls):
+        actual_by_name[call.functionName.lower()].append(index)
+    expected_by_name: dict[str, list[int]] = defaultdict(list)
+    for index, call in enumerate(expected_calls):
+        expected_by_name[call.functionName.lower()].append(index)
+
+    matched_calls: list[FunctionArgsMatch] = []
+    matched_actual: set[int] = set()
+    matched_expected: set[int] = set()
+    similarity_cache: dict[tuple[str, str], bool] = {}
+
+    for function_name, expected_indices in expected_by_name.items():
+        actual_indices = actual_by_name.get(function_name)
+        if not actual_indices:
             continue
-        if function_name in expected_function_names:
-            matched_calls[function_name] = FunctionArgsMatch(
-                actual_args=call.arguments,
-                expected_args={},  # Will be populated later
-            )
-        else:
-            unmatched_actual_calls.append(function_name)
-
-    # Process expected calls
-    for call in expected_calls:
-        function_name = call.functionName.lower()
-        if function_name in actual_function_names:
-            # If this function name is already in matched_calls, populate its expected args
-            if function_name in matched_calls:
-                matched_calls[function_name].expected_args = call.arguments
-            else:
-                # This handles the case where expected call was processed before matching actual call
-                matched_calls[function_name] = FunctionArgsMatch(
-                    actual_args={}, expected_args=call.arguments
+        for actual_index, expected_index, correct_args in _align(
+            actual_calls, actual_indices, expected_calls, expected_indices, similarity_cache
+        ):
+            matched_calls.append(
+                FunctionArgsMatch(
+                    function_name=function_name,
+                    actual_index=actual_index,
+                    expected_index=expected_index,
+                    actual_args=actual_calls[actual_index].arguments,
+                    expected_args=expected_calls[expected_index].arguments,
+                    correct_args=correct_args,
                 )
-        else:
-            unmatched_expected_calls.append(function_name)
+            )
+            matched_actual.add(actual_index)
+            matched_expected.add(expected_index)
+
+    matched_calls.sort(key=lambda match: match.expected_index)
+    unmatched_actual_calls = [
+        call.functionName.lower()
+        for index, call in enumerate(actual_calls)
+        if index not in matched_actual and call.functionName.lower() not in ignored_function_names
+    ]
+    unmatched_expected_calls = [
+        call.functionName.lower()
+        for index, call in enumerate(expected_calls)
+        if index not in matched_expected
+    ]
 
     return FunctionCallMatch(
         matched_calls=matched_calls,
         unmatched_expected_calls=unmatched_expected_calls,
         unmatched_actual_calls=unmatched_actual_calls,
     )
+
+
+def _align(
+    actual_calls: list[FunctionCall],
+    actual_indices: list[int],
+    expected_calls: list[FunctionCall],
+    expected_indices: list[int],
+    similarity_cache: dict[tuple[str, str], bool],
+) -> list[tuple[int, int, int]]:
+    """
+    Pair the calls of one function greedily by best argument similarity, earlier calls first on ties.
+    Returns (actual index, expected index, correct arguments) tuples.
+    """
+    pairs: list[tuple[int, int, int]] = []
+    if len(actual_indices) == 1 and len(expected_indices) == 1:
+        actual_index, expected_index = actual_indices[0], expected_indices[0]
+        correct_args = _count_correct_args(
+            actual_calls[actual_index].arguments, expected_calls[expected_index].arguments, similarity_cache
+        )
+        return [(actual_index, expected_index, correct_args)]
+
+    # Calls with identical arguments are paired in order without scoring
+    unpaired_actual: dict[str, list[int]] = defaultdict(list)
+    for actual_index in actual_indices:
+        unpaired_actual[_arguments_key(actual_calls[actual_index])].append(actual_index)
+    remaining_expected: list[int] = []
+    for expected_index in expected_indices:
+        same_args = unpaired_actual.get(_arguments_key(expected_calls[expected_index]))
+        if same_args:
+            actual_index = same_args.pop(0)
+            pairs.append((actual_index, expected_index, len(actual_calls[actual_index].arguments)))
+        else:
+            remaining_expected.append(expected_index)
+    remaining_actual = sorted(index for indices in unpaired_actual.values() for index in indices)
+    if not remaining_actual or not remaining_expected:
+        return pairs
+
+    # Greedy assignment on the similarity matrix of the remaining calls
+    candidates: list[tuple[float, int, int, int]] = []
+    for actual_index in remaining_actual:
+        actual_args = actual_calls[actual_index].arguments
+        for expected_index in remaining_expected:
+            expected_args = expected_calls[expected_index].arguments
+            correct_args = _count_correct_args(actual_args, expected_args, similarity_cache)
+            similarity = correct_args / max(len(actual_args), len(expected_args), 1)
+            candidates.append((-similarity, actual_index, expected_index, correct_args))
+    heapq.heapify(candidates)
+
+    paired_actual: set[int] = set()
+    paired_expected: set[int] = set()
+    pair_count = min(len(remaining_actual), len(remaining_expected))
+    while len(paired_actual) < pair_count:
+        _, actual_index, expected_index, correct_args = heapq.heappop(candidates)
+        if actual_index in paired_actual or expected_index in paired_expected:
+            continue
+        paired_actual.add(actual_index)
+        paired_expected.add(expected_index)
+        pairs.append((actual_index, expected_index, correct_args))
+    return pairs
+
+
+def _arguments_key(call: FunctionCall) -> str:
+    return json.dumps(call.arguments, sort_keys=True, default=str)
+
+
+def _count_correct_args(
+    actual_args: dict[str, str],
+    expected_args: dict[str, str],
+    similarity_cache: dict[tuple[str, str], bool],
+) -> int:
+    # TODO: improve the logic to further normalize function args for comparison
+    pairs = [(str(value), str(expected_args.get(key, "__invalid__"))) for key, value in actual_args.items()]
+    # Argument values repeat across the calls of a function, only score the pairs not seen yet
+    new_pairs = [pair for pair in dict.fromkeys(pairs) if pair not in similarity_cache]
+    similarity_cache.update(zip(new_pairs, similar_pairs(new_pairs)))
+    return sum(similarity_cache[pair] for pair in pairs)
@@ -4,15 +4,26 @@ Script to generate chatbot evaluation dataset from scenario templates and dummy
 Uses pandas for more efficient data processing with improved handling of multi-action tickets.
 """
 import argparse
+import gzip
 import json
+import os
 import random
+import re
 import pandas as pd
 from pathlib import Path
-from typing import Any
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, TextIO
 
-# Set random seed for reproducibility
+# Default random seed, for reproducibility
 RANDOM_SEED = 42
-random.seed(RANDOM_SEED)
+
+# Number of cases filled at a time by a worker process
+DEFAULT_BATCH_SIZE = 500
+
+# Default number of rows per JSONL file when sharding by rows
+DEFAULT_SHARD_SIZE = 10000
 
 # System prompt template (matches support_ticket_eval_dataset.json style)
 SYSTEM_PROMPT_TEMPLATE = """
@@ -88,33 +99,38 @@ def load_and_process_data(tickets_path: Path, actions_path: Path) -> list[dict[s
     
     # Convert customer_visible column to boolean values
     if 'customer_visible' in tickets_df.columns:
-        # Handle various string representations and ensure proper boolean conversion
-        tickets_df['customer_visible'] = tickets_df['customer_visible'].apply(
-            lambda x: (
-                x.lower() == 'true' if isinstance(x, str) 
-                else bool(x) if pd.notna(x) 
-                else False
-            )
-        )
-    
-    # Prepare result data
-    result_data: list[dict[str, Any]] = []
-    
-    # Get sets of ticket IDs
-    ticket_ids = set(tickets_df['id'])
+        # Handle various string representations and ensure proper boolean conversion, missing values are False
+        customer_visible = tickets_df['customer_visible']
+        if pd.api.types.is_bool_dtype(customer_visible) or pd.api.types.is_numeric_dtype(customer_visible):
+            tickets_df['customer_visible'] = customer_visible.fillna(False).astype(bool)
+        else:
+            # Text columns, whether read as the object or the str dtype
+            tickets_df['customer_visible'] = customer_visible.fillna('false').astype(str).str.lower().eq('true')
     
-    # Process tickets with actions that haven't been processed yet
-    for ticket_id in ticket_ids:
-        ticket_row = tickets_df[tickets_df['id'] == ticket_id]
-        ticket_dict = ticket_row.iloc[0].to_dict()
-        ticket_actions = actions_df[actions_df['parent_ticket_id'] == ticket_id]
-
-        result_data.append({
-            'ticket': ticket_dict,
-            'actions': list([action_row.to_dict() for _, action_row in ticket_actions.iterrows()])
-        })
+    # Join the action items to their tickets in a single groupby pass, keeping the order of both files
+    tickets_df = tickets_df.drop_duplicates(subset='id')
+    action_records = to_records(actions_df)
+    action_positions = actions_df.groupby('parent_ticket_id', sort=False).indices
     
-    return result_data
+    return [
+        {
+            'ticket': ticket,
+            'actions': (
+                [action_records[position] for position in action_positions[ticket['id']].tolist()]
+                if ticket['id'] in action_positions
+                else []
+            )
+        }
+        for ticket in to_records(tickets_df)
+    ]
+
+def to_records(df: pd.DataFrame) -> list[dict[str, Any]]:
+    """
+    Convert a DataFrame to a list of row dicts with Python values, converting column by column
+    (much faster than DataFrame.to_dict('records') or iterrows on large DataFrames)
+    """
+    columns = list(df.columns)
+    return [dict(zip(columns, row)) for row in zip(*(df[column].tolist() for column in columns))]
 
 def format_business_data(data: dict[str, Any]) -> str:
     """Format the business data for display in the scenario prompts"""
@@ -142,76 +158,294 @@ def format_business_data(data: dict[str, Any]) -> str:
     
     return "\n\n".join(sections)
 
+# Placeholders reference a field of the ticket or of the action item, e.g. {ticket.title}
+PLACEHOLDER_PATTERN = re.compile(r"\{(ticket|action)\.([^{}]+)\}")
+
+class CompiledTemplate:
+    """
+    A template parsed once, with the positions of its placeholders and the fields they reference.
+    Rendering is a single pass over the template that only reads the referenced fields.
+    Placeholders of missing or NaN fields are kept as is.
+    """
+
+    def __init__(self, template: Any):
+        """
+        Args:
+            template: A JSON-like value (dict, list, str or scalar) containing placeholders in its strings
+        """
+        self.fields: set[tuple[str, str]] = set()
+        self._render = self._compile(template)
+
+    def render(self, data: dict[str, Any]) -> Any:
+        """
+        Fill the placeholders with the data values.
+        Args:
+            data: The 'ticket' and 'action' dicts
+        Returns:
+            A new value with the structure of the template
+        """
+        return self._render(data)
+
+    def _compile(self, template: Any) -> Callable[[dict[str, Any]], Any]:
+        if isinstance(template, dict):
+            items = [(k, self._compile(v)) for k, v in template.items()]
+            return lambda data: {k: render(data) for k, render in items}
+
+        if isinstance(template, list):
+            renders = [self._compile(v) for v in template]
+            return lambda data: [render(data) for render in renders]
+
+        if isinstance(template, str):
+            # Literal text at even positions, (object name, field, placeholder) references at odd positions
+            parts: list[Any] = []
+            position = 0
+            for match in PLACEHOLDER_PATTERN.finditer(template):
+                parts.append(template[position:match.start()])
+                parts.append((match.group(1), match.group(2), match.group(0)))
+                self.fields.add((match.group(1), match.group(2)))
+                position = match.end()
+            parts.append(template[position:])
+
+            if len(parts) == 1:
+                return lambda data: template
+            if len(parts) == 3 and not parts[0] and not parts[2]:
+                reference = parts[1]
+                return lambda data: _field_text(data, *reference)
+            return lambda data: "".join(
+                _field_text(data, *part) if index % 2 else part for index, part in enumerate(parts)
+            )
+
+        return lambda data: template
+
+def _field_text(data: dict[str, Any], obj_name: str, field: str, placeholder: str) -> str:
+    obj = data.get(obj_name)
+    if isinstance(obj, dict) and field in obj:
+        value = obj[field]
+        if pd.notna(value):  # Handle NaN values from pandas
+            return str(value)
+    return placeholder
+
 def fill_placeholders(template: Any, data: dict[str, Any]) -> Any:
     """Replace placeholders in template with actual data values"""
-    if isinstance(template, dict):
-        return {k: fill_placeholders(v, data) for k, v in template.items()}
-    
-    elif isinstance(template, list):
-        return [fill_placeholders(v, data) for v in template]
-    
-    elif isinstance(template, str):
-        result = template
-        
-        # Handle nested object placeholders
-        for obj_name in ["ticket", "action"]:
-            if obj_name in data and isinstance(data[obj_name], dict):
-                for field, value in data[obj_name].items():
-                    if pd.notna(value):  # Handle NaN values from pandas
-                        placeholder = f"{{{obj_name}.{field}}}"
-                        if placeholder in result:
-                            result = result.replace(placeholder, str(value))
-        
-        return result
-    
-    return template
+    return CompiledTemplate(template).render(data)
 
 def generate_dataset(
     templates: list[dict[str, Any]],
     business_data: list[dict[str, Any]],
     num_cases_per_scenario: int,
+    seed: int = RANDOM_SEED,
 ) -> list[dict[str, Any]]:
     """Generate test scenarios by filling in templates with business data"""
-    dataset: list[dict[str, Any]] = []
-    
-    # For each template, try to use data from different tickets
-    for template in templates:
-        # Get a sample of ticket IDs for this template (up to num_cases_per_scenario)
-        ticket_ids = list(range(len(business_data)))
-        if len(ticket_ids) > num_cases_per_scenario:
-            sampled_ids = random.sample(ticket_ids, num_cases_per_scenario)
-        else:
-            sampled_ids = ticket_ids
-            # If we need more, we'll duplicate some
-            while len(sampled_ids) < num_cases_per_scenario:
-                sampled_ids.append(random.choice(ticket_ids))
-        
-        # For each sampled ticket ID, generate a scenario
-        for ticket_id in sampled_ids:
-            # If a ticket has multiple actions, randomly choose one
-            ticket_actions = business_data[ticket_id]["actions"]
-            ticket_action = random.choice(ticket_actions)
+    return list(iter_dataset(templates, business_data, num_cases_per_scenario, seed))
+
+def iter_dataset(
+    templates: list[dict[str, Any]],
+    business_data: list[dict[str, Any]],
+    num_cases_per_scenario: int,
+    seed: int = RANDOM_SEED,
+    workers: int = 1,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[dict[str, Any]]:
+    """
+    Generate test scenarios one at a time, in the order of the templates.
+
+    The cases are drawn in this process from the random generator of each template, and filled in
+    batches by `workers` processes. The output only depends on the seed, not on the number of workers.
+    """
+    batches = iter_case_batches(templates, business_data, num_cases_per_scenario, seed, batch_size)
+
+    if workers <= 1:
+        renderer = CaseRenderer(templates, business_data)
+        for template_index, cases in batches:
+            yield from renderer.render(template_index, cases)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(templates, business_data)
+    ) as executor:
+        # Keep a few batches per worker in flight, and emit the batches in order
+        pending: deque[Future[list[dict[str, Any]]]] = deque()
+        for template_index, cases in batches:
+            pending.append(executor.submit(_render_in_worker, template_index, cases))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+def template_rng(seed: int, scenario_name: str, occurrence: int = 0) -> random.Random:
+    """
+    Derive the random generator of a template from the dataset seed and its scenario name, so a
+    template draws the same cases whatever the other templates and the process generating it
+    """
+    return random.Random(f"{seed}:{scenario_name}:{occurrence}")
+
+def draw_cases(
+    rng: random.Random, business_data: list[dict[str, Any]], num_cases_per_scenario: int
+) -> list[tuple[int, int]]:
+    """Draw the (ticket index, action item index) pairs of the cases of a template"""
+    # Get a sample of ticket IDs for this template (up to num_cases_per_scenario)
+    ticket_ids = list(range(len(business_data)))
+    if len(ticket_ids) > num_cases_per_scenario:
+        sampled_ids = rng.sample(ticket_ids, num_cases_per_scenario)
+    else:
+        sampled_ids = ticket_ids
+        # If we need more, we'll duplicate some
+        while len(sampled_ids) < num_cases_per_scenario:
+            sampled_ids.append(rng.choice(ticket_ids))
+
+    # If a ticket has multiple actions, randomly choose one
+    return [
+        (ticket_id, rng.randrange(len(business_data[ticket_id]["actions"])))
+        for ticket_id in sampled_ids
+    ]
+
+def iter_case_batches(
+    templates: list[dict[str, Any]],
+    business_data: list[dict[str, Any]],
+    num_cases_per_scenario: int,
+    seed: int,
+    batch_size: int,
+) -> Iterator[tuple[int, list[tuple[int, int]]]]:
+    """Draw the cases of each template and split them in batches of (template index, cases)"""
+    occurrences: dict[str, int] = {}
+    for template_index, template in enumerate(templates):
+        scenario_name = template["scenario_name"]
+        occurrence = occurrences.get(scenario_name, 0)
+        occurrences[scenario_name] = occurrence + 1
+
+        cases = draw_cases(template_rng(seed, scenario_name, occurrence), business_data, num_cases_per_scenario)
+        for start in range(0, len(cases), batch_size):
+            yield template_index, cases[start:start + batch_size]
+
+class CaseRenderer:
+    """Fills the templates with the business data of drawn cases"""
+
+    def __init__(self, templates: list[dict[str, Any]], business_data: list[dict[str, Any]]):
+        self.templates = templates
+        self.business_data = business_data
+        # Parse the placeholders of each template once for all of its cases
+        self.expected_function_calls = [CompiledTemplate(t["expected_function_calls"]) for t in templates]
+
+    def render(self, template_index: int, cases: list[tuple[int, int]]) -> list[dict[str, Any]]:
+        template = self.templates[template_index]
+        expected_function_calls = self.expected_function_calls[template_index]
+        rendered: list[dict[str, Any]] = []
+        for ticket_id, action_id in cases:
             data = {
-                "ticket": business_data[ticket_id]["ticket"],
-                "action": ticket_action
+                "ticket": self.business_data[ticket_id]["ticket"],
+                "action": self.business_data[ticket_id]["actions"][action_id]
             }
-            
-            # Fill in the template
-            filled_calls = fill_placeholders(template["expected_function_calls"], data)
-            business_data_str = format_business_data(data)
-            
-            # Add to the dataset
-            dataset.append({
+            rendered.append({
                 "scenarioType": template["scenario_name"],
                 "instructions": SYSTEM_PROMPT_TEMPLATE.format(
-                    business_data=business_data_str,
+                    business_data=format_business_data(data),
                     user_instructions=template["user_instructions"]
                 ),
                 "task_completion_condition": template["task_completion"],
-                "expected_function_calls": filled_calls
+                "expected_function_calls": expected_function_calls.render(data)
             })
-    
-    return dataset
+        return rendered
+
+# Renderer of a worker process, created once per process so the business data is only sent once
+_worker_renderer: CaseRenderer | None = None
+
+def _init_worker(templates: list[dict[str, Any]], business_data: list[dict[str, Any]]) -> None:
+    global _worker_renderer
+    _worker_renderer = CaseRenderer(templates, business_data)
+
+def _render_in_worker(template_index: int, cases: list[tuple[int, int]]) -> list[dict[str, Any]]:
+    assert _worker_renderer is not None, "The worker process is not initialized"
+    return _worker_renderer.render(template_index, cases)
+
+class DatasetWriter:
+    """
+    Writes the test cases as JSONL while they are generated, so the dataset is never held in memory.
+
+    The JSONL output can be split into one file per scenario or into files of a fixed number of rows,
+    and compressed with gzip. The pretty-printed JSON dataset is only written on request.
+    """
+
+    def __init__(
+        self,
+        output: Path,
+        shard_by: str | None = None,
+        shard_size: int = DEFAULT_SHARD_SIZE,
+        compress: bool = False,
+        pretty_json: bool = False,
+    ):
+        """
+        Args:
+            output: Path of the JSON dataset, JSONL files are written next to it with the same name
+            shard_by: None for a single JSONL file, "scenario" or "rows" to split the JSONL output
+            shard_size: Number of rows per file when sharding by rows
+            compress: Whether the JSONL files are compressed with gzip
+            pretty_json: Whether the dataset is also written as an indented JSON array to output
+        """
+        if shard_by not in (None, "scenario", "rows"):
+            raise ValueError(f"Unknown shard_by value: {shard_by}")
+        if shard_size <= 0:
+            raise ValueError("shard_size must be greater than 0")
+
+        self.output = output
+        self.shard_by = shard_by
+        self.shard_size = shard_size
+        self.compress = compress
+        self.paths: list[Path] = []
+        self.row_count = 0
+        self._shards: dict[str, TextIO] = {}
+        output.parent.mkdir(parents=True, exist_ok=True)
+        self._json_file = open(output, "w", encoding="utf-8") if pretty_json else None
+        if self._json_file:
+            self.paths.append(output)
+
+    def write(self, case: dict[str, Any]) -> None:
+        """Append a test case to its JSONL file, and to the JSON dataset if requested"""
+        if self.shard_by == "scenario":
+            shard = str(case["scenarioType"])
+        elif self.shard_by == "rows":
+            shard = f"part-{self.row_count // self.shard_size:05d}"
+            if shard not in self._shards:
+                # Files of previous row ranges are complete
+                self._close_shards()
+        else:
+            shard = ""
+        
+        shard_file = self._shards.get(shard) or self._open_shard(shard)
+        shard_file.write(json.dumps(case) + "\n")
+
+        if self._json_file:
+            # Same layout as json.dump(dataset, indent=4), one case at a time
+            case_json = json.dumps(case, indent=4, ensure_ascii=False).replace("\n", "\n    ")
+            self._json_file.write(("," if self.row_count else "[") + "\n    " + case_json)
+
+        self.row_count += 1
+
+    def close(self) -> None:
+        """Close all files, completing the JSON dataset"""
+        self._close_shards()
+        if self._json_file:
+            self._json_file.write("\n]" if self.row_count else "[]")
+            self._json_file.close()
+            self._json_file = None
+
+    def _open_shard(self, shard: str) -> TextIO:
+        name = f"{self.output.stem}.{shard}" if shard else self.output.stem
+        path = self.output.with_name(f"{name}.jsonl.gz" if self.compress else f"{name}.jsonl")
+        shard_file = gzip.open(path, "wt", encoding="utf-8") if self.compress else open(path, "w", encoding="utf-8")
+        self._shards[shard] = shard_file
+        self.paths.append(path)
+        return shard_file
+
+    def _close_shards(self) -> None:
+        for shard_file in self._shards.values():
+            shard_file.close()
+        self._shards.clear()
+
+    def __enter__(self) -> "DatasetWriter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
 def main():
     # Parse command line arguments
@@ -225,26 +459,38 @@ def main():
     parser.add_argument("--output", type=Path, 
                         default=Path("evaluation/chatbot/ground-truth/support_ticket_eval_dataset.json"))
     parser.add_argument("--cases-per-scenario", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=RANDOM_SEED,
+                        help="Random seed, the same seed always generates the same dataset")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Number of processes generating the cases, 0 for one per CPU")
+    parser.add_argument("--pretty-json", action="store_true",
+                        help="Also write the dataset as indented JSON to --output")
+    parser.add_argument("--shard-by", choices=["scenario", "rows"],
+                        help="Split the JSONL output into one file per scenario or per --shard-size rows")
+    parser.add_argument("--shard-size", type=int, default=DEFAULT_SHARD_SIZE,
+                        help="Number of rows per JSONL file when sharding by rows")
+    parser.add_argument("--compress", action="store_true", help="Compress the JSONL files with gzip")
     args = parser.parse_args()
 
     # Load and process data
     templates = load_templates(args.templates)
     business_data = load_and_process_data(args.tickets_data, args.actions_data)
     
-    # Generate the dataset
-    dataset = generate_dataset(templates, business_data, args.cases_per_scenario)
+    # Generate the dataset, writing each case as soon as it is generated
+    with DatasetWriter(
+        args.output,
+        shard_by=args.shard_by,
+        shard_size=args.shard_size,
+        compress=args.compress,
+        pretty_json=args.pretty_json,
+    ) as writer:
+        workers = args.workers or os.cpu_count() or 1
+        for case in iter_dataset(templates, business_data, args.cases_per_scenario, args.seed, workers):
+            writer.write(case)
 
-    # Write the outputs
-    with open(args.output, "w", encoding="utf-8") as f:
-        json.dump(dataset, f, indent=4, ensure_ascii=False)
-    print(f"Generated {len(dataset)} test cases in {args.output}")
-    
-    # Create a JSONL version for convenience
-    jsonl_output = args.output.with_suffix(".jsonl")
-    with open(jsonl_output, "w", encoding="utf-8") as f:
-        for item in dataset:
-            f.write(json.dumps(item) + "\n")
-    print(f"Also generated JSONL version in {jsonl_output}")
+    print(f"Generated {writer.row_count} test cases in:")
+    for path in writer.paths:
+        print(f"- {path}")
 
 if __name__ == "__main__":
     main()
@@ -1,4 +1,7 @@
 import asyncio
+import logging
+from collections.abc import Callable
+from typing import Any
 
 from semantic_kernel.contents import ChatHistory, ChatMessageContent
 from semantic_kernel.agents import (
@@ -6,13 +9,21 @@ from semantic_kernel.agents import (
     ChatHistoryAgentThread,
     AgentResponseItem,
 )
-from semantic_kernel.agents.strategies import KernelFunctionTerminationStrategy
 from semantic_kernel.contents.function_call_content import FunctionCallContent
 from semantic_kernel.contents.utils.author_role import AuthorRole
 
-from app.chatbot.factory import create_support_ticket_agent
+from app.chatbot.client_registry import close_client_registry
+from app.chatbot.factory import (
+    create_kernel_with_chat_completion,
+    create_support_ticket_agent,
+    create_support_ticket_kernel,
+)
+from app.chatbot.history_reducer import DEFAULT_HISTORY_TOKEN_BUDGET, create_history_reducing_thread
+from app.chatbot.mock_chat_completion import mock_conversation
+from app.chatbot.storage.backends import Storage, create_session_storage
 from evaluation.chatbot.models import FunctionCall
 from evaluation.chatbot.simulation.factory import create_termination_strategy, create_user_agent
+from evaluation.chatbot.simulation.termination import LayeredTerminationStrategy
 
 
 class SupportTicketChatSimulator:
@@ -20,12 +31,38 @@ class SupportTicketChatSimulator:
     This class is used to simulate a conversation between a user agent and a support ticket agent.
     It implements agent collaboration manually because AgentGroupChat history is not returning
     the function calls made by the chatbot.
+
+    The support ticket agent and the kernels of the user agent and the termination judge are built once
+    and reused by every simulated conversation, including concurrent ones. Each conversation only creates
+    a user agent, its threads and its own plugin instances.
     """
 
+    def __init__(
+        self,
+        history_token_budget: int = DEFAULT_HISTORY_TOKEN_BUDGET,
+        storage_factory: Callable[[], Storage] | None = create_session_storage,
+    ):
+        """
+        Args:
+            history_token_budget (int): Token budget of the support ticket agent conversation history.
+            storage_factory (Callable[[], Storage]|None): Creates the ticket and action item repositories of a
+                conversation, by default a copy-on-write view of the configured storage backend. If None, all
+                conversations share the storage backend configured in the environment.
+        """
+        self.history_token_budget = history_token_budget
+        self.storage_factory = storage_factory
+
+        self.support_ticket_agent: ChatCompletionAgent = create_support_ticket_agent(
+            name="SupportTicketAgent"
+        )
+        self.user_kernel = create_kernel_with_chat_completion(service_id="UserAgent")
+        self.termination_kernel = create_kernel_with_chat_completion(service_id="termination_service")
+
     async def run(
         self,
         instructions: str,
         task_completion_condition: str,
+        expected_function_calls: list[dict[str, Any]] | None = None,
     ) -> ChatHistory:
         """
         This method simulates a conversation between a user and a support ticket agent.
@@ -33,25 +70,46 @@ class SupportTicketChatSimulator:
         Args:
             instructions (str): Instructions for the user agent to follow.
             task_completion_condition (str): Condition to determine if the task is complete.
+            expected_function_calls (list[dict[str, Any]]|None): Function calls the task requires, the
+                conversation is not considered complete before they are made unless the user ends it.
+        Returns:
+            ChatHistory: The full, unreduced conversation of the support ticket agent.
         """
-        
-        support_ticket_agent: ChatCompletionAgent = create_support_ticket_agent(
-            name="SupportTicketAgent"
+        # Mock chat completion services replay their scripts from the start in every conversation,
+        # whatever the other conversations running concurrently
+        with mock_conversation():
+            return await self._simulate(instructions, task_completion_condition, expected_function_calls)
+
+    async def _simulate(
+        self,
+        instructions: str,
+        task_completion_condition: str,
+        expected_function_calls: list[dict[str, Any]] | None,
+    ) -> ChatHistory:
+        support_ticket_agent = self.support_ticket_agent
+        # Plugins bound to the repositories of this conversation, so that concurrent conversations do not see each other's changes
+        support_ticket_kernel = create_support_ticket_kernel(
+            support_ticket_agent.kernel,
+            storage=self.storage_factory() if self.storage_factory is not None else None,
         )
         user_agent: ChatCompletionAgent = create_user_agent(
-            name="UserAgent", instructions=instructions
+            name="UserAgent", instructions=instructions, kernel=self.user_kernel
         )
-        termination_strategy: KernelFunctionTerminationStrategy = (
-            create_termination_strategy(
-                task_completion_condition=task_completion_condition
-            )
+        termination_strategy: LayeredTerminationStrategy = create_termination_strategy(
+            task_completion_condition=task_completion_condition,
+            expected_function_calls=expected_function_calls,
+            kernel=self.termination_kernel,
         )
 
-        # The agent thread is used to make sure the support ticket agent retains the full context of the conversation
-        # it also contains the function calls made by the chatbot and is then returned for evaluation purposes
-        agent_thread: ChatHistoryAgentThread = ChatHistoryAgentThread(
-            thread_id="ChatSimulatorAgentThread"
+        # The agent thread is used to make sure the support ticket agent retains the context of the conversation
+        # within its token budget, older turns and bulky function results are reduced after each turn
+        agent_thread: ChatHistoryAgentThread = create_history_reducing_thread(
+            max_tokens=self.history_token_budget, thread_id="ChatSimulatorAgentThread"
         )
+        # The transcript keeps every message, including the function calls made by the chatbot,
+        # and is returned for evaluation purposes
+        transcript: ChatHistory = ChatHistory()
+        reduced_message_count = 0
         # The user thread is used to make sure user agent retains the full context of the conversation
         # it's separated from the agent thread to avoid exposing tool calls and other messages to the user agent
         user_thread: ChatHistoryAgentThread = ChatHistoryAgentThread(
@@ -63,13 +121,20 @@ class SupportTicketChatSimulator:
             content="Starting the simulation", role=AuthorRole.SYSTEM, name="system"
         )
 
-        while True:
+        for _ in range(termination_strategy.maximum_iterations):
             agent_message: AgentResponseItem[ChatMessageContent] = await support_ticket_agent.get_response(
-                messages=user_message, thread=agent_thread
+                messages=user_message, thread=agent_thread, kernel=support_ticket_kernel
             )
 
             print(f"Support Ticket Agent: {agent_message.to_dict()}")
 
+            # Record the new messages of this turn before reducing the agent thread
+            thread_history = await agent_thread.get_messages()
+            for msg in thread_history.messages[reduced_message_count:]:
+                transcript.add_message(msg)
+            await agent_thread.reduce()
+            reduced_message_count = len(agent_thread)
+
             user_response = await user_agent.get_response(
                 messages=agent_message.content, thread=user_thread
             )
@@ -84,21 +149,19 @@ class SupportTicketChatSimulator:
             
             print(f"User: {user_message.to_dict()}")
 
-            # Convert to list of messages to satisfy the type checker
-            messages_list = await agent_thread.get_messages()
-            # # Convert ChatHistory to list[ChatMessageContent] to solve type compatibility issue
+            # The full transcript keeps the function calls made so far, the latest user message is not part of it yet
             should_agent_terminate = await termination_strategy.should_agent_terminate(
                 agent=support_ticket_agent,
-                history=[msg for msg in messages_list], # list comprehension required for resolving type compatibility
+                history=[*transcript.messages, user_message],
             )
 
             if should_agent_terminate:
                 print("Task completed")
                 break
+        else:
+            logging.warning(f"Simulation stopped after {termination_strategy.maximum_iterations} turns")
 
-        history = await agent_thread.get_messages()
-
-        return history
+        return transcript
 
     def get_function_calls(self, chatHistory: ChatHistory) -> list[FunctionCall]:
         """
@@ -123,10 +186,15 @@ if __name__ == "__main__":
     # Start the simulation for ticket creation
     instructions = "You are a user who wants to create a new support ticket for a software issue. You need a ticket with title 'Email client crashes on startup', assigned to the IT department, with High priority and Expedited workflow. Provide a detailed description of the issue when asked."
 
-    history = asyncio.run(
-        simulator.run(
-            instructions=instructions,
-            task_completion_condition="the SupportTicketAgent has confirmed the creation of a Support Ticket",
-        )
-    )
+    async def simulate() -> ChatHistory:
+        try:
+            return await simulator.run(
+                instructions=instructions,
+                task_completion_condition="the SupportTicketAgent has confirmed the creation of a Support Ticket",
+            )
+        finally:
+            # Close the pooled Azure OpenAI connections on the event loop that opened them
+            await close_client_registry()
+
+    history = asyncio.run(simulate())
     print(f"Function Calls: {simulator.get_function_calls(history)}")
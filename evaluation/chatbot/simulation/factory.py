@@ -1,3 +1,6 @@
+from collections.abc import Mapping, Sequence
+from typing import Any
+
 from semantic_kernel import Kernel
 from semantic_kernel.connectors.ai.function_choice_behavior import (
     FunctionChoiceBehavior,
@@ -14,6 +17,7 @@ from semantic_kernel.functions import KernelFunctionFromPrompt
 from semantic_kernel.functions.kernel_arguments import KernelArguments
 
 from app.chatbot.factory import create_kernel_with_chat_completion
+from evaluation.chatbot.simulation.termination import DEFAULT_JUDGE_WINDOW, LayeredTerminationStrategy
 
 
 def create_user_agent(
@@ -53,17 +57,26 @@ def create_termination_strategy(
     task_completion_condition: str,
     service_id: str = "termination_service",
     maximum_iterations: int = 50,
-) -> KernelFunctionTerminationStrategy:
+    expected_function_calls: Sequence[Mapping[str, Any]] | None = None,
+    judge_window: int = DEFAULT_JUDGE_WINDOW,
+    kernel: Kernel | None = None,
+) -> LayeredTerminationStrategy:
     """
     Create a termination strategy for the task completion process.
+    Cheap signals are checked first, the LLM judge is only asked when they are not conclusive.
     Args:
         task_completion_condition (str): The condition to determine if the task is complete.
         service_id (str): The ID of the service.
         maximum_iterations (int): The maximum number of iterations for the termination strategy.
+        expected_function_calls (Sequence[Mapping[str, Any]]|None): The function calls that, once all made, complete the task
+            without asking the LLM judge.
+        judge_window (int): The number of most recent user and assistant text messages the LLM judge sees.
+        kernel (Kernel|None): The kernel instance of the LLM judge. If None, a new kernel will be created.
     Returns:
-        KernelFunctionTerminationStrategy: The created termination strategy.
+        LayeredTerminationStrategy: The created termination strategy.
     """
-    kernel = create_kernel_with_chat_completion(service_id=service_id)
+    if kernel is None:
+        kernel = create_kernel_with_chat_completion(service_id=service_id)
 
     termination_function = KernelFunctionFromPrompt(
         function_name="termination",
@@ -75,7 +88,7 @@ def create_termination_strategy(
         """,
     )
 
-    termination_strategy = KernelFunctionTerminationStrategy(
+    judge = KernelFunctionTerminationStrategy(
         function=termination_function,
         kernel=kernel,
         result_parser=lambda result: str(result.value[0]).lower() == "yes", # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType, reportUnknownLambdaType] As required by the Semantic Kernel SDK
@@ -83,4 +96,11 @@ def create_termination_strategy(
         maximum_iterations=maximum_iterations,
     )
 
+    termination_strategy = LayeredTerminationStrategy(
+        judge=judge,
+        expected_function_names={call["functionName"] for call in expected_function_calls or []},
+        judge_window=judge_window,
+        maximum_iterations=maximum_iterations,
+    )
+
     return termination_strategy
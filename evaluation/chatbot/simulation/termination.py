@@ -0,0 +1,98 @@
+import logging
+import re
+from collections.abc import Sequence
+
+from pydantic import Field
+from semantic_kernel.agents import Agent
+from semantic_kernel.agents.strategies import TerminationStrategy
+from semantic_kernel.contents import ChatMessageContent, FunctionCallContent
+from semantic_kernel.contents.utils.author_role import AuthorRole
+
+# The phrase simulated users are instructed to end the conversation with (see SYSTEM_PROMPT_TEMPLATE)
+DEFAULT_COMPLETION_PHRASE = "the session is finished"
+
+# Number of most recent user and assistant text messages sent to the LLM judge
+DEFAULT_JUDGE_WINDOW = 6
+
+
+class LayeredTerminationStrategy(TerminationStrategy):
+    """
+    Decides whether a simulated conversation is complete, checking cheap signals before asking an LLM.
+
+    1. The last user message contains a completion phrase: the conversation is complete.
+    2. Expected function calls are known and all of them have been made: the conversation is complete.
+    3. Otherwise the outcome is ambiguous and the judge decides, seeing only the most recent user and
+       assistant text messages. Missing function calls never keep the conversation going on their own,
+       the simulated user is not steered towards the calls being evaluated.
+
+    The history must end with the last user message.
+    """
+
+    judge: TerminationStrategy | None = None
+    completion_phrases: list[str] = Field(default_factory=lambda: [DEFAULT_COMPLETION_PHRASE])
+    expected_function_names: set[str] = Field(default_factory=lambda: set[str]())
+    judge_window: int = Field(default=DEFAULT_JUDGE_WINDOW, gt=0)
+
+    async def should_agent_terminate(self, agent: Agent, history: list[ChatMessageContent]) -> bool:
+        """
+        Check if the conversation is complete.
+        Args:
+            agent (Agent): The support ticket agent.
+            history (list[ChatMessageContent]): The conversation, ending with the last user message.
+        Returns:
+            bool: True if the conversation is complete, False otherwise.
+        """
+        if self.is_completion_message(history[-1] if history else None):
+            logging.info("Conversation completed: the user ended the session")
+            return True
+
+        if self.expected_function_names and self.expected_function_names <= called_function_names(history):
+            logging.info("Conversation completed: all expected functions were called")
+            return True
+
+        if self.judge is None:
+            return False
+
+        logging.info(f"Asking the termination judge about the last {self.judge_window} text messages")
+        return await self.judge.should_agent_terminate(agent, self.judge_messages(history))
+
+    def judge_messages(self, history: Sequence[ChatMessageContent]) -> list[ChatMessageContent]:
+        """
+        Select the messages the judge sees: the most recent user and assistant text messages.
+        Function calls and results are left out, so that they do not crowd the conversation out of the window.
+        Args:
+            history (Sequence[ChatMessageContent]): The conversation.
+        Returns:
+            list[ChatMessageContent]: At most judge_window messages, in conversation order.
+        """
+        text_messages = [
+            message
+            for message in history
+            if message.role in (AuthorRole.USER, AuthorRole.ASSISTANT) and message.content
+        ]
+        return text_messages[-self.judge_window :]
+
+    def is_completion_message(self, message: ChatMessageContent | None) -> bool:
+        """Check whether a user message contains one of the completion phrases"""
+        if message is None or message.role != AuthorRole.USER or not message.content:
+            return False
+
+        # Ignore case, punctuation and line breaks, e.g. "The session is\nfinished."
+        content = " ".join(re.sub(r"[^\w\s]", " ", message.content.lower()).split())
+        return any(phrase.lower() in content for phrase in self.completion_phrases)
+
+
+def called_function_names(history: Sequence[ChatMessageContent]) -> set[str]:
+    """
+    Collect the fully qualified names of the functions called in a conversation.
+    Args:
+        history (Sequence[ChatMessageContent]): The conversation.
+    Returns:
+        set[str]: The called functions, e.g. TicketManagementPlugin-create_support_ticket.
+    """
+    return {
+        item.name
+        for message in history
+        for item in message.items
+        if isinstance(item, FunctionCallContent) and item.name
+    }
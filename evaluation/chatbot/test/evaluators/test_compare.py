@@ -0,0 +1,70 @@
+from difflib import SequenceMatcher
+
+import pytest
+
+from evaluation.chatbot.evaluators.compare import is_similar, normalize_text, similar_pairs
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Hello World", "hello world"),
+        ("  Hello,\n\tWorld!  ", "hello world"),
+        ("IT-Department_01", "itdepartment01"),
+        ("Héllo", "hllo"),
+        ("", ""),
+    ],
+)
+def test_normalize_text(text: str, expected: str):
+    """Test that texts are lowercased and stripped of special characters and extra whitespace."""
+    assert normalize_text(text) == expected
+
+
+def test_normalize_text_is_cached():
+    """Test that normalizing the same text again is served from the cache."""
+    normalize_text.cache_clear()
+    normalize_text("Compliance audit")
+    normalize_text("Compliance audit")
+
+    assert normalize_text.cache_info().hits == 1
+
+
+@pytest.mark.parametrize(
+    "t1, t2, expected",
+    [
+        ("High", "high", True),
+        ("Upcoming compliance audit!", "upcoming compliance audit", True),
+        ("Upcoming compliance audit", "Upcoming compliance audits", True),
+        ("Upcoming compliance audit", "Upcoming security audit", False),
+        ("High", "Low", False),
+        ("", "", True),
+        ("", "High", False),
+    ],
+)
+def test_is_similar(t1: str, t2: str, expected: bool):
+    """Test the similarity check, including the exact match and the quick ratio prefilters."""
+    assert is_similar(t1, t2) == expected
+
+
+@pytest.mark.parametrize("threshold", [0.5, 0.8, 0.95])
+def test_is_similar_agrees_with_the_full_ratio(threshold: float):
+    """Test that the prefilters never change the outcome of the full ratio."""
+    texts = ["compliance audit", "complaince audit", "compliance", "audit compliance", "security review", "a"]
+    for t1 in texts:
+        for t2 in texts:
+            expected = SequenceMatcher(None, t1, t2).ratio() >= threshold
+            assert is_similar(t1, t2, threshold) == expected, (t1, t2)
+
+
+def test_similar_pairs():
+    """Test that batch scoring returns one result per pair in order, matching is_similar."""
+    pairs = [
+        ("High", "high"),
+        ("Upcoming compliance audits", "Upcoming compliance audit"),
+        ("Upcoming security audit", "Upcoming compliance audit"),
+        ("IT", "__invalid__"),
+    ]
+
+    assert similar_pairs(pairs) == [True, True, False, False]
+    assert similar_pairs(pairs) == [is_similar(t1, t2) for t1, t2 in pairs]
+    assert similar_pairs([]) == []
@@ -0,0 +1,88 @@
+from dataclasses import asdict
+
+import pytest
+
+from evaluation.chatbot.evaluators import function_call_metrics
+from evaluation.chatbot.evaluators.function_call_metrics import (
+    FunctionCallMetricsEvaluator,
+)
+from evaluation.chatbot.evaluators.function_call_precision import (
+    FunctionCallArgsPrecisionEvaluator,
+    FunctionCallPrecisionEvaluator,
+)
+from evaluation.chatbot.evaluators.function_call_recall import (
+    FunctionCallArgsRecallEvaluator,
+    FunctionCallRecallEvaluator,
+)
+from evaluation.chatbot.evaluators.function_call_reliability import (
+    FunctionCallReliabilityEvaluator,
+)
+from evaluation.chatbot.evaluators.matching import match_function_calls
+from evaluation.chatbot.test.evaluators.test_data import (
+    FC_COMMON_START_OVER,
+    FC_REFERENCE_DATA_GET_DEPARTMENTS,
+    FC_TICKET_CREATE,
+    FC_TICKET_CREATE_2,
+    FC_TICKET_CREATE_2_DIFF_ARGS,
+    FC_TICKET_CREATE_DIFF_ARGS,
+    FC_TICKET_CREATE_DIFF_NAME,
+    FC_TICKET_CREATE_MISSING_ARG,
+    FC_TICKET_CREATE_NO_ARGS,
+    convert_to_dict,
+)
+from evaluation.chatbot.models import FunctionCall
+
+CASES = [
+    ([FC_TICKET_CREATE], [FC_TICKET_CREATE]),
+    ([FC_TICKET_CREATE], [FC_TICKET_CREATE_DIFF_ARGS]),
+    ([FC_TICKET_CREATE, FC_TICKET_CREATE_2], [FC_TICKET_CREATE_DIFF_NAME, FC_TICKET_CREATE_2_DIFF_ARGS]),
+    ([FC_TICKET_CREATE_MISSING_ARG], [FC_TICKET_CREATE]),
+    ([FC_TICKET_CREATE_NO_ARGS], [FC_TICKET_CREATE]),
+    ([FC_TICKET_CREATE, FC_COMMON_START_OVER], [FC_TICKET_CREATE, FC_REFERENCE_DATA_GET_DEPARTMENTS]),
+    ([], [FC_TICKET_CREATE]),
+    ([FC_TICKET_CREATE], []),
+]
+
+
+@pytest.mark.parametrize("actual, expected", CASES)
+def test_metrics_match_the_single_metric_evaluators(
+    actual: list[FunctionCall], expected: list[FunctionCall]
+):
+    result = FunctionCallMetricsEvaluator()(
+        actual_function_calls=convert_to_dict(actual),
+        expected_function_calls=convert_to_dict(expected),
+    )
+
+    assert result.Precision_fn == FunctionCallPrecisionEvaluator().evaluate(actual, expected)
+    assert result.Recall_fn == FunctionCallRecallEvaluator().evaluate(actual, expected)
+    assert result.Precision_args == FunctionCallArgsPrecisionEvaluator().evaluate(actual, expected)
+    assert result.Recall_args == FunctionCallArgsRecallEvaluator().evaluate(actual, expected)
+    assert result.Reliability == FunctionCallReliabilityEvaluator().evaluate(actual, expected)
+    assert "score" not in asdict(result)
+
+
+def test_function_calls_are_matched_once(monkeypatch: pytest.MonkeyPatch):
+    matches: list[object] = []
+
+    def counting_match(*args: object, **kwargs: object):
+        result = match_function_calls(*args, **kwargs)  # pyright: ignore[reportArgumentType] Forwarding the arguments as is
+        matches.append(result)
+        return result
+
+    monkeypatch.setattr(function_call_metrics, "match_function_calls", counting_match)
+
+    result = FunctionCallMetricsEvaluator().compute([FC_TICKET_CREATE], [FC_TICKET_CREATE_DIFF_ARGS])
+
+    assert len(matches) == 1
+    assert (result.Precision_fn, result.Recall_fn, result.Reliability) == (1.0, 1.0, 0.5)
+
+
+def test_repeated_calls_are_scored_one_to_one():
+    result = FunctionCallMetricsEvaluator().compute(
+        [FC_TICKET_CREATE, FC_TICKET_CREATE_DIFF_ARGS],
+        [FC_TICKET_CREATE_DIFF_ARGS, FC_TICKET_CREATE, FC_TICKET_CREATE],
+    )
+
+    # Both actual calls find their exact counterpart, the third expected call is missed
+    assert (result.Precision_fn, result.Recall_fn) == (1.0, 0.67)
+    assert (result.Precision_args, result.Recall_args) == (1.0, 1.0)
@@ -8,6 +8,7 @@ from evaluation.chatbot.test.evaluators.test_data import (
     FC_TICKET_CREATE_MISSING_ARG,
     FC_TICKET_CREATE_DIFF_NAME,
     FC_REFERENCE_DATA_GET_DEPARTMENTS,
+    FC_COMMON_START_OVER,
 )
 
 
@@ -22,15 +23,11 @@ def test_exact_match_single_call():
     assert len(result.unmatched_expected_calls) == 0
     assert len(result.unmatched_actual_calls) == 0
 
-    function_name = FC_TICKET_CREATE.functionName.lower()
-    assert function_name in result.matched_calls
-    assert (
-        result.matched_calls[function_name].actual_args == FC_TICKET_CREATE.arguments
-    )
-    assert (
-        result.matched_calls[function_name].expected_args
-        == FC_TICKET_CREATE.arguments
-    )
+    matched_call = result.matched_calls[0]
+    assert matched_call.function_name == FC_TICKET_CREATE.functionName.lower()
+    assert matched_call.actual_args == FC_TICKET_CREATE.arguments
+    assert matched_call.expected_args == FC_TICKET_CREATE.arguments
+    assert matched_call.correct_args == len(FC_TICKET_CREATE.arguments)
 
 
 def test_match_multiple_calls():
@@ -47,8 +44,10 @@ def test_match_multiple_calls():
     ticket_function_name = FC_TICKET_CREATE.functionName.lower()
     ref_data_function_name = FC_REFERENCE_DATA_GET_DEPARTMENTS.functionName.lower()
 
-    assert ticket_function_name in result.matched_calls
-    assert ref_data_function_name in result.matched_calls
+    assert [m.function_name for m in result.matched_calls] == [
+        ticket_function_name,
+        ref_data_function_name,
+    ]
 
 
 def test_unmatched_actual_calls():
@@ -92,16 +91,12 @@ def test_different_arguments():
 
     result = match_function_calls(actual_calls, expected_calls)
 
-    function_name = FC_TICKET_CREATE.functionName.lower()
-    assert function_name in result.matched_calls
-    assert (
-        result.matched_calls[function_name].actual_args
-        == FC_TICKET_CREATE_DIFF_ARGS.arguments
-    )
-    assert (
-        result.matched_calls[function_name].expected_args
-        == FC_TICKET_CREATE.arguments
-    )
+    assert len(result.matched_calls) == 1
+    matched_call = result.matched_calls[0]
+    assert matched_call.function_name == FC_TICKET_CREATE.functionName.lower()
+    assert matched_call.actual_args == FC_TICKET_CREATE_DIFF_ARGS.arguments
+    assert matched_call.expected_args == FC_TICKET_CREATE.arguments
+    assert matched_call.correct_args == 0
 
 
 def test_no_matches():
@@ -153,10 +148,10 @@ def test_matching_with_missing_arguments():
 
     result = match_function_calls(actual_calls, expected_calls)
 
-    function_name = FC_TICKET_CREATE.functionName.lower()
-    assert function_name in result.matched_calls
-    assert "workflow_type" not in result.matched_calls[function_name].actual_args
-    assert "workflow_type" in result.matched_calls[function_name].expected_args
+    assert len(result.matched_calls) == 1
+    assert "workflow_type" not in result.matched_calls[0].actual_args
+    assert "workflow_type" in result.matched_calls[0].expected_args
+    assert result.matched_calls[0].correct_args == 4
 
 
 def test_different_function_name_similar_args():
@@ -175,3 +170,75 @@ def test_different_function_name_similar_args():
         FC_TICKET_CREATE_DIFF_NAME.functionName.lower()
         in result.unmatched_actual_calls
     )
+
+
+def _ticket_call(title: str, priority: str = "High") -> FunctionCall:
+    return FunctionCall(
+        functionName=FC_TICKET_CREATE.functionName,
+        arguments={**FC_TICKET_CREATE.arguments, "title": title, "priority": priority},
+    )
+
+
+def test_repeated_calls_are_paired_by_argument_similarity():
+    """Test that repeated calls of a function are matched one-to-one with the most similar expected call."""
+    actual_calls = [
+        _ticket_call("Printer offline", "Low"),
+        _ticket_call("VPN drops", "High"),
+        _ticket_call("Laptop broken", "Medium"),
+    ]
+    expected_calls = [
+        _ticket_call("VPN drops", "High"),
+        _ticket_call("Printer offline", "High"),
+    ]
+
+    result = match_function_calls(actual_calls, expected_calls)
+
+    assert [(m.actual_index, m.expected_index) for m in result.matched_calls] == [(1, 0), (0, 1)]
+    assert [m.correct_args for m in result.matched_calls] == [5, 4]
+    assert result.unmatched_actual_calls == [FC_TICKET_CREATE.functionName.lower()]
+    assert result.unmatched_expected_calls == []
+
+
+def test_repeated_identical_calls_are_counted():
+    """Test that each repeated call is matched at most once."""
+    actual_calls = [FC_TICKET_CREATE, FC_TICKET_CREATE, FC_TICKET_CREATE]
+    expected_calls = [FC_TICKET_CREATE, FC_TICKET_CREATE]
+
+    result = match_function_calls(actual_calls, expected_calls)
+
+    assert [(m.actual_index, m.expected_index) for m in result.matched_calls] == [(0, 0), (1, 1)]
+    assert len(result.unmatched_actual_calls) == 1
+
+    result = match_function_calls(expected_calls, actual_calls)
+
+    assert len(result.matched_calls) == 2
+    assert len(result.unmatched_expected_calls) == 1
+
+
+def test_ignored_calls():
+    """Test that ignored calls are never unmatched actual calls but still match expected calls."""
+    actual_calls = [FC_COMMON_START_OVER, FC_TICKET_CREATE, FC_COMMON_START_OVER]
+    expected_calls = [FC_TICKET_CREATE, FC_COMMON_START_OVER]
+
+    result = match_function_calls(actual_calls, expected_calls)
+
+    assert [(m.actual_index, m.expected_index) for m in result.matched_calls] == [(1, 0), (0, 1)]
+    assert result.unmatched_actual_calls == []
+
+
+def test_long_conversations():
+    """Test the alignment of conversations with hundreds of calls of the same functions."""
+    actual_calls = [_ticket_call(f"Ticket number {i}") for i in range(300)]
+    actual_calls += [FC_REFERENCE_DATA_GET_DEPARTMENTS] * 100
+    expected_calls = [_ticket_call(f"Ticket number {i}") for i in reversed(range(0, 300, 2))]
+    expected_calls += [_ticket_call(f"Other ticket {i}", "Low") for i in range(50)]
+
+    result = match_function_calls(actual_calls, expected_calls)
+
+    assert len(result.matched_calls) == 200
+    assert all(
+        actual_calls[m.actual_index].arguments == expected_calls[m.expected_index].arguments
+        for m in result.matched_calls[:150]
+    )
+    assert len(result.unmatched_actual_calls) == 200
+    assert result.unmatched_expected_calls == []
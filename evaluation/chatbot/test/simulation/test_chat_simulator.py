@@ -0,0 +1,91 @@
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from app.chatbot.data_models.sample_data.sample_tickets import TICKETS_BY_ID
+from app.chatbot.storage.backends import Storage, create_session_storage
+from evaluation.chatbot.simulation.chat_simulator import SupportTicketChatSimulator
+
+CREATE_TICKET = "TicketManagementPlugin-create_support_ticket"
+
+SCRIPT = {
+    "SupportTicketAgent": [
+        {
+            "function_calls": [
+                {
+                    "name": CREATE_TICKET,
+                    "arguments": {
+                        "title": "Compliance audit",
+                        "department_code": "IT",
+                        "priority": "High",
+                        "workflow_type": "Standard",
+                        "description": "Upcoming compliance audit",
+                        "expected_outcome": "Audit passed",
+                    },
+                }
+            ]
+        },
+        {"content": "Your ticket has been created."},
+    ],
+    "UserAgent": [{"content": "Thanks, the session is finished."}],
+    "termination_service": [{"content": "no"}],
+}
+
+
+@pytest.fixture
+def storages(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> list[Storage]:
+    """Replay the script with the mock chat completion service and collect the storage of each conversation"""
+    script_path = tmp_path / "script.json"
+    script_path.write_text(json.dumps(SCRIPT))
+    monkeypatch.setenv("CHAT_COMPLETION_SERVICE", "mock")
+    monkeypatch.setenv("MOCK_CHAT_COMPLETION_SCRIPT", str(script_path))
+    return []
+
+
+def create_simulator(storages: list[Storage]) -> SupportTicketChatSimulator:
+    def storage_factory() -> Storage:
+        storage = create_session_storage()
+        storages.append(storage)
+        return storage
+
+    return SupportTicketChatSimulator(storage_factory=storage_factory)
+
+
+def test_conversations_reuse_the_agent_and_isolate_plugin_state(storages: list[Storage]):
+    simulator = create_simulator(storages)
+    agent = simulator.support_ticket_agent
+    sample_ticket_ids = set(TICKETS_BY_ID)
+
+    async def run_twice():
+        first = await simulator.run(instructions="Create a ticket", task_completion_condition="done")
+        second = await simulator.run(instructions="Create a ticket", task_completion_condition="done")
+        return first, second
+
+    first, second = asyncio.run(run_twice())
+
+    assert simulator.support_ticket_agent is agent
+    assert [f.functionName for f in simulator.get_function_calls(first)] == [CREATE_TICKET]
+    assert [f.functionName for f in simulator.get_function_calls(second)] == [CREATE_TICKET]
+
+    # Each conversation created its ticket in its own storage, the shared sample data is unchanged
+    assert len(storages) == 2
+    assert [len(storage.tickets) for storage in storages] == [len(TICKETS_BY_ID) + 1] * 2
+    assert set(storages[0].tickets) != set(storages[1].tickets)
+    assert set(TICKETS_BY_ID) == sample_ticket_ids
+    assert sample_ticket_ids < set(storages[0].tickets)
+
+
+def test_concurrent_conversations_replay_the_whole_script(storages: list[Storage]):
+    simulator = create_simulator(storages)
+
+    async def run_concurrently():
+        return await asyncio.gather(
+            *(simulator.run(instructions="Create a ticket", task_completion_condition="done") for _ in range(3))
+        )
+
+    transcripts = asyncio.run(run_concurrently())
+
+    # Every conversation gets the scripted create call, whatever the order of the requests
+    assert [[f.functionName for f in simulator.get_function_calls(t)] for t in transcripts] == [[CREATE_TICKET]] * 3
@@ -0,0 +1,127 @@
+import asyncio
+
+import pytest
+from semantic_kernel.agents import Agent, ChatCompletionAgent
+from semantic_kernel.agents.strategies import TerminationStrategy
+from semantic_kernel.contents import ChatMessageContent, FunctionCallContent
+from semantic_kernel.contents.utils.author_role import AuthorRole
+
+from evaluation.chatbot.simulation.termination import LayeredTerminationStrategy, called_function_names
+
+CREATE_TICKET = "TicketManagementPlugin-create_support_ticket"
+CREATE_ACTION_ITEM = "ActionItemPlugin-create_action_item"
+
+
+class RecordingJudge(TerminationStrategy):
+    """A judge returning a fixed decision and recording the histories it is asked about"""
+
+    decision: bool = True
+    histories: list[list[ChatMessageContent]] = []
+
+    async def should_agent_terminate(self, agent: Agent, history: list[ChatMessageContent]) -> bool:
+        self.histories.append(history)
+        return self.decision
+
+
+def user(content: str) -> ChatMessageContent:
+    return ChatMessageContent(role=AuthorRole.USER, content=content)
+
+
+def assistant(content: str) -> ChatMessageContent:
+    return ChatMessageContent(role=AuthorRole.ASSISTANT, content=content)
+
+
+def function_call(name: str) -> ChatMessageContent:
+    return ChatMessageContent(role=AuthorRole.ASSISTANT, items=[FunctionCallContent(id=name, name=name, arguments="{}")])
+
+
+AGENT = ChatCompletionAgent(name="SupportTicketAgent", instructions="")
+
+
+def should_terminate(strategy: LayeredTerminationStrategy, history: list[ChatMessageContent]) -> bool:
+    return asyncio.run(strategy.should_agent_terminate(AGENT, history))
+
+
+@pytest.mark.parametrize(
+    "message, expected",
+    [
+        ("Thanks, the session is finished.", True),
+        ("The Session is\nfinished!", True),
+        ("Great, that's all. The session is finished", True),
+        ("Is the session finished?", False),
+        ("Please create the ticket", False),
+    ],
+)
+def test_completion_phrase_ends_the_conversation_without_the_judge(message: str, expected: bool):
+    judge = RecordingJudge(decision=False, histories=[])
+    strategy = LayeredTerminationStrategy(judge=judge, expected_function_names={CREATE_TICKET})
+
+    assert should_terminate(strategy, [assistant("Hello"), user(message)]) == expected
+    # The judge is only asked when the user did not end the session
+    assert (judge.histories == []) == expected
+
+
+def test_completion_phrase_of_the_assistant_is_ignored():
+    strategy = LayeredTerminationStrategy(judge=RecordingJudge(decision=False, histories=[]))
+
+    assert not should_terminate(strategy, [user("Hi"), assistant("The session is finished.")])
+
+
+def test_missing_expected_function_calls_leave_the_decision_to_the_judge():
+    judge = RecordingJudge(decision=True, histories=[])
+    strategy = LayeredTerminationStrategy(judge=judge, expected_function_names={CREATE_TICKET, CREATE_ACTION_ITEM})
+
+    history = [user("Create a ticket"), function_call(CREATE_TICKET), assistant("Created"), user("Thanks, bye")]
+
+    assert should_terminate(strategy, history)
+    assert len(judge.histories) == 1
+
+
+def test_expected_function_calls_end_the_conversation_without_the_judge():
+    judge = RecordingJudge(decision=False, histories=[])
+    strategy = LayeredTerminationStrategy(judge=judge, expected_function_names={CREATE_TICKET})
+
+    history = [user("Create a ticket"), function_call(CREATE_TICKET), assistant("Created"), user("Thanks")]
+
+    assert should_terminate(strategy, history)
+    assert judge.histories == []
+
+
+def test_judge_sees_a_window_of_text_messages():
+    judge = RecordingJudge(decision=True, histories=[])
+    strategy = LayeredTerminationStrategy(judge=judge, judge_window=2)
+
+    history = [
+        user("Create a ticket"),
+        assistant("Which department?"),
+        user("IT"),
+        function_call(CREATE_TICKET),
+        function_call(CREATE_ACTION_ITEM),
+        function_call(CREATE_ACTION_ITEM),
+        user("Thanks, bye"),
+    ]
+
+    assert should_terminate(strategy, history)
+    assert judge.histories == [[history[2], history[-1]]]
+
+
+def test_judge_decides_without_expected_function_calls():
+    judge = RecordingJudge(decision=False, histories=[])
+    strategy = LayeredTerminationStrategy(judge=judge)
+
+    assert not should_terminate(strategy, [assistant("Hello"), user("Hi")])
+    assert len(judge.histories) == 1
+
+
+def test_without_judge_only_cheap_signals_end_the_conversation():
+    strategy = LayeredTerminationStrategy(expected_function_names={CREATE_TICKET, CREATE_ACTION_ITEM})
+
+    assert not should_terminate(strategy, [function_call(CREATE_TICKET), user("Thanks")])
+    assert should_terminate(strategy, [function_call(CREATE_TICKET), user("The session is finished")])
+    assert should_terminate(strategy, [function_call(CREATE_TICKET), function_call(CREATE_ACTION_ITEM), user("Thanks")])
+
+
+def test_called_function_names():
+    history = [user("Hi"), function_call(CREATE_TICKET), function_call(CREATE_ACTION_ITEM), function_call(CREATE_TICKET)]
+
+    assert called_function_names(history) == {CREATE_TICKET, CREATE_ACTION_ITEM}
@@ -0,0 +1,114 @@
+import asyncio
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from evaluation.chatbot.batch_runner import EvaluationBatchRunner
+from evaluation.jsonl import iter_jsonl
+
+
+def make_rows(count: int) -> list[dict[str, Any]]:
+    return [
+        {"instructions": f"instructions {i}", "task_completion_condition": "done", "scenarioType": "Create"}
+        for i in range(count)
+    ]
+
+
+class FakeTarget:
+    """Simulates a row by sleeping, and records how many rows run at the same time"""
+
+    def __init__(self, delays: dict[str, float] | None = None, failing: set[str] | None = None):
+        self.delays = delays or {}
+        self.failing = failing or set()
+        self.running = 0
+        self.max_running = 0
+
+    async def __call__(
+        self,
+        instructions: str,
+        task_completion_condition: str,
+        expected_function_calls: list[dict[str, Any]] | None,
+    ) -> dict[str, Any]:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delays.get(instructions, 0.01))
+            if instructions in self.failing:
+                raise RuntimeError("simulation failed")
+            return {"chat_history": [{"content": instructions}], "function_calls": []}
+        finally:
+            self.running -= 1
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 3, 10])
+def test_run_limits_concurrency(max_concurrency: int):
+    target = FakeTarget()
+    runner = EvaluationBatchRunner(target, max_concurrency=max_concurrency)
+
+    outputs = asyncio.run(runner.run(make_rows(10)))
+
+    assert len(outputs) == 10
+    assert target.max_running == max_concurrency
+
+
+def test_run_keeps_row_order_and_columns():
+    # Earlier rows take longer, so they finish last
+    rows = make_rows(5)
+    target = FakeTarget(delays={row["instructions"]: 0.05 - i * 0.01 for i, row in enumerate(rows)})
+    runner = EvaluationBatchRunner(target, max_concurrency=5)
+
+    outputs = asyncio.run(runner.run(rows))
+
+    for row, output in zip(rows, outputs):
+        assert output["instructions"] == row["instructions"]
+        assert output["scenarioType"] == row["scenarioType"]
+        assert output["chat_history"] == [{"content": row["instructions"]}]
+        assert output["function_calls"] == []
+        assert "error_message" not in output
+
+
+def test_run_times_out_slow_rows():
+    rows = make_rows(3)
+    target = FakeTarget(delays={"instructions 1": 10})
+    runner = EvaluationBatchRunner(target, max_concurrency=3, row_timeout_seconds=0.1)
+
+    outputs = asyncio.run(runner.run(rows))
+
+    assert "timed out" in outputs[1]["error_message"]
+    assert outputs[1]["chat_history"] == []
+    assert outputs[1]["function_calls"] == []
+    assert "error_message" not in outputs[0]
+    assert "error_message" not in outputs[2]
+
+
+def test_run_records_failed_rows():
+    target = FakeTarget(failing={"instructions 0"})
+    runner = EvaluationBatchRunner(target)
+
+    outputs = asyncio.run(runner.run(make_rows(2)))
+
+    assert outputs[0]["error_message"] == "simulation failed"
+    assert outputs[0]["function_calls"] == []
+    assert "error_message" not in outputs[1]
+
+
+def test_invalid_max_concurrency():
+    with pytest.raises(ValueError):
+        EvaluationBatchRunner(FakeTarget(), max_concurrency=0)
+
+
+def test_run_to_file_writes_rows_in_dataset_order(tmp_path: Path):
+    rows = make_rows(4)
+    # The first row finishes last
+    target = FakeTarget(delays={rows[0]["instructions"]: 0.1}, failing={rows[2]["instructions"]})
+    runner = EvaluationBatchRunner(target, max_concurrency=2)
+    output_path = str(tmp_path / "output" / "simulated.jsonl")
+
+    # Rows are only taken from the iterator when a simulation slot is free
+    assert asyncio.run(runner.run_to_file(iter(rows), output_path)) == output_path
+
+    outputs = list(iter_jsonl(output_path))
+    assert [output["instructions"] for output in outputs] == [row["instructions"] for row in rows]
+    assert [output.get("error_message") for output in outputs].count("simulation failed") == 1
+    assert target.max_running == 2
@@ -0,0 +1,29 @@
+from typing import Any
+
+import pytest
+from semantic_kernel.contents import ChatHistory
+
+from evaluation.chatbot.eval_target import SupportTicketEvaluationTarget
+
+EXPECTED_FUNCTION_CALLS = [{"functionName": "TicketManagementPlugin-create_support_ticket", "arguments": {}}]
+
+
+def test_call_forwards_the_expected_function_calls(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("CHAT_COMPLETION_SERVICE", "mock")
+    target = SupportTicketEvaluationTarget()
+    calls: list[dict[str, Any]] = []
+
+    async def run(**kwargs: Any) -> ChatHistory:
+        calls.append(kwargs)
+        return ChatHistory()
+
+    monkeypatch.setattr(target.simulator, "run", run)
+
+    output = target(
+        instructions="Create a ticket",
+        task_completion_condition="the ticket is created",
+        expected_function_calls=EXPECTED_FUNCTION_CALLS,
+    )
+
+    assert output == {"chat_history": [], "function_calls": []}
+    assert calls[0]["expected_function_calls"] == EXPECTED_FUNCTION_CALLS
@@ -0,0 +1,239 @@
+import gzip
+import importlib.util
+import json
+import math
+import sys
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+from evaluation.chatbot.root_path import chatbot_eval_root_path
+
+GROUND_TRUTH_PATH = chatbot_eval_root_path() / "ground-truth"
+
+
+def load_generator() -> ModuleType:
+    # The ground-truth directory is not a package, load the script from its path
+    spec = importlib.util.spec_from_file_location("generate_eval_dataset", GROUND_TRUTH_PATH / "generate_eval_dataset.py")
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    # Registered so the worker processes can find its functions
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+generator = load_generator()
+
+TICKETS_CSV = """Support Ticket ID,Title,Department Code,Priority,Workflow Type,Description,Expected Outcome,Resolution,Customer Visible
+TKT-2,Printer offline,IT,High,Standard,Printer is offline,Printer works,,TRUE
+TKT-1,VPN drops,IT,Low,Expedited,VPN drops hourly,VPN is stable,Rebooted,false
+TKT-3,No actions,HR,Low,Standard,Nothing to do,Nothing,,
+TKT-2,Duplicate,IT,High,Standard,Duplicate row,Ignored,,False
+"""
+
+ACTIONS_CSV = """Action Item ID,Parent Ticket ID,Title,Assignee,Status,Due Date
+ACT-1,TKT-1,Check VPN logs,John Smith,Open,2025-05-10
+ACT-2,TKT-2,Replace toner,Jane Doe,Open,2025-05-11
+ACT-3,TKT-1,Update VPN client,John Smith,Completed,2025-05-12
+ACT-4,TKT-9,Orphan action,Jane Doe,Open,2025-05-13
+"""
+
+
+@pytest.fixture
+def business_data(tmp_path: Path) -> list[dict[str, object]]:
+    tickets_path = tmp_path / "tickets.csv"
+    actions_path = tmp_path / "actions.csv"
+    tickets_path.write_text(TICKETS_CSV)
+    actions_path.write_text(ACTIONS_CSV)
+    return generator.load_and_process_data(tickets_path, actions_path)
+
+
+def test_load_and_process_data_joins_actions_to_tickets(business_data: list[dict[str, object]]):
+    tickets = [data["ticket"] for data in business_data]
+    actions = [[action["id"] for action in data["actions"]] for data in business_data]
+
+    # Tickets keep the order of the file, duplicated ticket ids keep their first row
+    assert [ticket["id"] for ticket in tickets] == ["TKT-2", "TKT-1", "TKT-3"]
+    assert tickets[0]["title"] == "Printer offline"
+    assert actions == [["ACT-2"], ["ACT-1", "ACT-3"], []]
+    assert [ticket["customer_visible"] for ticket in tickets] == [True, False, False]
+    assert math.isnan(tickets[0]["resolution"])
+    assert business_data[1]["actions"][1] == {
+        "id": "ACT-3",
+        "parent_ticket_id": "TKT-1",
+        "title": "Update VPN client",
+        "assignee": "John Smith",
+        "status": "Completed",
+        "due_date": "2025-05-12",
+    }
+
+
+@pytest.mark.parametrize(
+    ("values", "expected"),
+    [
+        # Text columns, read with the str dtype by pandas 3
+        (["yes", "false", "True"], [False, False, True]),
+        (["TRUE", "false", ""], [True, False, False]),
+        (["1", "0", ""], [True, False, False]),
+    ],
+)
+def test_load_and_process_data_converts_customer_visible(
+    tmp_path: Path, values: list[str], expected: list[bool]
+):
+    rows = [f"TKT-{index},Title,IT,Low,Standard,Description,Outcome,,{value}" for index, value in enumerate(values)]
+    tickets_path = tmp_path / "tickets.csv"
+    actions_path = tmp_path / "actions.csv"
+    tickets_path.write_text("\n".join([TICKETS_CSV.splitlines()[0], *rows]) + "\n")
+    actions_path.write_text(ACTIONS_CSV)
+
+    business_data = generator.load_and_process_data(tickets_path, actions_path)
+
+    assert [data["ticket"]["customer_visible"] for data in business_data] == expected
+
+
+def test_load_and_process_data_of_the_dummy_data():
+    business_data = generator.load_and_process_data(
+        GROUND_TRUTH_PATH / "dummy_support_tickets.csv", GROUND_TRUTH_PATH / "dummy_action_items.csv"
+    )
+
+    assert len(business_data) == 49
+    assert sum(len(data["actions"]) for data in business_data) == 171
+    assert all(
+        action["parent_ticket_id"] == data["ticket"]["id"] for data in business_data for action in data["actions"]
+    )
+
+
+def test_compiled_template_records_the_referenced_fields():
+    template = generator.CompiledTemplate(
+        {"title": "{ticket.title}", "items": ["{action.title} by {action.assignee}", "{ticket.title}"], "limit": 5}
+    )
+
+    assert template.fields == {("ticket", "title"), ("action", "title"), ("action", "assignee")}
+
+
+@pytest.mark.parametrize(
+    "template, expected",
+    [
+        ("{ticket.title}", "Printer offline"),
+        ("Fix {ticket.title} ({ticket.priority}) - {action.title}", "Fix Printer offline (High) - Replace toner"),
+        ("No placeholder", "No placeholder"),
+        # Placeholders of missing or empty fields, and unknown placeholders are kept
+        ("{ticket.resolution}", "{ticket.resolution}"),
+        ("{ticket.unknown} {other.title}", "{ticket.unknown} {other.title}"),
+        ("{ticket.customer_visible}", "True"),
+        ({"args": ["{action.assignee}", 3, None, True]}, {"args": ["Jane Doe", 3, None, True]}),
+    ],
+)
+def test_compiled_template_render(business_data: list[dict[str, object]], template: object, expected: object):
+    data = {"ticket": business_data[0]["ticket"], "action": business_data[0]["actions"][0]}
+
+    assert generator.CompiledTemplate(template).render(data) == expected
+    assert generator.fill_placeholders(template, data) == expected
+
+
+def test_compiled_template_renders_new_values(business_data: list[dict[str, object]]):
+    template = generator.CompiledTemplate({"arguments": {"title": "{ticket.title}"}})
+
+    first = template.render({"ticket": business_data[0]["ticket"]})
+    second = template.render({"ticket": business_data[1]["ticket"]})
+
+    assert (first, second) == ({"arguments": {"title": "Printer offline"}}, {"arguments": {"title": "VPN drops"}})
+    assert first["arguments"] is not second["arguments"]
+
+
+def load_dummy_data() -> tuple[list[dict[str, object]], list[dict[str, object]]]:
+    templates = generator.load_templates(GROUND_TRUTH_PATH / "test_scenarios_templates.json")
+    business_data = generator.load_and_process_data(
+        GROUND_TRUTH_PATH / "dummy_support_tickets.csv", GROUND_TRUTH_PATH / "dummy_action_items.csv"
+    )
+    return templates, business_data
+
+
+def generate_cases(cases_per_scenario: int = 3, **options: object) -> list[dict[str, object]]:
+    templates, business_data = load_dummy_data()
+    return list(generator.iter_dataset(templates, business_data, cases_per_scenario, **options))
+
+
+def write_cases(cases: list[dict[str, object]], output: Path, **options: object) -> list[Path]:
+    with generator.DatasetWriter(output, **options) as writer:
+        for case in cases:
+            writer.write(case)
+    assert writer.row_count == len(cases)
+    return writer.paths
+
+
+def read_jsonl(path: Path) -> list[dict[str, object]]:
+    with gzip.open(path, "rt", encoding="utf-8") if path.suffix == ".gz" else open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_dataset_writer_writes_jsonl_and_pretty_json(tmp_path: Path):
+    cases = generate_cases()
+    output = tmp_path / "dataset.json"
+
+    paths = write_cases(cases, output, pretty_json=True)
+
+    assert paths == [output, tmp_path / "dataset.jsonl"]
+    assert read_jsonl(paths[1]) == cases
+    # The streamed JSON is the same as dumping the whole dataset at once
+    assert output.read_text(encoding="utf-8") == json.dumps(cases, indent=4, ensure_ascii=False)
+
+
+def test_dataset_writer_only_writes_pretty_json_on_request(tmp_path: Path):
+    output = tmp_path / "dataset.json"
+
+    assert write_cases(generate_cases(), output) == [tmp_path / "dataset.jsonl"]
+    assert not output.exists()
+
+
+def test_dataset_writer_shards_by_scenario(tmp_path: Path):
+    cases = generate_cases()
+
+    paths = write_cases(cases, tmp_path / "dataset.json", shard_by="scenario", compress=True)
+
+    scenarios = list(dict.fromkeys(case["scenarioType"] for case in cases))
+    assert [path.name for path in paths] == [f"dataset.{scenario}.jsonl.gz" for scenario in scenarios]
+    for scenario, path in zip(scenarios, paths):
+        assert read_jsonl(path) == [case for case in cases if case["scenarioType"] == scenario]
+
+
+def test_dataset_writer_shards_by_rows(tmp_path: Path):
+    cases = generate_cases(cases_per_scenario=5)
+
+    paths = write_cases(cases, tmp_path / "dataset.json", shard_by="rows", shard_size=4)
+
+    assert len(paths) == math.ceil(len(cases) / 4)
+    assert [len(read_jsonl(path)) for path in paths[:-1]] == [4] * (len(paths) - 1)
+    assert [case for path in paths for case in read_jsonl(path)] == cases
+
+
+def test_dataset_writer_of_an_empty_dataset(tmp_path: Path):
+    output = tmp_path / "dataset.json"
+
+    assert write_cases([], output, pretty_json=True) == [output]
+    assert json.loads(output.read_text()) == []
+
+
+def test_parallel_generation_matches_sequential_generation():
+    sequential = generate_cases(cases_per_scenario=60)
+    parallel = generate_cases(cases_per_scenario=60, workers=3, batch_size=7)
+
+    assert json.dumps(parallel) == json.dumps(sequential)
+    assert len(sequential) == 60 * len(load_dummy_data()[0])
+
+
+def test_seed_drives_the_generated_cases():
+    assert generate_cases(seed=1) == generate_cases(seed=1)
+    assert generate_cases(seed=1) != generate_cases(seed=2)
+
+
+def test_templates_draw_from_their_own_random_generator():
+    templates, business_data = load_dummy_data()
+
+    dataset = generator.generate_dataset(templates, business_data, 5)
+    without_first_template = generator.generate_dataset(templates[1:], business_data, 5)
+
+    # The cases of a template do not depend on the templates generated before it
+    assert without_first_template == dataset[5:]
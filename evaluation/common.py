@@ -7,10 +7,13 @@ from typing import Any
 import nbformat
 from nbconvert.preprocessors import ExecutePreprocessor
 
+from evaluation.jsonl import ensure_jsonl, write_results_json
+
 
 def convert_json_to_jsonl(filePath: str) -> str:
     """
-    Convert the JSON file to JSONL format
+    Convert the JSON file to JSONL format, unless the JSONL file is already up to date.
+    The JSON file is read incrementally, so its rows are never all in memory.
 
     Args:
         filePath (str): path to the JSON file
@@ -18,22 +21,13 @@ def convert_json_to_jsonl(filePath: str) -> str:
         str: path to the JSONL file
     """
 
-    print(f"Converting JSON to JSONL: {filePath}")
-
-    outputPath = filePath.replace(".json", ".jsonl")
-    with open(filePath, encoding="utf-8") as inputFile:
-        with open(outputPath, "w", encoding="utf-8") as outputFile:
-            json_data = json.load(inputFile)
-            for entry in json_data:
-                json.dump(entry, outputFile)
-                outputFile.write("\n")
-
-    return outputPath
+    return ensure_jsonl(filePath)
 
 
 def save_to_file(metrics: list[dict[str, Any]], detailed_results: list[dict[str, Any]], output_dir: str):
     """
-    Save the evaluation results to a file
+    Save the evaluation results to a file.
+    Result rows are written one at a time, one row per line, instead of serializing all of them at once.
     Args:
         metrics (list[dict[str, Any]]): evaluation metrics
         detailed_results (list[dict[str, Any]]): detailed evaluation results
@@ -41,9 +35,8 @@ def save_to_file(metrics: list[dict[str, Any]], detailed_results: list[dict[str,
     """
 
     os.makedirs(output_dir, exist_ok=True)
-    
-    with open(f"{output_dir}/evaluation_results.json", "w+") as f:
-        f.write(json.dumps(detailed_results, ensure_ascii=False, indent=2))
+
+    write_results_json(detailed_results, f"{output_dir}/evaluation_results.json")
 
     with open(f"{output_dir}/evaluation_metrics.json", "w+") as f:
         f.write(json.dumps(metrics, indent=2))
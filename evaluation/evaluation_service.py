@@ -21,9 +21,9 @@ class EvaluationService:
         self,
         ground_truth_data_path: str,
         output_path: str,
-        eval_target: Callable[..., Any],
         evaluators: dict[str, Evaluator],
         evaluators_config: dict[str, EvaluatorConfig],
+        eval_target: Callable[..., Any] | None = None,
         experiment_name: str | None = None,
     ) -> list[dict[str, Any]]:
         """
@@ -31,13 +31,14 @@ class EvaluationService:
         Args:
             data_path (str): path to the ground truth data
             output_path (str): path to save the evaluation results
-            eval_target (Callable): evaluation target
+            eval_target (Optional[Callable]): evaluation target, None if the data already contains the target outputs
             evaluators (Optional[Dict[str, Callable]]): dictionary of evaluators and their aliases
             evaluators_config (Optional[Dict[str, EvaluatorConfig]]): dictionary of evaluator configurations
             experiment_name (str): name of the experiment
         """
         # Convert the ground truth path to JSONL format as required by the evaluation SDK
-        ground_truth_data_path = utils.convert_json_to_jsonl(ground_truth_data_path)
+        if ground_truth_data_path.endswith(".json"):
+            ground_truth_data_path = utils.convert_json_to_jsonl(ground_truth_data_path)
 
         try:
             # call evaluate from evaluation SDK
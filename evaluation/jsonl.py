@@ -0,0 +1,185 @@
+import json
+import logging
+import os
+import re
+from collections.abc import Iterator
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Self
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+# Whitespace and the commas between the values of a JSON array
+_SEPARATORS = re.compile(r"[\s,]*")
+
+
+def iter_jsonl(path: str) -> Iterator[dict[str, Any]]:
+    """
+    Lazily read the rows of a JSONL file, one line at a time.
+
+    Args:
+        path (str): path to the JSONL file
+    Returns:
+        Iterator[dict[str, Any]]: the rows of the file, blank lines are skipped
+    """
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def iter_json_array(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[dict[str, Any]]:
+    """
+    Lazily read the rows of a JSON file containing an array, without loading the whole file.
+
+    Args:
+        path (str): path to the JSON file
+        chunk_size (int): number of characters read from the file at a time
+    Returns:
+        Iterator[dict[str, Any]]: the elements of the array
+    """
+    decoder = json.JSONDecoder()
+    with open(path, encoding="utf-8") as f:
+        buffer = ""
+        pos = 0
+        eof = False
+        in_array = False
+        while True:
+            separators = _SEPARATORS.match(buffer, pos)
+            pos = separators.end() if separators else pos
+            if pos < len(buffer):
+                if not in_array:
+                    if buffer[pos] != "[":
+                        raise ValueError(f"{path} does not contain a JSON array")
+                    in_array = True
+                    pos += 1
+                    continue
+                if buffer[pos] == "]":
+                    return
+                try:
+                    row, end = decoder.raw_decode(buffer, pos)
+                    # A value ending with the buffer might continue in the next chunk
+                    if end < len(buffer) or eof:
+                        yield row
+                        pos = end
+                        continue
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+            elif eof:
+                raise ValueError(f"Unexpected end of the JSON array in {path}")
+
+            # Rows larger than a chunk double the read size, so they are decoded a few times only
+            chunk = f.read(max(chunk_size, len(buffer) - pos))
+            eof = not chunk
+            buffer = buffer[pos:] + chunk
+            pos = 0
+
+
+def iter_rows(path: str) -> Iterator[dict[str, Any]]:
+    """
+    Lazily read the rows of a JSONL file, or of a JSON file containing an array.
+
+    Args:
+        path (str): path to the JSON or JSONL file
+    Returns:
+        Iterator[dict[str, Any]]: the rows of the file
+    """
+    return iter_jsonl(path) if path.endswith(".jsonl") else iter_json_array(path)
+
+
+def ensure_jsonl(path: str) -> str:
+    """
+    Get a JSONL version of a JSON file, converting it only if the JSONL file next to it is
+    missing or older than the JSON file.
+
+    Args:
+        path (str): path to the JSON or JSONL file
+    Returns:
+        str: path to the JSONL file
+    """
+    if path.endswith(".jsonl"):
+        return path
+
+    jsonl_path = str(Path(path).with_suffix(".jsonl"))
+    if os.path.exists(jsonl_path) and os.path.getmtime(jsonl_path) >= os.path.getmtime(path):
+        logging.info(f"Using up to date JSONL file: {jsonl_path}")
+        return jsonl_path
+
+    logging.info(f"Converting JSON to JSONL: {path}")
+    # Write next to the target first, so an interrupted conversion never looks up to date
+    temporary_path = f"{jsonl_path}.tmp"
+    with JsonlWriter(temporary_path, flush=False) as writer:
+        for row in iter_json_array(path):
+            writer.write(row)
+    os.replace(temporary_path, jsonl_path)
+
+    return jsonl_path
+
+
+def write_results_json(results: list[dict[str, Any]], path: str) -> None:
+    """
+    Write a JSON array of results, each with a "rows" list, writing the rows one at a time and one
+    row per line instead of serializing all of them at once.
+
+    Args:
+        results (list[dict[str, Any]]): the results to write
+        path (str): path to the JSON file
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("[")
+        for result_index, result in enumerate(results):
+            f.write(",\n" if result_index else "\n")
+            summary = {key: value for key, value in result.items() if key != "rows"}
+            # Leave the rows list of the result open to append the rows
+            f.write(json.dumps({**summary, "rows": []}, ensure_ascii=False)[:-2])
+            for row_index, row in enumerate(result.get("rows", [])):
+                f.write(",\n" if row_index else "\n")
+                f.write(json.dumps(row, ensure_ascii=False))
+            f.write("\n]}")
+        f.write("\n]\n")
+
+
+class JsonlWriter:
+    """
+    Writes rows to a JSONL file as they are produced, so rows never have to be kept in memory
+    and the rows written so far survive a crash.
+    """
+
+    def __init__(self, path: str, flush: bool = True):
+        """
+        Args:
+            path (str): path to the JSONL file, replaced if it exists
+            flush (bool): whether every row is flushed to the file as soon as it is written
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.flush = flush
+        self.row_count = 0
+        self._file = open(path, "w", encoding="utf-8")
+
+    def write(self, row: dict[str, Any]) -> None:
+        """
+        Append a row to the file.
+
+        Args:
+            row (dict[str, Any]): the row to write
+        """
+        self._file.write(json.dumps(row) + "\n")
+        if self.flush:
+            self._file.flush()
+        self.row_count += 1
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -0,0 +1,101 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from evaluation.jsonl import (
+    JsonlWriter,
+    ensure_jsonl,
+    iter_json_array,
+    iter_jsonl,
+    iter_rows,
+    write_results_json,
+)
+
+ROWS = [
+    {"instructions": "Create a ticket", "expected_function_calls": [{"functionName": "f", "arguments": {"a": "[1, 2]"}}]},
+    {"instructions": "Unicode: é ü 漢字", "nested": {"list": [1, 2.5, None, True], "text": "a, b ] c"}},
+    {},
+]
+
+
+def write_json(path: Path, rows: list[dict[str, object]], indent: int | None = 4) -> str:
+    path.write_text(json.dumps(rows, indent=indent, ensure_ascii=False), encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 16])
+@pytest.mark.parametrize("indent", [None, 4])
+def test_iter_json_array(tmp_path: Path, chunk_size: int, indent: int | None):
+    path = write_json(tmp_path / "rows.json", ROWS, indent)
+
+    assert list(iter_json_array(path, chunk_size=chunk_size)) == ROWS
+
+
+def test_iter_json_array_is_lazy(tmp_path: Path):
+    path = write_json(tmp_path / "rows.json", ROWS)
+
+    rows = iter_json_array(path, chunk_size=16)
+
+    assert next(rows) == ROWS[0]
+
+
+@pytest.mark.parametrize("content", ["", "{}", "[{}, {}", "[{\"a\": }]"])
+def test_iter_json_array_rejects_invalid_files(tmp_path: Path, content: str):
+    path = tmp_path / "rows.json"
+    path.write_text(content)
+
+    with pytest.raises(ValueError):
+        list(iter_json_array(str(path)))
+
+
+def test_iter_json_array_of_an_empty_array(tmp_path: Path):
+    assert list(iter_json_array(write_json(tmp_path / "rows.json", []))) == []
+
+
+def test_jsonl_round_trip(tmp_path: Path):
+    path = str(tmp_path / "output" / "rows.jsonl")
+
+    with JsonlWriter(path) as writer:
+        for row in ROWS:
+            writer.write(row)
+        # Rows are readable as soon as they are written
+        assert list(iter_jsonl(path)) == ROWS
+
+    assert writer.row_count == len(ROWS)
+    assert list(iter_rows(path)) == ROWS
+
+
+def test_ensure_jsonl_only_converts_when_outdated(tmp_path: Path):
+    json_path = write_json(tmp_path / "dataset.json", ROWS)
+
+    jsonl_path = ensure_jsonl(json_path)
+
+    assert jsonl_path == str(tmp_path / "dataset.jsonl")
+    assert list(iter_jsonl(jsonl_path)) == ROWS
+    assert not os.path.exists(f"{jsonl_path}.tmp")
+
+    # An up to date JSONL file is reused as is
+    Path(jsonl_path).write_text("{}\n")
+    assert list(iter_jsonl(ensure_jsonl(json_path))) == [{}]
+
+    # A newer JSON file is converted again
+    json_mtime = os.path.getmtime(jsonl_path) + 10
+    os.utime(json_path, (json_mtime, json_mtime))
+    assert list(iter_jsonl(ensure_jsonl(json_path))) == ROWS
+
+    assert ensure_jsonl(jsonl_path) == jsonl_path
+
+
+def test_write_results_json(tmp_path: Path):
+    path = tmp_path / "evaluation_results.json"
+    results: list[dict[str, object]] = [
+        {"FunctionCalls.Reliability": 0.5, "rows": ROWS, "studio_url": "https://example.com"},
+        {"rows": []},
+    ]
+
+    write_results_json(results, str(path))
+
+    assert json.loads(path.read_text(encoding="utf-8")) == results
+    assert len(path.read_text(encoding="utf-8").splitlines()) == len(ROWS) + 6